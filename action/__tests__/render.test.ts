@@ -2,11 +2,12 @@ import { describe, it, expect } from "vitest";
 import {
   renderLineComment,
   renderSummaryComment,
+  renderTokenUsage,
   sortIssuesBySeverity,
   MARKER_SUMMARY,
   MARKER_ISSUE,
 } from "../src/render";
-import { ReviewIssue, ReviewOutput } from "../src/types";
+import { ReviewIssue, ReviewOutput, TokenUsage } from "../src/types";
 
 describe("renderLineComment", () => {
   it("includes marker", () => {
@@ -264,3 +265,43 @@ describe("sortIssuesBySeverity", () => {
     expect(issues[0].severity).toBe("LOW");
   });
 });
+
+describe("renderTokenUsage", () => {
+  const stage = {
+    input_tokens: 4000,
+    output_tokens: 200,
+    total_tokens: 4200,
+    cache_read_tokens: 3000,
+    cache_creation_tokens: 900,
+    cache_hit_ratio: 0.75,
+    llm_calls: 3,
+    latency_seconds: 12.34,
+    cost_usd: 0.0316,
+  };
+
+  it("renders a row per stage and a total", () => {
+    const usage: TokenUsage = {
+      ...stage,
+      stages: { review: stage, questions: { ...stage, llm_calls: 1 } },
+    };
+    const result = renderTokenUsage(usage);
+    expect(result).toContain("## Token Usage");
+    expect(result).toContain(
+      "| review | 3 | 4,000 | 3,000 | 900 | 200 | 75.0% | 12.3s | $0.03 |"
+    );
+    expect(result).toContain("| questions | 1 |");
+    expect(result).toContain("| **Total** |");
+  });
+
+  it("shows a dash for unpriced models", () => {
+    const result = renderTokenUsage({ ...stage, cost_usd: null });
+    expect(result).toContain("| 12.3s | - |");
+  });
+
+  it("renders only the total without stages", () => {
+    const result = renderTokenUsage(stage);
+    expect(
+      result.split("\n").filter((l) => l.startsWith("| ")).length
+    ).toBe(2);
+  });
+});
@@ -30413,6 +30413,12 @@ async function run() {
         });
         await (0, github_1.createReview)(octokit, ctx, comments);
         core.info(`Review completed: ${issues.length} issue(s) found`);
+        // Report token and provider cache usage in the job summary
+        if (reviewOutput.token_usage) {
+            await core.summary
+                .addRaw((0, render_1.renderTokenUsage)(reviewOutput.token_usage))
+                .write();
+        }
         // Check fail_on quality gate (after posting comments so review is visible)
         const failMessage = (0, review_1.checkFailOn)(issues, inputs.failOn);
         if (failMessage) {
@@ -30443,6 +30449,7 @@ exports.MARKER_ISSUE = exports.MARKER_SUMMARY = void 0;
 exports.sortIssuesBySeverity = sortIssuesBySeverity;
 exports.renderSummaryComment = renderSummaryComment;
 exports.renderLineComment = renderLineComment;
+exports.renderTokenUsage = renderTokenUsage;
 const MARKER_SUMMARY = "<!-- reviewcerberus-summary -->";
 exports.MARKER_SUMMARY = MARKER_SUMMARY;
 const MARKER_ISSUE = "<!-- reviewcerberus-issue -->";
@@ -30531,6 +30538,32 @@ function renderLineComment(issue) {
     lines.push(issue.suggested_fix);
     return lines.join("\n");
 }
+function formatPercent(ratio) {
+    return `${(ratio * 100).toFixed(1)}%`;
+}
+function tokenUsageRow(name, usage) {
+    const cost = usage.cost_usd === null ? "-" : `$${usage.cost_usd.toFixed(2)}`;
+    return (`| ${name} | ${usage.llm_calls} | ${usage.input_tokens.toLocaleString("en-US")} ` +
+        `| ${usage.cache_read_tokens.toLocaleString("en-US")} ` +
+        `| ${usage.cache_creation_tokens.toLocaleString("en-US")} ` +
+        `| ${usage.output_tokens.toLocaleString("en-US")} ` +
+        `| ${formatPercent(usage.cache_hit_ratio)} ` +
+        `| ${usage.latency_seconds.toFixed(1)}s | ${cost} |`);
+}
+function renderTokenUsage(usage) {
+    const lines = [
+        "## Token Usage",
+        "",
+        "| Stage | Calls | Input | Cache read | Cache write | Output | Cache hits | Latency | Est. cost |",
+        "|-------|-------|-------|------------|-------------|--------|------------|---------|-----------|",
+    ];
+    for (const [name, stage] of Object.entries(usage.stages ?? {})) {
+        lines.push(tokenUsageRow(name, stage));
+    }
+    lines.push(tokenUsageRow("**Total**", usage));
+    lines.push("");
+    return lines.join("\n");
+}
 
 
 /***/ }),
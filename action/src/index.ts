@@ -11,6 +11,7 @@ import {
 import {
   renderLineComment,
   renderSummaryComment,
+  renderTokenUsage,
   sortIssuesBySeverity,
 } from "./render";
 import {
@@ -106,6 +107,13 @@ async function run(): Promise<void> {
 
     core.info(`Review completed: ${issues.length} issue(s) found`);
 
+    // Report token and provider cache usage in the job summary
+    if (reviewOutput.token_usage) {
+      await core.summary
+        .addRaw(renderTokenUsage(reviewOutput.token_usage))
+        .write();
+    }
+
     // Check fail_on quality gate (after posting comments so review is visible)
     const failMessage = checkFailOn(issues, inputs.failOn);
     if (failMessage) {
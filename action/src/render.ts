@@ -1,4 +1,10 @@
-import { ReviewIssue, ReviewOutput, Severity } from "./types";
+import {
+  ReviewIssue,
+  ReviewOutput,
+  Severity,
+  StageTokenUsage,
+  TokenUsage,
+} from "./types";
 
 const MARKER_SUMMARY = "<!-- reviewcerberus-summary -->";
 const MARKER_ISSUE = "<!-- reviewcerberus-issue -->";
@@ -108,4 +114,37 @@ export function renderLineComment(issue: ReviewIssue): string {
   return lines.join("\n");
 }
 
+function formatPercent(ratio: number): string {
+  return `${(ratio * 100).toFixed(1)}%`;
+}
+
+function tokenUsageRow(name: string, usage: StageTokenUsage): string {
+  const cost = usage.cost_usd === null ? "-" : `$${usage.cost_usd.toFixed(2)}`;
+  return (
+    `| ${name} | ${usage.llm_calls} | ${usage.input_tokens.toLocaleString("en-US")} ` +
+    `| ${usage.cache_read_tokens.toLocaleString("en-US")} ` +
+    `| ${usage.cache_creation_tokens.toLocaleString("en-US")} ` +
+    `| ${usage.output_tokens.toLocaleString("en-US")} ` +
+    `| ${formatPercent(usage.cache_hit_ratio)} ` +
+    `| ${usage.latency_seconds.toFixed(1)}s | ${cost} |`
+  );
+}
+
+export function renderTokenUsage(usage: TokenUsage): string {
+  const lines: string[] = [
+    "## Token Usage",
+    "",
+    "| Stage | Calls | Input | Cache read | Cache write | Output | Cache hits | Latency | Est. cost |",
+    "|-------|-------|-------|------------|-------------|--------|------------|---------|-----------|",
+  ];
+
+  for (const [name, stage] of Object.entries(usage.stages ?? {})) {
+    lines.push(tokenUsageRow(name, stage));
+  }
+  lines.push(tokenUsageRow("**Total**", usage));
+  lines.push("");
+
+  return lines.join("\n");
+}
+
 export { MARKER_SUMMARY, MARKER_ISSUE };
@@ -26,9 +26,26 @@ export interface ReviewIssue {
   rationale?: string | null;
 }
 
+export interface StageTokenUsage {
+  input_tokens: number;
+  output_tokens: number;
+  total_tokens: number;
+  cache_read_tokens: number;
+  cache_creation_tokens: number;
+  cache_hit_ratio: number;
+  llm_calls: number;
+  latency_seconds: number;
+  cost_usd: number | null;
+}
+
+export interface TokenUsage extends StageTokenUsage {
+  stages?: Record<string, StageTokenUsage>;
+}
+
 export interface ReviewOutput {
   description: string;
   issues: ReviewIssue[];
+  token_usage?: TokenUsage | null;
 }
 
 export interface ReviewComment {
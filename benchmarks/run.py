@@ -0,0 +1,310 @@
+"""Offline end-to-end benchmark of the review pipeline.
+
+Each scenario builds a synthetic repo, then runs `run_review` and
+`run_verification` against a scripted model, in a fresh process so peak RSS
+is per scenario. Reported per run: wall time, subprocess count, peak RSS,
+and wall time, subprocesses and prompt tokens per stage. Results are
+appended to a JSON Lines file and compared with the previous run of the
+same scenario.
+
+Usage:
+    python -m benchmarks.run [--scenario small] [--results FILE] [--no-save]
+"""
+
+import argparse
+import io
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.agent.git_utils import get_changed_files
+from src.agent.runner import run_review
+from src.agent.tracing import disable_tracing, enable_tracing
+from src.agent.verification.runner import run_verification
+
+from .scripted_review import create_scripted_model
+from .synthetic_repo import synthetic_repo
+
+DEFAULT_RESULTS_FILE = ".benchmarks/results.jsonl"
+
+# Span categories recorded around subprocesses (see src/agent/tracing.py)
+SUBPROCESS_CATEGORIES = {"git", "subprocess"}
+
+# Traced stage spans and the token usage stage each one bills
+STAGES = {
+    "review": "review",
+    "verify questions": "questions",
+    "verify answers": "answers",
+    "verify score": "score",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A benchmark input size.
+
+    Attributes:
+        name: Scenario name used on the command line and in results
+        total_files: Files in the repository tree
+        changed_files: Files modified on the reviewed branch
+        issues: Issues the scripted review reports (and verification checks)
+    """
+
+    name: str
+    total_files: int
+    changed_files: int
+    issues: int
+
+
+SCENARIOS = {
+    s.name: s
+    for s in [
+        Scenario("small", total_files=1_000, changed_files=10, issues=3),
+        Scenario("medium", total_files=10_000, changed_files=100, issues=10),
+        Scenario("large", total_files=100_000, changed_files=1_000, issues=25),
+    ]
+}
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _stage_metrics(events: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Wall time and subprocess count of each traced stage.
+
+    A subprocess counts towards the innermost stage span enclosing it in
+    time. Tools run on worker threads, so threads are not matched; with
+    concurrent verification groups a subprocess may be attributed to the
+    wrong step.
+    """
+    spans = [e for e in events if e.get("cat") == "stage" and e["name"] in STAGES]
+    stages: dict[str, dict[str, Any]] = {}
+    for span in spans:
+        stage = stages.setdefault(
+            STAGES[span["name"]], {"wall_seconds": 0.0, "subprocesses": 0}
+        )
+        stage["wall_seconds"] += span["dur"] / 1_000_000
+
+    for event in events:
+        if event.get("cat") not in SUBPROCESS_CATEGORIES:
+            continue
+        enclosing = [
+            s
+            for s in spans
+            if s["ts"] <= event["ts"]
+            and event["ts"] + event["dur"] <= s["ts"] + s["dur"]
+        ]
+        if enclosing:
+            innermost = min(enclosing, key=lambda s: s["dur"])
+            stages[STAGES[innermost["name"]]]["subprocesses"] += 1
+
+    return stages
+
+
+def run_scenario(scenario: Scenario) -> dict[str, Any]:
+    """Benchmark one review plus verification run in this process.
+
+    Args:
+        scenario: Input size to benchmark
+
+    Returns:
+        Dictionary of metrics (see module docstring)
+    """
+    setup_start = time.perf_counter()
+    with synthetic_repo(scenario.total_files, scenario.changed_files) as repo:
+        setup_seconds = time.perf_counter() - setup_start
+        repo_path = str(repo)
+
+        recorder = enable_tracing()
+        try:
+            start = time.perf_counter()
+            changed_files = get_changed_files(repo_path, "main")
+            model = create_scripted_model(
+                [f.path for f in changed_files], scenario.issues
+            )
+            # Pipeline progress output is discarded
+            with redirect_stdout(io.StringIO()), patch(
+                "src.agent.agent.model", model
+            ), patch(
+                "src.agent.verification.agent.get_verification_model",
+                return_value=model,
+            ):
+                review = run_review(
+                    repo_path=repo_path,
+                    target_branch="main",
+                    changed_files=changed_files,
+                    show_progress=False,
+                )
+                verified, verify_usage = run_verification(
+                    primary_output=review.output,
+                    system_prompt=review.system_prompt,
+                    user_message=review.user_message,
+                    file_context=review.file_context,
+                    repo_path=repo_path,
+                    show_progress=False,
+                )
+            wall_seconds = time.perf_counter() - start
+        finally:
+            disable_tracing()
+
+    events = recorder.to_dict()["traceEvents"]
+    stages = _stage_metrics(events)
+
+    usage = review.token_usage
+    if verify_usage:
+        usage = usage + verify_usage if usage else verify_usage
+    for name, stage_usage in (usage.stages if usage else {}).items():
+        stage = stages.setdefault(name, {"wall_seconds": 0.0, "subprocesses": 0})
+        stage["prompt_tokens"] = stage_usage.input_tokens
+        stage["llm_calls"] = stage_usage.llm_calls
+
+    return {
+        "scenario": scenario.name,
+        "total_files": scenario.total_files,
+        "changed_files": len(changed_files),
+        "issues": len(verified.issues),
+        "setup_seconds": round(setup_seconds, 3),
+        "wall_seconds": round(wall_seconds, 3),
+        "subprocesses": sum(1 for e in events if e.get("cat") in SUBPROCESS_CATEGORIES),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "prompt_tokens": usage.input_tokens if usage else 0,
+        "llm_calls": usage.llm_calls if usage else 0,
+        "stages": {
+            name: {
+                key: round(value, 3) if isinstance(value, float) else value
+                for key, value in metrics.items()
+            }
+            for name, metrics in stages.items()
+        },
+    }
+
+
+def run_isolated(scenario: Scenario) -> dict[str, Any]:
+    """Run a scenario in a fresh interpreter so peak RSS is its own."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(run_scenario, scenario).result()
+
+
+def _git_commit() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def load_results(path: Path) -> list[dict[str, Any]]:
+    """Read stored results, oldest first."""
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def save_result(path: Path, result: dict[str, Any]) -> None:
+    """Append a result to the results file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        f.write(json.dumps(result) + "\n")
+
+
+def _delta(current: float, previous: float | None) -> str:
+    if not previous:
+        return ""
+    return f" ({(current - previous) / previous:+.0%})"
+
+
+def print_result(result: dict[str, Any], previous: dict[str, Any] | None) -> None:
+    """Print a result, with changes relative to `previous` when given."""
+    prev = previous or {}
+    print(
+        f"{result['scenario']}: {result['changed_files']:,} changed of "
+        f"{result['total_files']:,} files, {result['issues']} issues"
+        + (f" (vs {prev.get('commit') or 'previous run'})" if previous else "")
+    )
+    print(
+        f"  Wall time:     {result['wall_seconds']:>9.2f}s"
+        f"{_delta(result['wall_seconds'], prev.get('wall_seconds'))}"
+    )
+    print(
+        f"  Subprocesses:  {result['subprocesses']:>9,}"
+        f"{_delta(result['subprocesses'], prev.get('subprocesses'))}"
+    )
+    print(
+        f"  Peak RSS:      {result['peak_rss_mb']:>8.1f}M"
+        f"{_delta(result['peak_rss_mb'], prev.get('peak_rss_mb'))}"
+    )
+    print(
+        f"  Prompt tokens: {result['prompt_tokens']:>9,}"
+        f"{_delta(result['prompt_tokens'], prev.get('prompt_tokens'))}"
+    )
+    prev_stages = prev.get("stages", {})
+    for name, stage in result["stages"].items():
+        prev_stage = prev_stages.get(name, {})
+        print(
+            f"    {name:<10} {stage['wall_seconds']:>7.2f}s"
+            f"{_delta(stage['wall_seconds'], prev_stage.get('wall_seconds'))}  "
+            f"{stage['subprocesses']:>5} subprocesses  "
+            f"{stage.get('prompt_tokens', 0):>9,} prompt tokens"
+            f"{_delta(stage.get('prompt_tokens', 0), prev_stage.get('prompt_tokens'))}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Offline end-to-end benchmark of the review pipeline"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--results",
+        default=DEFAULT_RESULTS_FILE,
+        help=f"JSON Lines file results are appended to (default: "
+        f"{DEFAULT_RESULTS_FILE})",
+    )
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="Print results without storing them",
+    )
+    args = parser.parse_args()
+
+    results_path = Path(args.results)
+    history = load_results(results_path)
+    commit = _git_commit()
+
+    for name in args.scenario or list(SCENARIOS):
+        result = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **run_isolated(SCENARIOS[name]),
+        }
+        previous = next(
+            (r for r in reversed(history) if r.get("scenario") == name), None
+        )
+        print_result(result, previous)
+        if not args.no_save:
+            save_result(results_path, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Scripted model replies that walk the review and verification pipeline.
+
+The reply is chosen from the prompt rather than from call order, so the
+same model serves the review agent and concurrent verification groups: the
+review explores the repo with one round of tool calls and reports an issue
+per sampled file; each verification step answers for every issue ID.
+"""
+
+import itertools
+import threading
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from src.agent.prompts import get_prompt
+from src.agent.schema import (
+    IssueCategory,
+    IssueLocation,
+    IssueSeverity,
+    PrimaryReviewOutput,
+    ReviewIssue,
+)
+from src.agent.verification.schema import (
+    AnswersOutput,
+    IssueAnswers,
+    IssueQuestions,
+    IssueVerification,
+    QuestionAnswer,
+    QuestionsOutput,
+    VerificationOutput,
+)
+from tests.fake_chat_model import ScriptedChatModel, structured_response
+
+# Upper bound on model calls per scenario (the script is this many routers)
+MAX_CALLS = 10_000
+
+# Category and title combinations differ enough to survive deduplication
+CATEGORIES = list(IssueCategory)
+TITLES = [
+    "Unvalidated input reaches eval()",
+    "File handle is never closed",
+    "Empty strings are no longer skipped",
+    "Handler swallows processing errors",
+]
+
+QUESTION = "Is the value passed to eval() controlled by the caller?"
+
+
+def _text(message: BaseMessage) -> str:
+    """Text of a message, joining content blocks."""
+    if isinstance(message.content, str):
+        return message.content
+    return "\n".join(
+        block["text"] if isinstance(block, dict) else str(block)
+        for block in message.content
+        if not isinstance(block, dict) or "text" in block
+    )
+
+
+class ReviewScript:
+    """Callable script step replying like a model working through a review.
+
+    Args:
+        changed_paths: Files changed on the reviewed branch
+        issue_count: Number of issues the review reports
+    """
+
+    def __init__(self, changed_paths: list[str], issue_count: int) -> None:
+        self.changed_paths = changed_paths
+        self.issue_count = max(min(issue_count, len(changed_paths)), 1)
+        self._call_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _call_id(self) -> str:
+        with self._lock:
+            return f"call_{next(self._call_ids)}"
+
+    def _tool_calls(self, calls: list[tuple[str, dict[str, Any]]]) -> AIMessage:
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": name, "args": args, "id": self._call_id(), "type": "tool_call"}
+                for name, args in calls
+            ],
+        )
+
+    def _issue_ids(self) -> list[int]:
+        return list(range(1, self.issue_count + 1))
+
+    def review_output(self) -> PrimaryReviewOutput:
+        """Final review reply: one issue per evenly sampled changed file."""
+        step = max(len(self.changed_paths) // self.issue_count, 1)
+        return PrimaryReviewOutput(
+            description=f"Adds validation to {len(self.changed_paths)} modules.",
+            issues=[
+                ReviewIssue(
+                    title=f"{TITLES[n // len(CATEGORIES) % len(TITLES)]} in {path}",
+                    category=CATEGORIES[n % len(CATEGORIES)],
+                    severity=IssueSeverity.HIGH,
+                    location=[IssueLocation(filename=path, line=28)],
+                    explanation="`eval(value)` executes arbitrary expressions.",
+                    suggested_fix="Use `ast.literal_eval` or compare directly.",
+                )
+                for n, path in enumerate(self.changed_paths[::step][: self.issue_count])
+            ],
+        )
+
+    def __call__(self, messages: list[BaseMessage]) -> AIMessage:
+        last_human = max(
+            i for i, m in enumerate(messages) if isinstance(m, HumanMessage)
+        )
+        step_message = _text(messages[last_human])
+        if step_message == get_prompt("context_summary"):
+            return AIMessage(content="Summary: read the changed modules.")
+
+        prompt = step_message + "\n" + _text(messages[0])
+        used_tools = any(isinstance(m, ToolMessage) for m in messages[last_human:])
+        first_file = self.changed_paths[0]
+
+        if "Verification Step 1" in prompt:
+            return structured_response(
+                QuestionsOutput(
+                    issues=[
+                        IssueQuestions(issue_id=i, questions=[QUESTION])
+                        for i in self._issue_ids()
+                    ]
+                )
+            )
+
+        if "Verification Step 2" in prompt:
+            if not used_tools:
+                return self._tool_calls(
+                    [("read_file_part", {"file_path": first_file, "start_line": 20})]
+                )
+            return structured_response(
+                AnswersOutput(
+                    issues=[
+                        IssueAnswers(
+                            issue_id=i,
+                            answers=[QuestionAnswer(question=QUESTION, answer="Yes.")],
+                        )
+                        for i in self._issue_ids()
+                    ]
+                )
+            )
+
+        if "Verification Step 3" in prompt:
+            return structured_response(
+                VerificationOutput(
+                    issues=[
+                        IssueVerification(issue_id=i, confidence=8, rationale="Valid.")
+                        for i in self._issue_ids()
+                    ]
+                )
+            )
+
+        # The single-shot fast path has no tools to call
+        if not used_tools and get_prompt("fast_path") not in step_message:
+            return self._tool_calls(
+                [
+                    ("read_file_part", {"file_path": first_file}),
+                    ("search_in_files", {"pattern": "eval("}),
+                    ("list_files", {"directory": first_file.rsplit("/", 1)[0]}),
+                ]
+            )
+        return structured_response(self.review_output())
+
+
+def create_scripted_model(
+    changed_paths: list[str], issue_count: int
+) -> ScriptedChatModel:
+    """Offline model for a whole review plus verification run.
+
+    Args:
+        changed_paths: Files changed on the reviewed branch
+        issue_count: Number of issues the review reports
+
+    Returns:
+        ScriptedChatModel answering every call with a ReviewScript
+    """
+    return ScriptedChatModel(
+        script=[ReviewScript(changed_paths, issue_count)] * MAX_CALLS
+    )
@@ -0,0 +1,162 @@
+"""Synthetic git repositories for benchmarks.
+
+Repositories are written with `git fast-import`, so a 100k-file tree takes
+seconds instead of minutes. Nothing is checked out: every code path of the
+review reads from git objects, so HEAD only has to point at the feature
+branch.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+# Files per directory of the synthetic tree
+FILES_PER_DIRECTORY = 100
+
+# Fixed commit time, so repeated runs build identical objects
+COMMIT_TIME = "1700000000 +0000"
+
+
+def file_path(index: int) -> str:
+    """Path of the index-th file of a synthetic tree."""
+    return f"src/pkg{index // FILES_PER_DIRECTORY:04d}/module_{index:06d}.py"
+
+
+def base_content(index: int) -> str:
+    """Content of a file on the main branch."""
+    return (
+        f'"""Module {index}."""\n'
+        "\n"
+        "import os\n"
+        "\n"
+        "\n"
+        f"def load_{index}(path):\n"
+        f"    with open(os.path.join(path, 'data_{index}.txt')) as f:\n"
+        "        return f.read()\n"
+        "\n"
+        "\n"
+        f"def process_{index}(items):\n"
+        "    result = []\n"
+        "    for item in items:\n"
+        "        if item:\n"
+        "            result.append(item.strip())\n"
+        "    return result\n"
+        "\n"
+        "\n"
+        f"class Handler{index}:\n"
+        "    def __init__(self, name):\n"
+        "        self.name = name\n"
+        "\n"
+        "    def handle(self, payload):\n"
+        f"        return process_{index}(payload)\n"
+    )
+
+
+def changed_content(index: int) -> str:
+    """Content of a file modified on the feature branch."""
+    return (
+        base_content(index)
+        .replace("if item:", "if item is not None:")
+        .replace(".strip()", ".strip().lower()")
+        + "\n"
+        "\n"
+        f"def validate_{index}(value):\n"
+        "    return value == eval(value)\n"
+    )
+
+
+def changed_indices(total_files: int, changed_files: int) -> list[int]:
+    """Indices of the modified files, spread evenly over the tree."""
+    step = max(total_files // max(changed_files, 1), 1)
+    return list(range(0, total_files, step))[:changed_files]
+
+
+def _write_blob(stream: IO[bytes], content: str) -> None:
+    data = content.encode()
+    stream.write(b"data %d\n" % len(data))
+    stream.write(data)
+    stream.write(b"\n")
+
+
+def _write_commit(
+    stream: IO[bytes],
+    branch: str,
+    message: str,
+    files: dict[str, str],
+    parent: str | None = None,
+) -> None:
+    stream.write(f"commit refs/heads/{branch}\n".encode())
+    stream.write(f"committer Bench <bench@example.com> {COMMIT_TIME}\n".encode())
+    _write_blob(stream, message)
+    if parent is not None:
+        stream.write(f"from refs/heads/{parent}\n".encode())
+    for path, content in files.items():
+        stream.write(f"M 100644 inline {path}\n".encode())
+        _write_blob(stream, content)
+
+
+def build_synthetic_repo(
+    repo_path: Path, total_files: int, changed_files: int, commits: int = 3
+) -> list[str]:
+    """Write a repo whose feature branch modifies `changed_files` files.
+
+    Args:
+        repo_path: Empty directory to initialize
+        total_files: Number of files in the tree
+        changed_files: Number of files modified on the feature branch
+        commits: Number of feature commits the changes are split across
+
+    Returns:
+        Paths of the modified files
+    """
+    subprocess.run(
+        ["git", "init", "-q", "-b", "main", str(repo_path)],
+        check=True,
+        capture_output=True,
+    )
+
+    changed = changed_indices(total_files, changed_files)
+    process = subprocess.Popen(
+        ["git", "-C", str(repo_path), "fast-import", "--quiet"],
+        stdin=subprocess.PIPE,
+    )
+    assert process.stdin is not None
+    with process.stdin as stream:
+        _write_commit(
+            stream,
+            "main",
+            "Initial commit",
+            {file_path(i): base_content(i) for i in range(total_files)},
+        )
+        batch = max(-(-len(changed) // commits), 1)
+        for n, start in enumerate(range(0, len(changed), batch)):
+            _write_commit(
+                stream,
+                "feature",
+                f"Feature change {n + 1}",
+                {file_path(i): changed_content(i) for i in changed[start:][:batch]},
+                parent="main" if n == 0 else None,
+            )
+    if process.wait() != 0:
+        raise RuntimeError("git fast-import failed")
+
+    subprocess.run(
+        ["git", "-C", str(repo_path), "symbolic-ref", "HEAD", "refs/heads/feature"],
+        check=True,
+        capture_output=True,
+    )
+    return [file_path(i) for i in changed]
+
+
+@contextmanager
+def synthetic_repo(total_files: int, changed_files: int) -> Iterator[Path]:
+    """Temporary synthetic repo, removed on exit (see build_synthetic_repo)."""
+    repo_path = Path(tempfile.mkdtemp(prefix="reviewcerberus-bench-"))
+    try:
+        build_synthetic_repo(repo_path, total_files, changed_files)
+        yield repo_path
+    finally:
+        shutil.rmtree(repo_path, ignore_errors=True)
@@ -1,24 +1,29 @@
 from typing import Any
 
 from langchain.agents import create_agent
+from pydantic import BaseModel
 
-from .checkpointer import checkpointer
+from ..config import MODEL_NAME
+from .checkpointer import get_checkpointer
 from .middleware import init_agent_middleware
-from .model import model
 from .prompts import build_review_system_prompt
+from .providers import get_model
 from .schema import Context, PrimaryReviewOutput
-from .tools import (
-    FileContext,
-    ListFilesTool,
-    ReadFilePartTool,
-    SearchInFilesTool,
-)
+from .tools import FileContext, create_review_tools
+
+# Review model override (tests install a fake here); when None the shared
+# provider instance is created on first use, not at import
+model: Any = None
 
 
 def create_review_agent(
     repo_path: str,
     additional_instructions: str | None = None,
     include_sast_guidance: bool = False,
+    system_prompt: str | None = None,
+    response_format: type[BaseModel] = PrimaryReviewOutput,
+    use_tools: bool = True,
+    model_name: str = MODEL_NAME,
 ) -> tuple[Any, FileContext]:
     """Create a review agent with optional additional instructions.
 
@@ -27,32 +32,35 @@ def create_review_agent(
         additional_instructions: Optional additional review guidelines to append
                                 to the system prompt
         include_sast_guidance: Whether to include SAST skepticism guidance
+        system_prompt: Optional complete system prompt, overriding the one
+                       built from the other arguments
+        response_format: Pydantic model for the structured output
+        use_tools: Whether the agent can explore the repo with tools; without
+                   them it answers in a single model call
+        model_name: Model reviewing the changes (defaults to MODEL_NAME)
 
     Returns:
         Tuple of (configured agent instance, FileContext used by the agent)
     """
-    system_prompt = build_review_system_prompt(
-        additional_instructions, include_sast_guidance
-    )
+    if system_prompt is None:
+        system_prompt = build_review_system_prompt(
+            additional_instructions, include_sast_guidance
+        )
 
     # Create FileContext for tracking file content
     file_context = FileContext()
 
     # Create tools with repo_path and file_context
-    tools = [
-        ReadFilePartTool(repo_path=repo_path, file_context=file_context),
-        SearchInFilesTool(repo_path=repo_path, file_context=file_context),
-        ListFilesTool(repo_path=repo_path),
-    ]
+    tools = create_review_tools(repo_path, file_context) if use_tools else []
 
     agent = create_agent(
-        model=model,
+        model=model if model is not None else get_model(model_name),
         system_prompt=system_prompt,
         tools=tools,
         context_schema=Context,
-        checkpointer=checkpointer,
-        middleware=init_agent_middleware(include_summarizing=True),
-        response_format=PrimaryReviewOutput,
+        checkpointer=get_checkpointer(),
+        middleware=init_agent_middleware(include_summarizing=use_tools),
+        response_format=response_format,
     )
 
     return agent, file_context
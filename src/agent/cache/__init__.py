@@ -0,0 +1,32 @@
+"""Caches that let unchanged reviews skip the LLM."""
+
+from .fragment_cache import (
+    FileFragment,
+    build_file_fragments,
+    load_cached_description,
+    load_cached_fragments,
+    normalize_diff,
+    save_cached_description,
+    save_fragments,
+)
+from .review_cache import (
+    build_review_cache_key,
+    load_cached_review,
+    save_cached_review,
+)
+from .store import CacheStore, DirectoryCacheStore
+
+__all__ = [
+    "CacheStore",
+    "DirectoryCacheStore",
+    "FileFragment",
+    "build_file_fragments",
+    "build_review_cache_key",
+    "load_cached_description",
+    "load_cached_fragments",
+    "load_cached_review",
+    "normalize_diff",
+    "save_cached_description",
+    "save_cached_review",
+    "save_fragments",
+]
@@ -0,0 +1,229 @@
+"""Per-file findings cache keyed by the normalized file diff.
+
+A rebase changes the head SHA and usually the hunk line numbers, but most file
+diffs keep the same content. Keying findings by a normalized diff lets those
+files reuse their issues, with line numbers shifted to the new hunk positions.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+
+from ..git_utils import FileChange, get_file_diff
+from ..schema import ReviewIssue
+from .review_cache import hash_text, review_config_fingerprint
+from .store import CacheStore
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+
+@dataclass
+class FileFragment:
+    """Cache identity of one changed file's diff."""
+
+    path: str
+    key: str
+    hunk_starts: list[int]
+
+
+def normalize_diff(diff: str) -> tuple[str, list[int]]:
+    """Strip the parts of a diff that change on rebase without a code change.
+
+    Blob hashes (`index` lines) and hunk line numbers are removed; the changed
+    and context lines are kept.
+
+    Args:
+        diff: Unified diff of a single file
+
+    Returns:
+        Tuple of (normalized diff, new-side start line of each hunk)
+    """
+    lines: list[str] = []
+    hunk_starts: list[int] = []
+
+    for line in diff.splitlines():
+        if line.startswith("diff --git ") or line.startswith("index "):
+            continue
+
+        match = _HUNK_HEADER.match(line)
+        if match:
+            hunk_starts.append(int(match.group(1)))
+            lines.append("@@")
+            continue
+
+        lines.append(line)
+
+    return "\n".join(lines), hunk_starts
+
+
+def build_file_fragments(
+    repo_path: str,
+    target_branch: str,
+    changed_files: list[FileChange],
+    system_prompt: str,
+    sast_findings: str | None = None,
+) -> list[FileFragment]:
+    """Compute the fragment cache identity of every changed file.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        changed_files: Files changed between target branch and HEAD
+        system_prompt: Complete review system prompt
+        sast_findings: Optional SAST findings given to the review; findings
+            are reused only for the same SAST input
+
+    Returns:
+        One FileFragment per changed file, in input order
+    """
+    config = review_config_fingerprint(system_prompt)
+    fragments = []
+
+    for f in changed_files:
+        diff = ""
+        if f.change_type != "deleted":
+            diff = get_file_diff(repo_path, target_branch, f.path) or ""
+        normalized, hunk_starts = normalize_diff(diff)
+
+        key_data = {
+            **config,
+            "kind": "fragment",
+            "path": f.path,
+            "old_path": f.old_path,
+            "change_type": f.change_type,
+            "diff": hash_text(normalized),
+        }
+        if sast_findings is not None:
+            key_data["sast"] = hash_text(sast_findings)
+        fragments.append(
+            FileFragment(
+                path=f.path,
+                key=hash_text(json.dumps(key_data, sort_keys=True)),
+                hunk_starts=hunk_starts,
+            )
+        )
+
+    return fragments
+
+
+def _remap_line(line: int, cached_starts: list[int], hunk_starts: list[int]) -> int:
+    """Shift a line number by the offset of the hunk it belongs to."""
+    if not cached_starts or len(cached_starts) != len(hunk_starts):
+        return line
+
+    index = 0
+    for i, start in enumerate(cached_starts):
+        if start <= line:
+            index = i
+
+    return line + hunk_starts[index] - cached_starts[index]
+
+
+def load_cached_fragments(
+    store: CacheStore, fragments: list[FileFragment]
+) -> dict[str, list[ReviewIssue]]:
+    """Load cached issues for files whose normalized diff was reviewed before.
+
+    Args:
+        store: Cache store
+        fragments: Fragments of the current changed files
+
+    Returns:
+        Dictionary mapping each cache-hit file path to its issues, with line
+        numbers adjusted to the current hunk positions
+    """
+    hits: dict[str, list[ReviewIssue]] = {}
+
+    for fragment in fragments:
+        raw = store.get(fragment.key)
+        if raw is None:
+            continue
+
+        try:
+            data = json.loads(raw)
+            issues = [ReviewIssue.model_validate(i) for i in data["issues"]]
+            cached_starts: list[int] = data["hunk_starts"]
+        except (ValueError, KeyError):
+            continue
+
+        for issue in issues:
+            for location in issue.location:
+                if location.line is not None:
+                    location.line = _remap_line(
+                        location.line, cached_starts, fragment.hunk_starts
+                    )
+
+        hits[fragment.path] = issues
+
+    return hits
+
+
+def save_fragments(
+    store: CacheStore,
+    fragments: list[FileFragment],
+    issues: list[ReviewIssue],
+) -> None:
+    """Store per-file issues for freshly reviewed files.
+
+    Issues spanning several files cannot be attributed to a single diff, so
+    files they touch are not cached and will be reviewed again next time.
+
+    Args:
+        store: Cache store
+        fragments: Fragments of the files that were sent to the agent
+        issues: Issues the agent reported for those files
+    """
+    by_path: dict[str, list[ReviewIssue]] = {f.path: [] for f in fragments}
+    uncacheable: set[str] = set()
+
+    for issue in issues:
+        paths = {location.filename for location in issue.location}
+        if len(paths) == 1:
+            path = paths.pop()
+            if path in by_path:
+                by_path[path].append(issue)
+        else:
+            uncacheable.update(paths)
+
+    for fragment in fragments:
+        if fragment.path in uncacheable:
+            continue
+
+        store.put(
+            fragment.key,
+            json.dumps(
+                {
+                    "issues": [
+                        i.model_dump(mode="json") for i in by_path[fragment.path]
+                    ],
+                    "hunk_starts": fragment.hunk_starts,
+                }
+            ),
+        )
+
+
+def _description_key(fragments: list[FileFragment]) -> str:
+    keys = sorted(fragment.key for fragment in fragments)
+    return hash_text(json.dumps({"kind": "description", "fragments": keys}))
+
+
+def load_cached_description(
+    store: CacheStore, fragments: list[FileFragment]
+) -> str | None:
+    """Load the description stored for exactly this set of file fragments."""
+    raw = store.get(_description_key(fragments))
+    if raw is None:
+        return None
+
+    try:
+        description: str = json.loads(raw)["description"]
+        return description
+    except (ValueError, KeyError):
+        return None
+
+
+def save_cached_description(
+    store: CacheStore, fragments: list[FileFragment], description: str
+) -> None:
+    """Store the review description for this set of file fragments."""
+    store.put(_description_key(fragments), json.dumps({"description": description}))
@@ -0,0 +1,120 @@
+"""Whole-review result cache keyed by commits, prompt and model."""
+
+import hashlib
+import json
+from typing import Any
+
+from ...config import (
+    FAST_PATH_MAX_DIFF_LINES,
+    MAX_DIFF_PER_FILE,
+    MAX_OUTPUT_TOKENS,
+    MODEL_NAME,
+    MODEL_PROVIDER,
+    TRIAGE_CLASSIFY,
+    TRIAGE_MODEL_NAME,
+    VERIFY_CONCURRENCY,
+    VERIFY_GROUP_SIZE,
+    VERIFY_MODEL_NAME,
+)
+from ..git_utils import get_head_sha, get_merge_base
+from ..schema import PrimaryReviewOutput
+from ..verification import VerifiedReviewOutput
+from .store import CacheStore
+
+# Bump when the cached payload or review pipeline changes incompatibly
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_text(text: str) -> str:
+    """Return the hex SHA-256 of a string."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def review_config_fingerprint(system_prompt: str) -> dict[str, Any]:
+    """Return the prompt and model settings that shape review findings."""
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "system_prompt": hash_text(system_prompt),
+        "provider": MODEL_PROVIDER,
+        "model": MODEL_NAME,
+        "max_output_tokens": MAX_OUTPUT_TOKENS,
+        "max_diff_per_file": MAX_DIFF_PER_FILE,
+        # Decides between a single-call review and the agent with tools
+        "fast_path_max_diff_lines": FAST_PATH_MAX_DIFF_LINES,
+    }
+
+
+def build_review_cache_key(
+    repo_path: str,
+    target_branch: str,
+    system_prompt: str,
+    verify: bool,
+    sast: bool,
+    shard: bool = False,
+    triage: bool = False,
+) -> str:
+    """Build the cache key for a full review run.
+
+    The key covers everything that determines the review input: the merge
+    base and HEAD commits (the diff and file contents), the system prompt
+    including additional instructions, the model configuration, and flags.
+    With verification it also covers how issues are grouped, since each
+    group is verified in its own calls.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        system_prompt: Complete review system prompt
+        verify: Whether verification is enabled
+        sast: Whether the SAST pre-scan is enabled
+        shard: Whether the review is split across sub-agents
+        triage: Whether low-risk files are reviewed by TRIAGE_MODEL_NAME
+
+    Returns:
+        Hex digest identifying the review
+    """
+    key_data = {
+        **review_config_fingerprint(system_prompt),
+        "merge_base": get_merge_base(repo_path, target_branch),
+        "head": get_head_sha(repo_path),
+        "verify_model": VERIFY_MODEL_NAME if verify else None,
+        "verify_groups": (
+            {"concurrency": VERIFY_CONCURRENCY, "size": VERIFY_GROUP_SIZE}
+            if verify
+            else None
+        ),
+        "verify": verify,
+        "sast": sast,
+        "shard": shard,
+    }
+    if triage:
+        # Only present with --triage, so keys of other reviews stay unchanged
+        key_data["triage"] = {"model": TRIAGE_MODEL_NAME, "classify": TRIAGE_CLASSIFY}
+    return hash_text(json.dumps(key_data, sort_keys=True))
+
+
+def load_cached_review(
+    store: CacheStore, key: str
+) -> PrimaryReviewOutput | VerifiedReviewOutput | None:
+    """Load a cached review output, or None on a miss or unreadable entry."""
+    raw = store.get(key)
+    if raw is None:
+        return None
+
+    try:
+        data = json.loads(raw)
+        if data["kind"] == "verified":
+            return VerifiedReviewOutput.model_validate(data["output"])
+        return PrimaryReviewOutput.model_validate(data["output"])
+    except (ValueError, KeyError):
+        return None
+
+
+def save_cached_review(
+    store: CacheStore,
+    key: str,
+    output: PrimaryReviewOutput | VerifiedReviewOutput,
+) -> None:
+    """Store a final review output under the given key."""
+    kind = "verified" if isinstance(output, VerifiedReviewOutput) else "primary"
+    store.put(key, json.dumps({"kind": kind, "output": output.model_dump()}))
@@ -0,0 +1,49 @@
+"""Key-value stores for cached review data."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Protocol
+
+
+class CacheStore(Protocol):
+    """Minimal string key-value store used by the review caches.
+
+    Implementations can be backed by anything (local directory, object
+    storage, a database) as long as `put` is atomic per key.
+    """
+
+    def get(self, key: str) -> str | None: ...
+
+    def put(self, key: str, value: str) -> None: ...
+
+
+class DirectoryCacheStore:
+    """CacheStore keeping one file per key in a local directory."""
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small for large caches
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._path(key).read_text()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file and rename so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
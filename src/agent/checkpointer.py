@@ -1,3 +0,0 @@
-from langgraph.checkpoint.memory import InMemorySaver
-
-checkpointer = InMemorySaver()
@@ -0,0 +1,69 @@
+"""Checkpointer selection for review agents."""
+
+import threading
+import uuid
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+from ...config import CHECKPOINT_BACKEND, CHECKPOINT_DB_PATH, CHECKPOINT_KEEP_LAST
+from .bounded_memory_saver import BoundedInMemorySaver
+from .sqlite_saver import SqliteSaver
+
+__all__ = [
+    "BoundedInMemorySaver",
+    "SqliteSaver",
+    "get_checkpointer",
+    "is_durable",
+    "new_run_id",
+]
+
+_checkpointer: BaseCheckpointSaver | None = None
+_lock = threading.Lock()
+
+
+def is_durable() -> bool:
+    """Whether checkpoints survive the process (required for resume)."""
+    return CHECKPOINT_BACKEND == "sqlite"
+
+
+def get_checkpointer() -> BaseCheckpointSaver | None:
+    """Return the process-wide checkpointer selected by CHECKPOINT_BACKEND.
+
+    Returns:
+        Checkpointer instance, or None for the "none" backend (a single
+        review invocation does not need step history).
+
+    Raises:
+        ValueError: If CHECKPOINT_BACKEND is not supported.
+    """
+    global _checkpointer
+
+    # Sharded reviews create agents from several threads
+    with _lock:
+        if _checkpointer is None:
+            match CHECKPOINT_BACKEND:
+                case "none":
+                    return None
+                case "memory":
+                    _checkpointer = (
+                        BoundedInMemorySaver(CHECKPOINT_KEEP_LAST)
+                        if CHECKPOINT_KEEP_LAST > 0
+                        else InMemorySaver()
+                    )
+                case "sqlite":
+                    _checkpointer = SqliteSaver(
+                        CHECKPOINT_DB_PATH, keep_last=CHECKPOINT_KEEP_LAST
+                    )
+                case _:
+                    raise ValueError(
+                        f"Invalid CHECKPOINT_BACKEND: {CHECKPOINT_BACKEND}. "
+                        f"Must be 'none', 'memory', or 'sqlite'"
+                    )
+
+        return _checkpointer
+
+
+def new_run_id() -> str:
+    """Generate a unique run ID, used as the LangGraph thread ID."""
+    return uuid.uuid4().hex[:12]
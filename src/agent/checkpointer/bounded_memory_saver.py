@@ -0,0 +1,63 @@
+"""In-memory checkpointer that only retains the most recent snapshots."""
+
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class BoundedInMemorySaver(InMemorySaver):
+    """InMemorySaver that keeps at most `keep_last` checkpoints per thread.
+
+    Every graph step stores a full copy of the message list, so an unbounded
+    history grows with (steps x context size). After each put, older
+    checkpoints are dropped together with their pending writes and any
+    channel blobs no longer referenced by a retained checkpoint.
+    """
+
+    def __init__(self, keep_last: int = 1) -> None:
+        super().__init__()
+        self.keep_last = max(keep_last, 1)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        self._prune(
+            next_config["configurable"]["thread_id"],
+            next_config["configurable"]["checkpoint_ns"],
+        )
+        return next_config
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.keep_last:
+            return
+
+        ordered = sorted(checkpoints.keys())
+        for checkpoint_id in ordered[: -self.keep_last]:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        referenced: set[tuple[str, Any]] = set()
+        for serialized, _, _ in checkpoints.values():
+            kept: Checkpoint = self.serde.loads_typed(serialized)
+            referenced.update(kept["channel_versions"].items())
+
+        for key in [
+            key
+            for key in self.blobs
+            if key[0] == thread_id
+            and key[1] == checkpoint_ns
+            and (key[2], key[3]) not in referenced
+        ]:
+            del self.blobs[key]
@@ -0,0 +1,278 @@
+"""Durable LangGraph checkpointer backed by a SQLite database file."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    checkpoint_type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+class SqliteSaver(BaseCheckpointSaver[int]):
+    """Checkpointer that persists every graph step to SQLite.
+
+    Each checkpoint row stores the full serialized checkpoint (including
+    channel values), so a run can be resumed from the last completed step
+    after the process dies. Resuming only needs the latest checkpoint, so
+    with `keep_last` older checkpoints of a thread are deleted on every put.
+    Only the synchronous API is implemented, which is all the review agents
+    use.
+    """
+
+    def __init__(self, db_path: str, keep_last: int = 0) -> None:
+        super().__init__()
+        self.keep_last = keep_last
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _row_to_tuple(self, row: sqlite3.Row | tuple[Any, ...]) -> CheckpointTuple:
+        (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            checkpoint_type,
+            checkpoint,
+            metadata_type,
+            metadata,
+        ) = row
+
+        writes = self._conn.execute(
+            "SELECT task_id, channel, value_type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((checkpoint_type, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        query = "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        params: tuple[Any, ...] = (thread_id, checkpoint_ns)
+
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            return self._row_to_tuple(row) if row else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = "SELECT * FROM checkpoints WHERE 1 = 1"
+        params: tuple[Any, ...] = ()
+
+        if config:
+            query += " AND thread_id = ?"
+            params += (config["configurable"]["thread_id"],)
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                query += " AND checkpoint_ns = ?"
+                params += (checkpoint_ns,)
+            if checkpoint_id := get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params += (checkpoint_id,)
+
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id < ?"
+            params += (before_checkpoint_id,)
+
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            tuples = [
+                self._row_to_tuple(row)
+                for row in self._conn.execute(query, params).fetchall()
+            ]
+
+        for checkpoint_tuple in tuples:
+            if filter and not all(
+                checkpoint_tuple.metadata.get(key) == value
+                for key, value in filter.items()
+            ):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+            yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    checkpoint_type,
+                    checkpoint_blob,
+                    metadata_type,
+                    metadata_blob,
+                ),
+            )
+            if self.keep_last > 0:
+                self._prune(thread_id, checkpoint_ns)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        self._conn.execute(
+            "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+            "AND checkpoint_id NOT IN ("
+            "SELECT checkpoint_id FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ? "
+            "ORDER BY checkpoint_id DESC LIMIT ?)",
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns, self.keep_last),
+        )
+        self._conn.execute(
+            "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+            "AND checkpoint_id NOT IN ("
+            "SELECT checkpoint_id FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ?)",
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns),
+        )
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_blob = self.serde.dumps_typed(value)
+            rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    WRITES_IDX_MAP.get(channel, idx),
+                    channel,
+                    value_type,
+                    value_blob,
+                    task_path,
+                )
+            )
+
+        # Special writes (errors, interrupts) may be overwritten, regular
+        # writes are kept from the first attempt, matching InMemorySaver
+        verb = (
+            "INSERT OR REPLACE"
+            if all(channel in WRITES_IDX_MAP for channel, _ in writes)
+            else "INSERT OR IGNORE"
+        )
+        with self._lock:
+            self._conn.executemany(
+                f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            )
+            self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
@@ -0,0 +1,110 @@
+"""Deterministic deduplication of review issues."""
+
+import re
+from difflib import SequenceMatcher
+
+from .schema import IssueLocation, IssueSeverity, ReviewIssue
+
+# Titles at least this similar are duplicates even at unrelated locations
+# (the same bug reported at several call sites). Near-exact only: titles of
+# different bugs often differ in a single word ("get_user" vs "get_order")
+TITLE_SIMILARITY = 0.97
+# Lower bar for issues that also point at overlapping code
+NEARBY_TITLE_SIMILARITY = 0.5
+# Lines this close in the same file count as the same place
+LINE_TOLERANCE = 3
+
+_SEVERITY_RANK = {
+    IssueSeverity.CRITICAL: 0,
+    IssueSeverity.HIGH: 1,
+    IssueSeverity.MEDIUM: 2,
+    IssueSeverity.LOW: 3,
+}
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(re.findall(r"\w+", title.lower()))
+
+
+def _title_similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _locations_overlap(a: list[IssueLocation], b: list[IssueLocation]) -> bool:
+    for loc_a in a:
+        for loc_b in b:
+            if loc_a.filename != loc_b.filename:
+                continue
+            # A location without a line covers the whole file
+            if loc_a.line is None or loc_b.line is None:
+                return True
+            if abs(loc_a.line - loc_b.line) <= LINE_TOLERANCE:
+                return True
+    return False
+
+
+def _is_duplicate(a: ReviewIssue, b: ReviewIssue, title_a: str, title_b: str) -> bool:
+    if a.category != b.category:
+        return False
+
+    similarity = _title_similarity(title_a, title_b)
+    if similarity >= TITLE_SIMILARITY:
+        return True
+
+    return similarity >= NEARBY_TITLE_SIMILARITY and _locations_overlap(
+        a.location, b.location
+    )
+
+
+def _merge_cluster(cluster: list[ReviewIssue]) -> ReviewIssue:
+    """Merge duplicates into the most severe issue, keeping all locations."""
+    primary = min(cluster, key=lambda issue: _SEVERITY_RANK.get(issue.severity, 99))
+
+    locations: list[IssueLocation] = []
+    seen: set[tuple[str, int | None]] = set()
+    for issue in [primary] + [i for i in cluster if i is not primary]:
+        for location in issue.location:
+            key = (location.filename, location.line)
+            if key not in seen:
+                seen.add(key)
+                locations.append(location)
+
+    return primary.model_copy(update={"location": locations})
+
+
+def deduplicate_issues(issues: list[ReviewIssue]) -> list[ReviewIssue]:
+    """Merge near-duplicate issues.
+
+    Issues of the same category are clustered when their normalized titles
+    are near-exact matches, or when their titles are similar and their locations overlap.
+    Each cluster becomes one issue: the most severe member, with the
+    locations of all members. The result is independent of model sampling,
+    so the same input always yields the same output.
+
+    Args:
+        issues: Issues in report order
+
+    Returns:
+        Deduplicated issues, ordered by the first member of each cluster
+    """
+    titles = [_normalize_title(issue.title) for issue in issues]
+    parent = list(range(len(issues)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(issues)):
+        for j in range(i + 1, len(issues)):
+            if find(i) != find(j) and _is_duplicate(
+                issues[i], issues[j], titles[i], titles[j]
+            ):
+                parent[max(find(i), find(j))] = min(find(i), find(j))
+
+    clusters: dict[int, list[ReviewIssue]] = {}
+    for i, issue in enumerate(issues):
+        clusters.setdefault(find(i), []).append(issue)
+
+    return [_merge_cluster(cluster) for cluster in clusters.values()]
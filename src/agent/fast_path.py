@@ -0,0 +1,89 @@
+"""Single-shot review of small diffs.
+
+Below FAST_PATH_MAX_DIFF_LINES changed lines the review skips the tool loop:
+the code around every change is read up front and sent with the diffs in
+one structured-output request, so trivial changes are reviewed with a single
+model call.
+"""
+
+import re
+
+from ..config import FAST_PATH_MAX_DIFF_LINES
+from .formatting.format_file_lines import FileLinesMap, format_file_lines
+from .git_utils import FileChange, get_file_diff, read_files_at_head
+from .prompts import get_prompt
+
+# Lines of code included above and below each changed region
+SURROUNDING_LINES = 30
+
+# New-side start and length of a unified diff hunk
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+
+def use_fast_path(changed_files: list[FileChange]) -> bool:
+    """Whether the diff is small enough for a single-shot review."""
+    diff_lines = sum(f.additions + f.deletions for f in changed_files)
+    return 0 < diff_lines <= FAST_PATH_MAX_DIFF_LINES
+
+
+def _changed_ranges(diff: str) -> list[tuple[int, int]]:
+    """New-side line ranges (first, last) touched by a zero-context diff."""
+    ranges = []
+    for match in _HUNK_HEADER.finditer(diff):
+        start = int(match.group(1))
+        length = int(match.group(2) or "1")
+        # Pure deletions have length 0 and start at the line before them
+        ranges.append((start, start + max(length, 1) - 1))
+    return ranges
+
+
+def read_surrounding_code(
+    repo_path: str, target_branch: str, changed_files: list[FileChange]
+) -> FileLinesMap:
+    """Read the HEAD code around each changed region.
+
+    Args:
+        repo_path: Absolute path to the git repository
+        target_branch: Branch to compare against
+        changed_files: Files to read (deleted files are skipped)
+
+    Returns:
+        FileLinesMap with SURROUNDING_LINES lines around every change
+    """
+    paths = [f.path for f in changed_files if f.change_type != "deleted"]
+    contents = read_files_at_head(repo_path, paths)
+
+    files: FileLinesMap = {}
+    for path, content in contents.items():
+        lines = content.splitlines()
+        diff = get_file_diff(repo_path, target_branch, path, context_lines=0)
+        selected: dict[int, str] = {}
+        for first, last in _changed_ranges(diff or ""):
+            start = max(first - SURROUNDING_LINES, 1)
+            end = min(last + SURROUNDING_LINES, len(lines))
+            for line_number in range(start, end + 1):
+                selected[line_number] = lines[line_number - 1]
+        if selected:
+            files[path] = selected
+    return files
+
+
+def build_fast_path_message(user_message: str, surrounding_code: FileLinesMap) -> str:
+    """Review request with the surrounding code inlined after the diffs.
+
+    Args:
+        user_message: Review context message (commits, files, diffs)
+        surrounding_code: Code around the changes (see read_surrounding_code)
+
+    Returns:
+        Message for a review without tools
+    """
+    sections = [user_message]
+    if surrounding_code:
+        sections.append(
+            "## Surrounding Code\n"
+            "Current code around each change, with line numbers:\n\n"
+            + format_file_lines(surrounding_code)
+        )
+    sections.append(get_prompt("fast_path"))
+    return "\n\n".join(sections)
@@ -31,13 +31,20 @@ def format_questions_with_ids(questions: QuestionsOutput) -> str:
 
 
 def format_issues_with_answers(
-    issues: list[ReviewIssue], answers: AnswersOutput
+    issues: list[ReviewIssue],
+    answers: AnswersOutput,
+    issue_ids: list[int] | None = None,
 ) -> str:
-    """Format issues with their Q&A for scoring prompt."""
+    """Format issues with their Q&A for scoring prompt.
+
+    Issues are numbered 1..N unless `issue_ids` gives their IDs explicitly
+    (when scoring a subset of the review's issues).
+    """
     lines = []
     answers_by_id: dict[int, IssueAnswers] = {ia.issue_id: ia for ia in answers.issues}
+    ids = issue_ids or list(range(1, len(issues) + 1))
 
-    for idx, issue in enumerate(issues, 1):
+    for idx, issue in zip(ids, issues):
         lines.append(f"### Issue {idx}: {issue.title}")
         lines.append("")
         lines.append(f"**Explanation:** {issue.explanation}")
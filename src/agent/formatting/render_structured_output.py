@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from ..schema import IssueSeverity, PrimaryReviewOutput, ReviewIssue
 
 if TYPE_CHECKING:
-    from ..verification.schema import VerifiedReviewIssue, VerifiedReviewOutput
+    from ..incremental.schema import IncrementalReviewOutput
+    from ..verification.schema import VerifiedReviewOutput
 
 # Severity order for sorting (CRITICAL > HIGH > MEDIUM > LOW)
 _SEVERITY_ORDER = {
@@ -28,16 +29,30 @@ def _get_severity_emoji(severity: IssueSeverity) -> str:
     }.get(severity, "⚪")
 
 
-def _sort_issues(
-    issues: list[ReviewIssue] | list[VerifiedReviewIssue],
-) -> list[ReviewIssue] | list[VerifiedReviewIssue]:
-    """Sort issues by severity (CRITICAL first, then HIGH, MEDIUM, LOW)."""
-    return sorted(issues, key=lambda x: _SEVERITY_ORDER.get(x.severity, 99))
+def _get_status_label(status: str) -> str:
+    """Get label for an incremental review status."""
+    return {
+        "NEW": "🆕 New",
+        "OPEN": "⏳ Open",
+        "RESOLVED": "✅ Resolved",
+    }.get(status, status)
 
 
-def _render_issues_summary_table(
-    issues: list[ReviewIssue] | list[VerifiedReviewIssue],
-) -> str:
+def _sort_issues(issues: Sequence[ReviewIssue]) -> list[ReviewIssue]:
+    """Sort issues by severity (CRITICAL first, then HIGH, MEDIUM, LOW).
+
+    Resolved issues from an incremental review go after all unresolved ones.
+    """
+    return sorted(
+        issues,
+        key=lambda x: (
+            getattr(x, "status", None) == "RESOLVED",
+            _SEVERITY_ORDER.get(x.severity, 99),
+        ),
+    )
+
+
+def _render_issues_summary_table(issues: Sequence[ReviewIssue]) -> str:
     """Render a summary table of issues.
 
     Args:
@@ -46,12 +61,15 @@ def _render_issues_summary_table(
     Returns:
         Markdown table string
     """
-    lines = [
-        "## Issues Summary",
-        "",
-        "| # | Title | Category | Severity | Location |",
-        "|---|-------|----------|----------|----------|",
-    ]
+    with_status = any(hasattr(issue, "status") for issue in issues)
+
+    header = "| # | Title | Category | Severity | Location |"
+    separator = "|---|-------|----------|----------|----------|"
+    if with_status:
+        header += " Status |"
+        separator += "--------|"
+
+    lines = ["## Issues Summary", "", header, separator]
 
     for idx, issue in enumerate(issues, 1):
         severity_emoji = _get_severity_emoji(issue.severity)
@@ -59,16 +77,19 @@ def _render_issues_summary_table(
         file_path = issue.location[0].filename if issue.location else "-"
         if len(issue.location) > 1:
             file_path += f" (+{len(issue.location) - 1})"
-        lines.append(
+        row = (
             f"| {idx} | {issue.title} | {issue.category.value} | "
             f"{severity_emoji} {issue.severity.value} | `{file_path}` |"
         )
+        if with_status:
+            row += f" {_get_status_label(getattr(issue, 'status', ''))} |"
+        lines.append(row)
 
     lines.append("")
     return "\n".join(lines)
 
 
-def render_issue(issue: ReviewIssue | VerifiedReviewIssue, index: int) -> str:
+def render_issue(issue: ReviewIssue, index: int) -> str:
     """Render a single issue to markdown format."""
     severity_emoji = _get_severity_emoji(issue.severity)
 
@@ -87,6 +108,13 @@ def render_issue(issue: ReviewIssue | VerifiedReviewIssue, index: int) -> str:
         f"**Severity:** {severity_emoji} {issue.severity.value}  ",
     ]
 
+    # Add status line if this issue comes from an incremental review
+    status = getattr(issue, "status", None)
+    if status is not None:
+        status_rationale = getattr(issue, "status_rationale", None)
+        rationale_text = f" - {status_rationale}" if status_rationale else ""
+        lines.append(f"**Status:** {_get_status_label(status)}{rationale_text}  ")
+
     # Add confidence line if this is a verified issue
     confidence = getattr(issue, "confidence", None)
     if confidence is not None:
@@ -117,12 +145,14 @@ def render_issue(issue: ReviewIssue | VerifiedReviewIssue, index: int) -> str:
 
 
 def render_structured_output(
-    output: PrimaryReviewOutput | VerifiedReviewOutput,
+    output: PrimaryReviewOutput | VerifiedReviewOutput | IncrementalReviewOutput,
 ) -> str:
     """Render structured review output to markdown format.
 
-    Supports both PrimaryReviewOutput and VerifiedReviewOutput. For verified
-    output, confidence scores are rendered after severity.
+    Supports PrimaryReviewOutput, VerifiedReviewOutput and
+    IncrementalReviewOutput. For verified output, confidence scores are
+    rendered after severity; for incremental output, the NEW/OPEN/RESOLVED
+    status is.
 
     Args:
         output: The structured review output from the agent
@@ -4,7 +4,11 @@ from .get_changed_files import get_changed_files
 from .get_commit_messages import get_commit_messages
 from .get_current_branch import get_current_branch
 from .get_file_diff import get_file_diff
+from .get_head_sha import get_head_sha
+from .get_merge_base import get_merge_base
 from .get_repo_root import get_repo_root
+from .is_ancestor import is_ancestor
+from .read_files_at_head import read_files_at_head
 from .types import CommitInfo, FileChange
 
 __all__ = [
@@ -14,5 +18,9 @@ __all__ = [
     "get_commit_messages",
     "get_current_branch",
     "get_file_diff",
+    "get_head_sha",
+    "get_merge_base",
     "get_repo_root",
+    "is_ancestor",
+    "read_files_at_head",
 ]
@@ -1,7 +1,6 @@
 """Get changed files between branches."""
 
-import subprocess
-
+from ..tracing import run_traced
 from .types import FileChange
 
 
@@ -15,7 +14,7 @@ def get_changed_files(repo_path: str, target_branch: str) -> list[FileChange]:
     Returns:
         List of FileChange objects
     """
-    result = subprocess.run(
+    result = run_traced(
         [
             "git",
             "-C",
@@ -29,7 +28,7 @@ def get_changed_files(repo_path: str, target_branch: str) -> list[FileChange]:
         check=True,
     )
 
-    numstat_result = subprocess.run(
+    numstat_result = run_traced(
         ["git", "-C", repo_path, "diff", "--numstat", f"{target_branch}...HEAD"],
         capture_output=True,
         text=True,
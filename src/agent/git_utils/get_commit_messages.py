@@ -1,7 +1,6 @@
 """Get commit messages between branches."""
 
-import subprocess
-
+from ..tracing import run_traced
 from .types import CommitInfo
 
 
@@ -18,7 +17,7 @@ def get_commit_messages(
     Returns:
         List of CommitInfo objects
     """
-    result = subprocess.run(
+    result = run_traced(
         [
             "git",
             "-C",
@@ -1,6 +1,6 @@
 """Get the current branch name."""
 
-import subprocess
+from ..tracing import run_traced
 
 
 def get_current_branch(repo_path: str) -> str:
@@ -16,7 +16,7 @@ def get_current_branch(repo_path: str) -> str:
         subprocess.CalledProcessError: If the git command fails
             (e.g., not a git repository).
     """
-    result = subprocess.run(
+    result = run_traced(
         ["git", "-C", repo_path, "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True,
         text=True,
@@ -1,8 +1,7 @@
 """Get file diff between branches."""
 
-import subprocess
-
 from ...config import MAX_DIFF_PER_FILE
+from ..tracing import run_traced
 
 
 def get_file_diff(
@@ -19,7 +18,7 @@ def get_file_diff(
     Returns:
         Diff string (truncated if exceeds MAX_DIFF_PER_FILE), or None if empty
     """
-    result = subprocess.run(
+    result = run_traced(
         [
             "git",
             "-C",
@@ -0,0 +1,24 @@
+"""Get the commit SHA of HEAD."""
+
+from ..tracing import run_traced
+
+
+def get_head_sha(repo_path: str) -> str:
+    """Get the full commit SHA that HEAD points to.
+
+    Args:
+        repo_path: Absolute path to the git repository
+
+    Returns:
+        Full SHA of HEAD
+
+    Raises:
+        subprocess.CalledProcessError: If the git command fails
+    """
+    result = run_traced(
+        ["git", "-C", repo_path, "rev-parse", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
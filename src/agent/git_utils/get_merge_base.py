@@ -0,0 +1,27 @@
+"""Get the merge base between the target branch and HEAD."""
+
+from ..tracing import run_traced
+
+
+def get_merge_base(repo_path: str, target_branch: str) -> str:
+    """Get the commit SHA where HEAD diverged from the target branch.
+
+    This is the base that `target_branch...HEAD` diffs are computed against.
+
+    Args:
+        repo_path: Absolute path to the git repository
+        target_branch: Branch to compare against
+
+    Returns:
+        Full SHA of the merge base commit
+
+    Raises:
+        subprocess.CalledProcessError: If the git command fails
+    """
+    result = run_traced(
+        ["git", "-C", repo_path, "merge-base", target_branch, "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
@@ -1,6 +1,6 @@
 """Get the repository root directory."""
 
-import subprocess
+from ..tracing import run_traced
 
 
 def get_repo_root(path: str | None = None) -> str:
@@ -21,5 +21,5 @@ def get_repo_root(path: str | None = None) -> str:
     if path:
         cmd = ["git", "-C", path, "rev-parse", "--show-toplevel"]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    result = run_traced(cmd, capture_output=True, text=True, check=True)
     return result.stdout.strip()
@@ -0,0 +1,24 @@
+"""Check whether a commit is an ancestor of HEAD."""
+
+from ..tracing import run_traced
+
+
+def is_ancestor(repo_path: str, commit: str) -> bool:
+    """Check whether `commit` is reachable from HEAD.
+
+    False after a force-push or rebase rewrote the commit away, or when the
+    commit does not exist.
+
+    Args:
+        repo_path: Absolute path to the git repository
+        commit: Commit SHA or ref to check
+
+    Returns:
+        True if HEAD contains the commit
+    """
+    result = run_traced(
+        ["git", "-C", repo_path, "merge-base", "--is-ancestor", commit, "HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0
@@ -0,0 +1,53 @@
+"""Read several files from HEAD in one git process."""
+
+from ..tracing import run_traced
+
+
+def read_files_at_head(repo_path: str, file_paths: list[str]) -> dict[str, str]:
+    """Read the HEAD content of many files with a single `git cat-file`.
+
+    Args:
+        repo_path: Absolute path to the git repository
+        file_paths: Paths relative to the repo root
+
+    Returns:
+        Dictionary mapping each readable path to its content; missing files
+        and binary content that is not valid UTF-8 are skipped
+
+    Raises:
+        subprocess.CalledProcessError: If the git command fails
+    """
+    if not file_paths:
+        return {}
+
+    result = run_traced(
+        ["git", "-C", repo_path, "cat-file", "--batch"],
+        input="".join(f"HEAD:{path}\n" for path in file_paths).encode(),
+        capture_output=True,
+        check=True,
+    )
+
+    contents: dict[str, str] = {}
+    output = result.stdout
+    pos = 0
+    for path in file_paths:
+        header_end = output.index(b"\n", pos)
+        header = output[pos:header_end]
+        pos = header_end + 1
+
+        # "<object> missing" for paths that do not exist at HEAD
+        if header.endswith(b" missing"):
+            continue
+
+        _, object_type, size_str = header.split()
+        size = int(size_str)
+        data = output[pos : pos + size]
+        pos += size + 1
+
+        if object_type == b"blob":
+            try:
+                contents[path] = data.decode()
+            except UnicodeDecodeError:
+                continue
+
+    return contents
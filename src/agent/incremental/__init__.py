@@ -0,0 +1,14 @@
+"""Incremental re-review of commits pushed since a previous review."""
+
+from .helpers import load_previous_issues
+from .runner import IncrementalReviewResult, run_incremental_review
+from .schema import IncrementalReviewOutput, IssueStatus, TrackedReviewIssue
+
+__all__ = [
+    "IncrementalReviewOutput",
+    "IncrementalReviewResult",
+    "IssueStatus",
+    "TrackedReviewIssue",
+    "load_previous_issues",
+    "run_incremental_review",
+]
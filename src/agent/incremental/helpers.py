@@ -0,0 +1,106 @@
+"""Helper functions for incremental re-review."""
+
+from __future__ import annotations
+
+import json
+
+from ..dedup import deduplicate_issues
+from ..schema import ReviewIssue
+from .schema import (
+    IncrementalReviewResponse,
+    IssueStatus,
+    PriorIssueStatus,
+    TrackedReviewIssue,
+)
+
+
+def load_previous_issues(raw_output: str) -> list[ReviewIssue]:
+    """Load still-relevant issues from a previous JSON review output.
+
+    Accepts primary, verified and incremental outputs. Issues an earlier
+    incremental review already marked RESOLVED are dropped.
+
+    Args:
+        raw_output: Contents of a previous `--json` review file
+
+    Returns:
+        List of issues to carry into the incremental review
+
+    Raises:
+        ValueError: If the content is not a review JSON output
+    """
+    data = json.loads(raw_output)
+    if not isinstance(data, dict) or not isinstance(data.get("issues"), list):
+        raise ValueError("Previous review must be a JSON review output")
+
+    return [
+        ReviewIssue.model_validate(issue)
+        for issue in data["issues"]
+        if issue.get("status") != IssueStatus.RESOLVED.value
+    ]
+
+
+def format_previous_issues(issues: list[ReviewIssue]) -> str:
+    """Format previously reported issues with IDs for the review context.
+
+    Args:
+        issues: Issues from the previous review
+
+    Returns:
+        Markdown section listing each issue with its 1-based ID
+    """
+    if not issues:
+        return "## Previously Reported Issues\n\nNone."
+
+    parts = ["## Previously Reported Issues"]
+    for idx, issue in enumerate(issues, 1):
+        locations = ", ".join(
+            loc.filename + (f":{loc.line}" if loc.line else "")
+            for loc in issue.location
+        )
+        parts.append(
+            f"### Issue {idx}: {issue.title}\n"
+            f"- Category: {issue.category.value}\n"
+            f"- Severity: {issue.severity.value}\n"
+            f"- Location: {locations}\n\n"
+            f"{issue.explanation}"
+        )
+
+    return "\n\n".join(parts)
+
+
+def merge_incremental_results(
+    previous_issues: list[ReviewIssue],
+    response: IncrementalReviewResponse,
+) -> list[TrackedReviewIssue]:
+    """Merge prior issue statuses and new issues into a single list.
+
+    Prior issues the agent did not assess (or assessed with a hallucinated ID)
+    stay OPEN: nothing in the new commits was shown to fix them.
+
+    Args:
+        previous_issues: Issues from the previous review, in ID order
+        response: Structured output of the incremental review agent
+
+    Returns:
+        Prior issues (OPEN or RESOLVED) in original order, then NEW issues
+    """
+    status_by_id: dict[int, PriorIssueStatus] = {
+        s.issue_id: s for s in response.prior_issues if s.status != IssueStatus.NEW
+    }
+
+    merged: list[TrackedReviewIssue] = []
+    for idx, issue in enumerate(previous_issues, 1):
+        assessment = status_by_id.get(idx)
+        merged.append(
+            TrackedReviewIssue(
+                **issue.model_dump(),
+                status=assessment.status if assessment else IssueStatus.OPEN,
+                status_rationale=assessment.rationale if assessment else None,
+            )
+        )
+
+    for issue in deduplicate_issues(response.new_issues):
+        merged.append(TrackedReviewIssue(**issue.model_dump(), status=IssueStatus.NEW))
+
+    return merged
@@ -0,0 +1,122 @@
+"""Orchestration for incremental re-review."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from ..agent import create_review_agent
+from ..checkpointer import get_checkpointer, new_run_id
+from ..formatting import build_review_context
+from ..git_utils import FileChange
+from ..progress_callback_handler import ProgressCallbackHandler
+from ..prompts import build_review_system_prompt, get_prompt
+from ..schema import Context, ReviewIssue
+from ..token_usage import TokenUsage
+from ..token_usage_callback_handler import TokenUsageCallbackHandler
+from ..tracing import traced
+from .helpers import format_previous_issues, merge_incremental_results
+from .schema import IncrementalReviewOutput, IncrementalReviewResponse
+
+
+@dataclass
+class IncrementalReviewResult:
+    """Result from run_incremental_review."""
+
+    output: IncrementalReviewOutput
+    token_usage: TokenUsage | None
+
+
+@traced("incremental review")
+def run_incremental_review(
+    repo_path: str,
+    previous_head: str,
+    changed_files: list[FileChange],
+    previous_issues: list[ReviewIssue],
+    show_progress: bool = True,
+    additional_instructions: str | None = None,
+    sast_findings: str | None = None,
+) -> IncrementalReviewResult:
+    """Review only the commits since `previous_head` and merge prior issues.
+
+    The diff context covers `previous_head...HEAD`, so review cost scales with
+    the push rather than the whole branch. Prior issues are supplied with IDs
+    and come back marked OPEN or RESOLVED; issues found in the new commits are
+    marked NEW.
+
+    Args:
+        repo_path: Path to the git repository
+        previous_head: HEAD commit SHA of the previous review
+        changed_files: Files changed between previous_head and HEAD
+        previous_issues: Issues reported by the previous review
+        show_progress: Whether to show progress messages
+        additional_instructions: Optional additional review guidelines
+        sast_findings: Optional trimmed SAST findings JSON to include in context
+
+    Returns:
+        IncrementalReviewResult with the merged output and token usage
+    """
+    context = Context(repo_path=repo_path, target_branch=previous_head)
+
+    user_message = "\n\n".join(
+        [
+            build_review_context(
+                repo_path, previous_head, changed_files, sast_findings
+            ),
+            format_previous_issues(previous_issues),
+        ]
+    )
+
+    system_prompt = (
+        build_review_system_prompt(
+            additional_instructions,
+            include_sast_guidance=sast_findings is not None,
+        )
+        + "\n\n"
+        + get_prompt("incremental_review")
+    )
+
+    agent, _ = create_review_agent(
+        repo_path=repo_path,
+        system_prompt=system_prompt,
+        response_format=IncrementalReviewResponse,
+    )
+
+    usage_handler = TokenUsageCallbackHandler(stage="review")
+    callbacks: list[BaseCallbackHandler] = [usage_handler]
+    if show_progress:
+        callbacks.append(ProgressCallbackHandler())
+
+    run_id = new_run_id()
+    config: dict[str, Any] = {
+        "configurable": {"thread_id": run_id},
+        "callbacks": callbacks,
+    }
+
+    response = agent.invoke(
+        {"messages": [{"role": "user", "content": user_message}]},
+        config=config,
+        context=context,
+    )
+
+    token_usage = usage_handler.token_usage() or TokenUsage.from_response(
+        response, stage="review"
+    )
+
+    if "structured_response" not in response:
+        raise ValueError("Incremental review agent did not return structured output")
+
+    checkpointer = get_checkpointer()
+    if checkpointer is not None:
+        checkpointer.delete_thread(run_id)
+
+    result: IncrementalReviewResponse = response["structured_response"]
+    return IncrementalReviewResult(
+        output=IncrementalReviewOutput(
+            description=result.description,
+            issues=merge_incremental_results(previous_issues, result),
+        ),
+        token_usage=token_usage,
+    )
@@ -0,0 +1,62 @@
+"""Pydantic models for incremental re-review."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from ..schema import ReviewIssue
+
+
+class IssueStatus(str, Enum):
+    """Status of an issue relative to the previous review."""
+
+    NEW = "NEW"
+    OPEN = "OPEN"
+    RESOLVED = "RESOLVED"
+
+
+class PriorIssueStatus(BaseModel):
+    """Assessment of a previously reported issue against the new commits."""
+
+    issue_id: int = Field(description="ID of the previously reported issue")
+    status: IssueStatus = Field(
+        description="OPEN if the issue still applies, RESOLVED if the new commits fix it"
+    )
+    rationale: str = Field(description="Brief explanation of the status")
+
+
+class IncrementalReviewResponse(BaseModel):
+    """Structured output from the incremental review agent."""
+
+    description: str = Field(
+        description="High-level summary of the new commits in markdown format"
+    )
+    prior_issues: list[PriorIssueStatus] = Field(
+        default_factory=list,
+        description="Status of each previously reported issue",
+    )
+    new_issues: list[ReviewIssue] = Field(
+        default_factory=list,
+        description="Issues introduced by the new commits, ordered by severity",
+    )
+
+
+class TrackedReviewIssue(ReviewIssue):
+    """Review issue with its status relative to the previous review."""
+
+    status: IssueStatus = Field(description="NEW, OPEN or RESOLVED")
+    status_rationale: str | None = Field(
+        default=None, description="Why a prior issue is considered open or resolved"
+    )
+
+
+class IncrementalReviewOutput(BaseModel):
+    """Merged output of an incremental review."""
+
+    description: str = Field(description="Summary of the new commits")
+    issues: list[TrackedReviewIssue] = Field(
+        default_factory=list,
+        description="Prior issues marked OPEN or RESOLVED, followed by NEW issues",
+    )
@@ -3,16 +3,25 @@
 from typing import Any
 
 from langchain.agents.middleware import AgentMiddleware
-from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
 
-from ...config import MODEL_PROVIDER
+from ...config import AGENT_TIME_BUDGET, AGENT_TOKEN_BUDGET, MODEL_PROVIDER
+from ..tracing import get_trace_recorder
+from .budget_guard import BudgetExceeded, BudgetGuard
+from .rate_limit import RateLimiter, RateLimitMiddleware, get_rate_limiter
 from .recursion_guard import RecursionGuard, ToolCallLimitExceeded
 from .summarizing_middleware import SummarizingMiddleware
+from .tracing_middleware import TracingMiddleware
 
 __all__ = [
+    "BudgetExceeded",
+    "BudgetGuard",
+    "RateLimitMiddleware",
+    "RateLimiter",
     "RecursionGuard",
     "SummarizingMiddleware",
     "ToolCallLimitExceeded",
+    "TracingMiddleware",
+    "get_rate_limiter",
     "init_agent_middleware",
 ]
 
@@ -36,12 +45,22 @@ def init_agent_middleware(
     # Always include RecursionGuard
     middleware.append(RecursionGuard())
 
+    # Add BudgetGuard when a time or token budget is set
+    if AGENT_TIME_BUDGET > 0 or AGENT_TOKEN_BUDGET > 0:
+        middleware.append(BudgetGuard())
+
+    # Always include RateLimitMiddleware (shared limits, throttling retries)
+    middleware.append(RateLimitMiddleware())
+
     # Add SummarizingMiddleware if requested
     if include_summarizing:
         middleware.append(SummarizingMiddleware())
 
     # Add AnthropicPromptCachingMiddleware only for Anthropic provider
     if MODEL_PROVIDER == "anthropic":
+        # Imported here so other providers never load langchain_anthropic
+        from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
+
         middleware.append(
             AnthropicPromptCachingMiddleware(
                 ttl="5m",
@@ -49,4 +68,8 @@ def init_agent_middleware(
             )
         )
 
+    # Innermost, so spans time the model and tool calls themselves
+    if get_trace_recorder() is not None:
+        middleware.append(TracingMiddleware())
+
     return middleware
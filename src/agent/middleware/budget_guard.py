@@ -0,0 +1,112 @@
+import time
+from typing import Any, Callable
+
+from langchain.agents import AgentState
+from langchain.agents.middleware import AgentMiddleware
+from langchain.agents.middleware.types import (
+    ModelCallResult,
+    ModelRequest,
+    ModelResponse,
+)
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.runtime import Runtime
+
+from ...config import AGENT_TIME_BUDGET, AGENT_TOKEN_BUDGET
+from ..prompts import get_prompt
+from ..schema import Context
+from ..token_usage import normalized_usage
+
+# Share of a budget after which the agent is asked for its final output
+BUDGET_WARN_RATIO = 0.8
+
+
+class BudgetExceeded(Exception):
+    """Raised when the agent keeps going after being forced to finish."""
+
+
+class BudgetGuard(AgentMiddleware[AgentState[Any], Context]):
+    """Middleware that forces final output before a time or token budget runs out.
+
+    Tracks wall-clock time since the agent run started and the input plus
+    output tokens of its model calls against AGENT_TIME_BUDGET and
+    AGENT_TOKEN_BUDGET (0 disables a budget). Once BUDGET_WARN_RATIO of
+    either is used, injects the last_step prompt. If the model makes more
+    tool calls anyway, the next model call is sent without tools, so only
+    the structured output can be returned; if that still does not end the
+    run, raises BudgetExceeded.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.time_budget = AGENT_TIME_BUDGET
+        self.token_budget = AGENT_TOKEN_BUDGET
+        self.tokens = 0
+        self.warned = False
+        self.forced = False
+        self._start = time.monotonic()
+
+    def budget_used(self) -> float:
+        """Largest share of the time or token budget used so far."""
+        used = 0.0
+        if self.time_budget > 0:
+            used = (time.monotonic() - self._start) / self.time_budget
+        if self.token_budget > 0:
+            used = max(used, self.tokens / self.token_budget)
+        return used
+
+    def before_agent(
+        self, state: AgentState[Any], runtime: Runtime[Context]
+    ) -> dict[str, Any] | None:
+        """Start the clock when the agent run starts."""
+        self._start = time.monotonic()
+        return None
+
+    def before_model(
+        self, state: AgentState[Any], runtime: Runtime[Context]
+    ) -> dict[str, Any] | None:
+        """Inject the final step warning, then withhold tools, then stop."""
+        if self.forced:
+            raise BudgetExceeded(
+                f"Agent did not return final output within its budget "
+                f"({self.budget_used():.0%} used)."
+            )
+
+        # Warned and the model made tool calls anyway → final call without tools
+        if self.warned:
+            print("⚠️  Budget warning ignored - withholding tools")
+            self.forced = True
+            return None
+
+        if self.budget_used() >= BUDGET_WARN_RATIO:
+            print(
+                f"⚠️  {self.budget_used():.0%} of the review budget used - "
+                f"forcing final output"
+            )
+            self.warned = True
+            return {
+                "messages": [
+                    HumanMessage(content=get_prompt("last_step")),
+                ],
+            }
+
+        return None
+
+    def after_model(
+        self, state: AgentState[Any], runtime: Runtime[Context]
+    ) -> dict[str, Any] | None:
+        """Add the tokens of the model call (cached input included) to the total."""
+        message = state["messages"][-1]  # type: ignore[index]
+        usage = normalized_usage(message) if isinstance(message, AIMessage) else None
+        if usage:
+            self.tokens += usage["total_tokens"]
+        return None
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Leave only the structured output tool once output is forced."""
+        if self.forced:
+            request = request.override(tools=[])
+        return handler(request)
@@ -0,0 +1,223 @@
+"""Shared request and token rate limits for model calls.
+
+Every agent built with init_agent_middleware() sends its model calls through
+RateLimitMiddleware, so concurrent reviews, shards and verification groups
+in one process draw from the same per-model budget of RATE_LIMIT_RPM
+requests and RATE_LIMIT_TPM tokens per minute. Throttling errors are retried
+with jittered exponential backoff, and pause all callers of the model.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable
+
+from langchain.agents import AgentState
+from langchain.agents.middleware import AgentMiddleware
+from langchain.agents.middleware.types import (
+    ModelCallResult,
+    ModelRequest,
+    ModelResponse,
+)
+from langchain_core.messages import AIMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from ...config import RATE_LIMIT_MAX_RETRIES, RATE_LIMIT_RPM, RATE_LIMIT_TPM
+from ..schema import Context
+from ..token_usage import normalized_usage
+
+# Backoff after the n-th throttling error is uniform in
+# [0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**n)]
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Error codes and names providers use for throttling
+_THROTTLING_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+}
+_THROTTLING_NAMES = ("ratelimit", "throttl", "toomanyrequests", "overloaded")
+
+
+class TokenBucket:
+    """Token bucket refilled at `per_minute` per minute, up to `per_minute`.
+
+    Callers reserve what they need up front and wait until the bucket has
+    refilled enough, so waiting callers are served in order and the long-run
+    rate never exceeds the limit.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self._level = per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` and return the seconds until it is available."""
+        self._refill(now)
+        self._level -= amount
+        return max(-self._level / self.rate, 0.0)
+
+    def adjust(self, amount: float, now: float) -> None:
+        """Take (positive) or return (negative) tokens without waiting."""
+        self._refill(now)
+        self._level -= amount
+
+
+class RateLimiter:
+    """Requests and tokens per minute of one model, shared by all its callers.
+
+    Args:
+        requests_per_minute: Request limit (0 = unlimited)
+        tokens_per_minute: Input plus output token limit (0 = unlimited)
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        self._lock = threading.Lock()
+        self._requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._paused_until = 0.0
+
+    def acquire(self, tokens: int) -> float:
+        """Wait until a request of about `tokens` tokens may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._paused_until - now, 0.0)
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the call reports its real usage."""
+        if self._tokens is None:
+            return
+        with self._lock:
+            self._tokens.adjust(actual - estimated, time.monotonic())
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` (after a throttling error)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_name: str) -> RateLimiter:
+    """Return the process-wide limiter of a model (quotas are per model)."""
+    with _limiters_lock:
+        limiter = _limiters.get(model_name)
+        if limiter is None:
+            limiter = _limiters[model_name] = RateLimiter(
+                RATE_LIMIT_RPM, RATE_LIMIT_TPM
+            )
+        return limiter
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether a provider error means the request was rate limited.
+
+    Covers botocore ClientErrors (Bedrock), HTTP 429/529 status errors
+    (Anthropic, OpenAI-compatible, httpx) and exceptions named after rate
+    limits.
+    """
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code")
+        if code in _THROTTLING_CODES:
+            return True
+
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    if status in (429, 529):
+        return True
+
+    name = type(error).__name__.lower()
+    return any(fragment in name for fragment in _THROTTLING_NAMES)
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Jittered delay before retry number `attempt` (0-based)."""
+    return random.uniform(
+        0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+    )
+
+
+def _model_name(model: Any) -> str:
+    return str(
+        getattr(model, "model_id", None)
+        or getattr(model, "model", None)
+        or getattr(model, "model_name", None)
+        or type(model).__name__
+    )
+
+
+class RateLimitMiddleware(AgentMiddleware[AgentState[Any], Context]):
+    """Middleware throttling model calls and retrying throttled ones.
+
+    Before each call, waits for the model's shared RateLimiter using an
+    estimate of the prompt tokens; afterwards settles the estimate against
+    the reported usage. Throttling errors are retried up to
+    RATE_LIMIT_MAX_RETRIES times with jittered exponential backoff; each
+    failed attempt returns its token reservation.
+
+    These retries come on top of the provider SDK's own (botocore
+    max_attempts, the Anthropic and OpenAI clients' max_retries), which also
+    cover connection errors and are left enabled.
+    """
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Send the call when the limits allow, retrying on throttling."""
+        limiter = get_rate_limiter(_model_name(request.model))
+        prompt = [request.system_message] if request.system_message else []
+        estimated = count_tokens_approximately(prompt + list(request.messages))
+
+        attempt = 0
+        while True:
+            limiter.acquire(estimated)
+            try:
+                response = handler(request)
+                break
+            except Exception as e:
+                # A failed call used no tokens; the retry reserves them again
+                limiter.settle(estimated, 0)
+                if not is_throttling_error(e) or attempt >= RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = backoff_seconds(attempt)
+                attempt += 1
+                print(
+                    f"⏳ Rate limited ({type(e).__name__}), retry {attempt}/"
+                    f"{RATE_LIMIT_MAX_RETRIES} in {delay:.1f}s"
+                )
+                limiter.pause(delay)
+
+        message = next((m for m in response.result if isinstance(m, AIMessage)), None)
+        # Cached input included: Bedrock leaves it out of input_tokens
+        usage = normalized_usage(message) if message is not None else None
+        if usage:
+            limiter.settle(estimated, usage["total_tokens"])
+        return response
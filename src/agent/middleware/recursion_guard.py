@@ -1,8 +1,8 @@
-from typing import Any
+from typing import Any, Sequence
 
 from langchain.agents import AgentState
 from langchain.agents.middleware import AgentMiddleware
-from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage
 from langgraph.runtime import Runtime
 
 from ...config import TOOL_CALL_LIMIT
@@ -20,17 +20,46 @@ class RecursionGuard(AgentMiddleware[AgentState[Any], Context]):
     Counts ToolMessage instances in the message history. When the count reaches
     TOOL_CALL_LIMIT, injects a warning message. If the model continues making
     tool calls after the warning, raises ToolCallLimitExceeded.
+
+    The count is kept incrementally: each step only scans the messages added
+    since the previous one, unless the history was rewritten (compaction).
     """
 
     def __init__(self) -> None:
         super().__init__()
         self.warned_at_count: int | None = None
+        self._tool_count = 0
+        self._scanned = 0
+        self._last_scanned: BaseMessage | None = None
+
+    def _count_tool_messages(self, messages: Sequence[BaseMessage]) -> int:
+        """Number of ToolMessages in the history, scanning only new messages."""
+        last = self._last_scanned
+        appended = (
+            last is not None
+            and len(messages) >= self._scanned
+            and (
+                messages[self._scanned - 1] is last
+                or (last.id is not None and messages[self._scanned - 1].id == last.id)
+            )
+        )
+        if not appended:
+            self._tool_count = 0
+            self._scanned = 0
+
+        self._tool_count += sum(
+            1 for m in messages[self._scanned :] if isinstance(m, ToolMessage)
+        )
+        self._scanned = len(messages)
+        self._last_scanned = messages[-1] if messages else None
+        return self._tool_count
 
     def before_model(
         self, state: AgentState[Any], runtime: Runtime[Context]
     ) -> dict[str, Any] | None:
         """Inject warning or raise exception based on tool call count."""
-        tool_count = sum(1 for m in state["messages"] if isinstance(m, ToolMessage))
+        messages = state["messages"]  # type: ignore[index]
+        tool_count = self._count_tool_messages(messages)
 
         # Already warned and model made more tool calls → hard stop
         if self.warned_at_count is not None and tool_count > self.warned_at_count:
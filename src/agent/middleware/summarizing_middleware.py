@@ -1,11 +1,14 @@
-from typing import Any
+from typing import Any, Sequence
 
 from langchain.agents import AgentState
 from langchain.agents.middleware import AgentMiddleware
 from langchain_core.messages import (
     AIMessage,
+    BaseMessage,
     HumanMessage,
     RemoveMessage,
+    ToolCall,
+    ToolMessage,
 )
 from langchain_core.messages.utils import count_tokens_approximately
 from langgraph.runtime import Runtime
@@ -13,20 +16,63 @@ from langgraph.runtime import Runtime
 from ...config import CONTEXT_COMPACT_THRESHOLD
 from ..prompts import get_prompt
 from ..schema import Context
+from .token_counter import MessageTokenCounter
+
+# Eviction frees context down to this share of the threshold, so the next
+# steps do not each evict one more result (and move the cache breakpoint)
+EVICTION_TARGET_RATIO = 0.75
+
+
+def _evicted_stub(message: ToolMessage, call: ToolCall | None) -> str:
+    """Short replacement for an evicted tool result."""
+    name = message.name or (call["name"] if call else "tool")
+    args = " ".join(str(value) for value in call["args"].values()) if call else ""
+    return f"[{name} {args}".rstrip() + ": output evicted, call again if needed]"
 
 
 class SummarizingMiddleware(AgentMiddleware[AgentState[Any], Context]):
+    """Keeps the conversation under CONTEXT_COMPACT_THRESHOLD tokens.
+
+    The first tier evicts tool results the model has already seen, oldest
+    first: their content is replaced with a short stub, keeping message IDs,
+    structure and the prompt prefix before the first evicted result. Only when
+    eviction cannot get under the threshold is the model asked to summarize,
+    after which every message but the first is replaced with the summary.
+    """
+
     def __init__(self) -> None:
         super().__init__()
         self.summary_requested = False
+        self.token_counter = MessageTokenCounter()
 
     def before_model(
         self, state: AgentState[Any], runtime: Runtime[Context]
     ) -> dict[str, Any] | None:
         messages = state["messages"]  # type: ignore[index]
-        total_tokens = count_tokens_approximately(messages)
+        total_tokens = self.token_counter.count(messages)
+        if total_tokens <= CONTEXT_COMPACT_THRESHOLD:
+            return None
+
+        evictions = self._plan_eviction(
+            messages,
+            total_tokens - int(CONTEXT_COMPACT_THRESHOLD * EVICTION_TARGET_RATIO),
+        )
+        saved = sum(saving for _, _, saving in evictions)
+        if evictions and total_tokens - saved <= CONTEXT_COMPACT_THRESHOLD:
+            print(f"🔄 Context eviction triggered:")
+            print(f"   Total tokens: ~{total_tokens:,}")
+            print(f"   Evicting {len(evictions)} tool results (~{saved:,} tokens)")
+            return {"messages": self._evict(evictions)}
+
+        # Compaction keeps the first message and replays the last tool calls,
+        # so it needs a tool call to replay and cannot help when the first
+        # message alone is over the threshold (it would repeat every step)
+        can_compact = (
+            any(isinstance(m, AIMessage) and m.tool_calls for m in reversed(messages))
+            and self.token_counter.estimate(messages[0]) < CONTEXT_COMPACT_THRESHOLD
+        )
 
-        if total_tokens > CONTEXT_COMPACT_THRESHOLD:
+        if can_compact:
             print(f"🔄 Context compaction triggered:")
             print(f"   Total tokens: ~{total_tokens:,}")
             print(f"   Injecting summarization request...")
@@ -39,7 +85,68 @@ class SummarizingMiddleware(AgentMiddleware[AgentState[Any], Context]):
                 ],
             }
 
-        return None
+        # Eviction alone still helps when summarizing is not possible
+        return {"messages": self._evict(evictions)} if evictions else None
+
+    def _plan_eviction(
+        self, messages: Sequence[BaseMessage], tokens_to_free: int
+    ) -> list[tuple[ToolMessage, ToolMessage, int]]:
+        """Pick the oldest seen tool results to stub out.
+
+        Args:
+            messages: Conversation messages in order
+            tokens_to_free: Estimated tokens to free
+
+        Returns:
+            (result, stub, estimated saving) for each result to evict
+        """
+        last_ai = max(
+            (i for i, m in enumerate(messages) if isinstance(m, AIMessage)),
+            default=0,
+        )
+        calls = {
+            call["id"]: call
+            for m in messages[:last_ai]
+            if isinstance(m, AIMessage)
+            for call in m.tool_calls
+        }
+
+        evictions = []
+        saved = 0
+        # Results after the last model response have not been seen yet
+        for message in messages[:last_ai]:
+            if saved >= tokens_to_free:
+                break
+            if (
+                not isinstance(message, ToolMessage)
+                or message.id is None
+                or message.response_metadata.get("evicted")
+            ):
+                continue
+
+            stub = message.model_copy(
+                update={
+                    "content": _evicted_stub(message, calls.get(message.tool_call_id)),
+                    "artifact": None,
+                    "response_metadata": {"evicted": True},
+                }
+            )
+            saving = self.token_counter.estimate(message) - count_tokens_approximately(
+                [stub]
+            )
+            if saving > 0:
+                evictions.append((message, stub, saving))
+                saved += saving
+
+        return evictions
+
+    def _evict(
+        self, evictions: list[tuple[ToolMessage, ToolMessage, int]]
+    ) -> list[BaseMessage]:
+        """Replacement messages for planned evictions (same IDs)."""
+        for message, stub, _ in evictions:
+            self.token_counter.replace(message, stub)
+        return [stub for _, stub, _ in evictions]
 
     def after_model(
         self, state: AgentState[Any], runtime: Runtime[Context]
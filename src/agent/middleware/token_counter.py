@@ -0,0 +1,83 @@
+from typing import Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from ..token_usage import normalized_usage
+
+
+class MessageTokenCounter:
+    """Running token count of an agent conversation.
+
+    The latest model response that carries provider usage anchors the count:
+    its input tokens (cached ones included, see `normalized_usage`) are the
+    exact size of everything before it (system prompt and tool schemas
+    included) and its output tokens its own size, so
+    only the messages after it are estimated. Estimates are cached by message
+    ID, so each message is estimated once however long the conversation runs.
+
+    Messages rewritten in place (see `replace`) make the anchor stale until
+    the next response reports usage; meanwhile the estimated savings of the
+    rewrite are subtracted from it.
+    """
+
+    def __init__(self) -> None:
+        self._estimates: dict[str, int] = {}
+        self._anchor_id: str | None = None
+        self._savings: dict[str, int] = {}
+
+    def estimate(self, message: BaseMessage) -> int:
+        """Approximate tokens of one message, cached by message ID."""
+        if message.id is None:
+            return count_tokens_approximately([message])
+
+        tokens = self._estimates.get(message.id)
+        if tokens is None:
+            tokens = self._estimates[message.id] = count_tokens_approximately([message])
+        return tokens
+
+    def replace(self, old: BaseMessage, new: BaseMessage) -> int:
+        """Account for a message rewritten in place (same ID).
+
+        Args:
+            old: Message as the last anchoring response saw it
+            new: Message replacing it
+
+        Returns:
+            Estimated tokens saved by the rewrite
+        """
+        saving = self.estimate(old) - count_tokens_approximately([new])
+        if new.id is not None:
+            self._estimates.pop(new.id, None)
+            self._savings[new.id] = self._savings.get(new.id, 0) + saving
+        return saving
+
+    def count(self, messages: Sequence[BaseMessage]) -> int:
+        """Tokens of the conversation, exact up to the last reported usage.
+
+        Args:
+            messages: Conversation messages in order
+
+        Returns:
+            Token count of the messages
+        """
+        estimated = 0
+        estimated_ids = set()
+        for message in reversed(messages):
+            usage = (
+                normalized_usage(message) if isinstance(message, AIMessage) else None
+            )
+            if usage:
+                # A newer response already saw the rewritten messages
+                if message.id != self._anchor_id:
+                    self._anchor_id = message.id
+                    self._savings.clear()
+                saved = sum(
+                    tokens
+                    for message_id, tokens in self._savings.items()
+                    if message_id not in estimated_ids
+                )
+                return usage["total_tokens"] + estimated - saved
+            estimated += self.estimate(message)
+            estimated_ids.add(message.id)
+        return estimated
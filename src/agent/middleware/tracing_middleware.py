@@ -0,0 +1,73 @@
+from typing import Any, Callable
+
+from langchain.agents import AgentState
+from langchain.agents.middleware import AgentMiddleware
+from langchain.agents.middleware.types import (
+    ModelCallResult,
+    ModelRequest,
+    ModelResponse,
+    ToolCallRequest,
+)
+from langchain_core.messages import AIMessage, ToolMessage
+from langgraph.types import Command
+
+from ..schema import Context
+from ..tracing import trace_span
+
+
+class TracingMiddleware(AgentMiddleware[AgentState[Any], Context]):
+    """Middleware recording a trace span per model call and per tool call.
+
+    Only added by init_agent_middleware() while tracing is enabled.
+    """
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Time the model call and attach its token usage to the span."""
+        model = request.model
+        model_name = (
+            getattr(model, "model_id", None)
+            or getattr(model, "model", None)
+            or getattr(model, "model_name", None)
+            or type(model).__name__
+        )
+
+        with trace_span(
+            "llm", "llm", model=str(model_name), messages=len(request.messages)
+        ) as span_args:
+            response = handler(request)
+
+            message = next(
+                (m for m in response.result if isinstance(m, AIMessage)), None
+            )
+            usage = message.usage_metadata if message is not None else None
+            if usage:
+                details = usage.get("input_token_details") or {}
+                span_args["input_tokens"] = usage.get("input_tokens", 0)
+                span_args["output_tokens"] = usage.get("output_tokens", 0)
+                span_args["cache_read_tokens"] = details.get("cache_read") or 0
+                span_args["cache_creation_tokens"] = details.get("cache_creation") or 0
+            if message is not None and message.tool_calls:
+                span_args["tool_calls"] = [c["name"] for c in message.tool_calls]
+
+            return response
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command[Any]],
+    ) -> ToolMessage | Command[Any]:
+        """Time the tool call with a summary of its arguments."""
+        tool_call = request.tool_call
+
+        with trace_span(
+            f"tool {tool_call['name']}", "tool", args=tool_call.get("args", {})
+        ) as span_args:
+            result = handler(request)
+            if isinstance(result, ToolMessage):
+                span_args["result_chars"] = len(str(result.content))
+                span_args["status"] = result.status
+            return result
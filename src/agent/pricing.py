@@ -0,0 +1,107 @@
+"""Model pricing table for cost estimates."""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from ..config import MODEL_PRICING_FILE
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """USD price per million tokens.
+
+    Attributes:
+        input: Uncached input tokens
+        output: Output tokens
+        cache_read: Input tokens read from the provider cache
+        cache_write: Input tokens written to the provider cache
+    """
+
+    input: float
+    output: float
+    cache_read: float = 0.0
+    cache_write: float = 0.0
+
+
+# Keyed by a substring of the model identifier, so Bedrock IDs such as
+# "us.anthropic.claude-opus-4-5-20251101-v1:0" match their base model.
+# The longest matching key wins.
+DEFAULT_PRICING: dict[str, ModelPricing] = {
+    "claude-opus-4-5": ModelPricing(5.0, 25.0, 0.5, 6.25),
+    "claude-opus-4": ModelPricing(15.0, 75.0, 1.5, 18.75),
+    "claude-sonnet-4": ModelPricing(3.0, 15.0, 0.3, 3.75),
+    "claude-3-7-sonnet": ModelPricing(3.0, 15.0, 0.3, 3.75),
+    "claude-haiku-4-5": ModelPricing(1.0, 5.0, 0.1, 1.25),
+    "claude-3-5-haiku": ModelPricing(0.8, 4.0, 0.08, 1.0),
+    "kimi-k2.5": ModelPricing(0.6, 3.0, 0.1, 0.6),
+}
+
+
+@lru_cache(maxsize=1)
+def load_pricing() -> dict[str, ModelPricing]:
+    """Return the pricing table, with MODEL_PRICING_FILE entries applied.
+
+    The file is a JSON object mapping model substrings to
+    `{"input": ..., "output": ..., "cache_read": ..., "cache_write": ...}`
+    prices per million tokens; its entries add to or replace the defaults.
+
+    Returns:
+        Dictionary mapping model substrings to prices
+
+    Raises:
+        ValueError: If the pricing file is not valid
+    """
+    pricing = dict(DEFAULT_PRICING)
+    if not MODEL_PRICING_FILE:
+        return pricing
+
+    try:
+        data = json.loads(Path(MODEL_PRICING_FILE).read_text())
+        for key, prices in data.items():
+            pricing[key] = ModelPricing(**prices)
+    except (OSError, TypeError, AttributeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid MODEL_PRICING_FILE {MODEL_PRICING_FILE}: {e}")
+
+    return pricing
+
+
+def get_pricing(model_name: str) -> ModelPricing | None:
+    """Find the price of a model by the longest matching table key."""
+    matches = [key for key in load_pricing() if key in model_name]
+    if not matches:
+        return None
+    return load_pricing()[max(matches, key=len)]
+
+
+def estimate_cost(
+    model_name: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+) -> float | None:
+    """Estimate the USD cost of one LLM call.
+
+    Args:
+        model_name: Model identifier reported for the call
+        input_tokens: All input tokens, including cached ones
+        output_tokens: Output tokens
+        cache_read_tokens: Input tokens read from the provider cache
+        cache_creation_tokens: Input tokens written to the provider cache
+
+    Returns:
+        Estimated cost in USD, or None if the model has no known price
+    """
+    pricing = get_pricing(model_name)
+    if pricing is None:
+        return None
+
+    uncached = max(input_tokens - cache_read_tokens - cache_creation_tokens, 0)
+    return (
+        uncached * pricing.input
+        + output_tokens * pricing.output
+        + cache_read_tokens * pricing.cache_read
+        + cache_creation_tokens * pricing.cache_write
+    ) / 1_000_000
@@ -1,23 +1,95 @@
-from typing import Any
+import importlib
+import threading
+from typing import Any, Callable
 
 from ...config import (
     MAX_OUTPUT_TOKENS,
     MODEL_NAME,
     MODEL_PROVIDER,
+    validate_provider_config,
 )
-from .anthropic import create_anthropic_model
-from .bedrock import create_bedrock_model
-from .moonshot import create_moonshot_model
-from .ollama import create_ollama_model
+
+
+def _lazy_factory(module: str, name: str) -> Callable[..., Any]:
+    """Return a factory that imports its provider module on first call.
+
+    Provider SDKs (boto3, langchain_aws, langchain_anthropic, ...) take
+    seconds to import, so only the selected provider is ever loaded.
+    """
+
+    def factory(model_name: str, max_tokens: int) -> Any:
+        create = getattr(importlib.import_module(f".{module}", __name__), name)
+        return create(model_name=model_name, max_tokens=max_tokens)
+
+    return factory
+
 
 # Registry mapping provider names to factory functions
-PROVIDER_REGISTRY = {
-    "bedrock": create_bedrock_model,
-    "anthropic": create_anthropic_model,
-    "ollama": create_ollama_model,
-    "moonshot": create_moonshot_model,
+PROVIDER_REGISTRY: dict[str, Callable[..., Any]] = {
+    "bedrock": _lazy_factory("bedrock", "create_bedrock_model"),
+    "anthropic": _lazy_factory("anthropic", "create_anthropic_model"),
+    "ollama": _lazy_factory("ollama", "create_ollama_model"),
+    "moonshot": _lazy_factory("moonshot", "create_moonshot_model"),
+    "replay": _lazy_factory("replay", "create_replay_model"),
 }
 
+# Model instances shared across pipeline stages, keyed by
+# (provider, model_name, max_tokens), so each stage does not rebuild the model
+# and its SDK client. Connections are pooled per provider across models (see
+# http_client.py and get_bedrock_client).
+_model_pool: dict[tuple[str, str, int], Any] = {}
+_model_pool_lock = threading.Lock()
+
+
+def get_model(
+    model_name: str,
+    max_tokens: int = MAX_OUTPUT_TOKENS,
+    provider: str = MODEL_PROVIDER,
+) -> Any:
+    """Return the shared model instance for a provider, model and token limit.
+
+    The instance is created by the provider factory on first use and reused
+    by every later caller (primary review, verification steps, server and
+    batch jobs).
+
+    Args:
+        model_name: Provider-specific model identifier
+        max_tokens: Maximum tokens for model output
+        provider: Provider name from PROVIDER_REGISTRY
+
+    Returns:
+        Configured model instance ready for use with langchain agents.
+
+    Raises:
+        ValueError: If the provider is not supported or its credentials
+            are missing.
+    """
+    key = (provider, model_name, max_tokens)
+
+    with _model_pool_lock:
+        if key not in _model_pool:
+            factory = PROVIDER_REGISTRY.get(provider)
+
+            if factory is None:
+                supported = ", ".join(PROVIDER_REGISTRY.keys())
+                raise ValueError(
+                    f"Unsupported MODEL_PROVIDER: {provider}. "
+                    f"Supported providers: {supported}"
+                )
+
+            if provider == MODEL_PROVIDER:
+                validate_provider_config()
+
+            _model_pool[key] = factory(model_name=model_name, max_tokens=max_tokens)
+
+        return _model_pool[key]
+
+
+def clear_model_pool() -> None:
+    """Drop all shared model instances (the next get_model creates new ones)."""
+    with _model_pool_lock:
+        _model_pool.clear()
+
 
 def create_model() -> Any:
     """Factory function to create model based on MODEL_PROVIDER config.
@@ -28,16 +100,4 @@ def create_model() -> Any:
     Raises:
         ValueError: If MODEL_PROVIDER is not supported.
     """
-    factory = PROVIDER_REGISTRY.get(MODEL_PROVIDER)
-
-    if factory is None:
-        supported = ", ".join(PROVIDER_REGISTRY.keys())
-        raise ValueError(
-            f"Unsupported MODEL_PROVIDER: {MODEL_PROVIDER}. "
-            f"Supported providers: {supported}"
-        )
-
-    return factory(
-        model_name=MODEL_NAME,
-        max_tokens=MAX_OUTPUT_TOKENS,
-    )
+    return get_model(MODEL_NAME, MAX_OUTPUT_TOKENS)
@@ -1,26 +1,54 @@
+from functools import cached_property
 from typing import Any
 
+import anthropic
+import httpx
 from langchain_anthropic import ChatAnthropic
+from pydantic import Field
 
 from ...config import ANTHROPIC_API_KEY
+from .http_client import REQUEST_TIMEOUT_SECONDS, get_http_client
 
 
-def create_anthropic_model(model_name: str, max_tokens: int) -> Any:
+class PooledChatAnthropic(ChatAnthropic):
+    """ChatAnthropic sending requests through a shared httpx client.
+
+    ChatAnthropic builds its own client with default pool limits; this
+    subclass lets every model instance share one tuned connection pool.
+    Without an explicit `http_client` it uses the shared client for
+    `anthropic_proxy` (ANTHROPIC_PROXY); an explicit client brings its own
+    proxy settings.
+    """
+
+    http_client: httpx.Client | None = Field(default=None, exclude=True)
+
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        http_client = self.http_client or get_http_client(self.anthropic_proxy)
+        return anthropic.Client(**self._client_params, http_client=http_client)
+
+
+def create_anthropic_model(
+    model_name: str, max_tokens: int, http_client: httpx.Client | None = None
+) -> Any:
     """Create an Anthropic model with automatic prompt caching.
 
     Args:
         model_name: The Anthropic model identifier
         max_tokens: Maximum tokens for model output
+        http_client: Client requests are sent through (default: the shared
+            client from get_http_client, through ANTHROPIC_PROXY if set)
 
     Returns:
         Configured Anthropic model (caching handled by SDK)
     """
     # Prompt caching is handled automatically by the Anthropic SDK
-    return ChatAnthropic(
+    return PooledChatAnthropic(
         model_name=model_name,
         api_key=ANTHROPIC_API_KEY,
         temperature=0.0,
         max_tokens_to_sample=max_tokens,
-        timeout=180.0,
+        timeout=REQUEST_TIMEOUT_SECONDS,
         stop=[],
+        http_client=http_client,
     )
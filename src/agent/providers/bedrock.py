@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 import boto3
@@ -8,36 +9,64 @@ from ...config import (
     AWS_ACCESS_KEY_ID,
     AWS_REGION_NAME,
     AWS_SECRET_ACCESS_KEY,
+    MODEL_MAX_CONNECTIONS,
 )
 from .bedrock_caching import CachingBedrockClient
+from .http_client import REQUEST_TIMEOUT_SECONDS
 
+_bedrock_client: Any = None
+_bedrock_client_lock = threading.Lock()
 
-def create_bedrock_model(model_name: str, max_tokens: int) -> Any:
+
+def get_bedrock_client() -> Any:
+    """Return the bedrock-runtime client shared by all Bedrock models.
+
+    botocore clients are thread-safe, so one client (and its connection
+    pool) serves the review, triage and verification models alike.
+
+    Returns:
+        boto3 bedrock-runtime client created on first use
+    """
+    global _bedrock_client
+
+    with _bedrock_client_lock:
+        if _bedrock_client is None:
+            _bedrock_client = boto3.client(
+                service_name="bedrock-runtime",
+                region_name=AWS_REGION_NAME,
+                endpoint_url=f"https://bedrock-runtime.{AWS_REGION_NAME}.amazonaws.com",
+                config=Config(
+                    read_timeout=REQUEST_TIMEOUT_SECONDS,
+                    max_pool_connections=MODEL_MAX_CONNECTIONS,
+                    tcp_keepalive=True,
+                    retries={
+                        "max_attempts": 3,
+                    },
+                ),
+                aws_access_key_id=AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+            )
+        return _bedrock_client
+
+
+def create_bedrock_model(
+    model_name: str, max_tokens: int, bedrock_client: Any = None
+) -> Any:
     """Create a Bedrock model with caching support.
 
     Args:
         model_name: The Bedrock model identifier
         max_tokens: Maximum tokens for model output
+        bedrock_client: bedrock-runtime client to send requests through
+            (default: the shared client from get_bedrock_client)
 
     Returns:
         Configured Bedrock model with caching wrapper
     """
-    bedrock_client = boto3.client(
-        service_name="bedrock-runtime",
-        region_name=AWS_REGION_NAME,
-        endpoint_url=f"https://bedrock-runtime.{AWS_REGION_NAME}.amazonaws.com",
-        config=Config(
-            read_timeout=180.0,
-            retries={
-                "max_attempts": 3,
-            },
-        ),
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    caching_bedrock_client = CachingBedrockClient(
+        bedrock_client or get_bedrock_client()
     )
 
-    caching_bedrock_client = CachingBedrockClient(bedrock_client)
-
     return init_chat_model(
         model_name,
         client=caching_bedrock_client,
@@ -0,0 +1,79 @@
+"""Process-wide HTTP client shared by the httpx-based providers.
+
+Anthropic and Moonshot (OpenAI-compatible) models send their requests
+through one `httpx.Client`, so every model instance, shard and verification
+group reuses warm keep-alive connections instead of repeating the TCP and
+TLS handshake. Pool size, keep-alive expiry and HTTP/2 are set by
+MODEL_MAX_CONNECTIONS, MODEL_KEEPALIVE_SECONDS and MODEL_HTTP2. Models sent
+through a proxy (ANTHROPIC_PROXY, OPENAI_PROXY) share one client per proxy.
+"""
+
+import importlib.util
+import threading
+from typing import Any
+
+import httpx
+
+from ...config import MODEL_HTTP2, MODEL_KEEPALIVE_SECONDS, MODEL_MAX_CONNECTIONS
+
+# Read timeout of model requests (responses of long reviews take minutes)
+REQUEST_TIMEOUT_SECONDS = 180.0
+
+_http_clients: dict[str | None, httpx.Client] = {}
+_http_client_lock = threading.Lock()
+
+
+def http_client_kwargs() -> dict[str, Any]:
+    """Connection settings for an `httpx.Client` talking to a model API.
+
+    Returns:
+        Keyword arguments with the pool limits and HTTP/2 flag
+
+    Raises:
+        ValueError: If MODEL_HTTP2 is enabled without the h2 package
+    """
+    if MODEL_HTTP2 and importlib.util.find_spec("h2") is None:
+        raise ValueError(
+            "MODEL_HTTP2=true requires the h2 package: pip install 'httpx[http2]'"
+        )
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=MODEL_MAX_CONNECTIONS,
+            max_keepalive_connections=MODEL_MAX_CONNECTIONS,
+            keepalive_expiry=MODEL_KEEPALIVE_SECONDS,
+        ),
+        "http2": MODEL_HTTP2,
+    }
+
+
+def get_http_client(proxy: str | None = None) -> httpx.Client:
+    """Return the HTTP client shared by all models in the process.
+
+    Args:
+        proxy: Proxy URL the requests go through (None for direct requests)
+
+    Returns:
+        httpx.Client for `proxy`, created with `http_client_kwargs` on first use
+
+    Raises:
+        ValueError: If MODEL_HTTP2 is enabled without the h2 package
+    """
+    with _http_client_lock:
+        client = _http_clients.get(proxy)
+        if client is None:
+            client = _http_clients[proxy] = httpx.Client(
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                follow_redirects=True,
+                proxy=proxy,
+                **http_client_kwargs(),
+            )
+        return client
+
+
+def close_http_client() -> None:
+    """Close the shared clients (the next get_http_client creates new ones)."""
+    with _http_client_lock:
+        for client in _http_clients.values():
+            client.close()
+        _http_clients.clear()
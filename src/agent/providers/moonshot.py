@@ -1,10 +1,13 @@
+import os
 import warnings
 from typing import Any, Sequence
 
+import httpx
 from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
 
 from ...config import MOONSHOT_API_BASE, MOONSHOT_API_KEY
+from .http_client import REQUEST_TIMEOUT_SECONDS, get_http_client
 
 
 class MoonshotChat(ChatOpenAI):
@@ -27,7 +30,9 @@ class MoonshotChat(ChatOpenAI):
         return super().bind_tools(tools, **kwargs)
 
 
-def create_moonshot_model(model_name: str, max_tokens: int) -> Any:
+def create_moonshot_model(
+    model_name: str, max_tokens: int, http_client: httpx.Client | None = None
+) -> Any:
     """Create a Moonshot model for inference.
 
     Uses ChatOpenAI with Moonshot's OpenAI-compatible API for full tool support.
@@ -37,6 +42,8 @@ def create_moonshot_model(model_name: str, max_tokens: int) -> Any:
     Args:
         model_name: The Moonshot model identifier (e.g., "kimi-k2.5")
         max_tokens: Maximum tokens for model output
+        http_client: Client requests are sent through (default: the shared
+            client from get_http_client, through OPENAI_PROXY if set)
 
     Returns:
         Configured Moonshot model
@@ -51,7 +58,11 @@ def create_moonshot_model(model_name: str, max_tokens: int) -> Any:
         temperature=0.6,
         top_p=0.95,
         max_completion_tokens=max_tokens,
-        timeout=180.0,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        # ChatOpenAI rejects openai_proxy next to a client, so the proxy
+        # goes into the client
+        openai_proxy=None,
+        http_client=http_client or get_http_client(os.getenv("OPENAI_PROXY")),
         extra_body={
             "thinking": {
                 "type": "disabled",
@@ -1,13 +1,97 @@
+import json
+import threading
+import warnings
 from typing import Any
 
+from langchain_core.messages import BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain_ollama import ChatOllama
+from pydantic import PrivateAttr
 
-from ...config import OLLAMA_BASE_URL
+from ...config import (
+    OLLAMA_BASE_URL,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MAX_NUM_CTX,
+    OLLAMA_NUM_CTX,
+)
+from .http_client import http_client_kwargs
+
+# Extra room on top of the approximate prompt size (code tokenizes denser
+# than the 4 characters per token estimate)
+CONTEXT_HEADROOM_RATIO = 1.25
+
+
+class SizedChatOllama(ChatOllama):
+    """ChatOllama sizing its context window to the prompts it is sent.
+
+    Ollama silently truncates prompts longer than `num_ctx` and reloads the
+    model whenever `num_ctx` changes, so the window starts at `num_ctx`,
+    doubles when a prompt (plus room for the response) no longer fits, and
+    never shrinks: one instance serves every stage and concurrent agent.
+
+    Attributes:
+        max_num_ctx: Largest window requested; longer prompts are truncated
+    """
+
+    max_num_ctx: int = OLLAMA_MAX_NUM_CTX
+
+    _context_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def context_size(self, prompt_tokens: int) -> int:
+        """Grow the context window to fit a prompt and return it.
+
+        Args:
+            prompt_tokens: Approximate tokens of the prompt
+
+        Returns:
+            Context window to request
+        """
+        needed = int(prompt_tokens * CONTEXT_HEADROOM_RATIO) + (self.num_predict or 0)
+        with self._context_lock:
+            size = self.num_ctx or OLLAMA_NUM_CTX
+            while size < needed and size < self.max_num_ctx:
+                size *= 2
+            size = min(size, max(self.max_num_ctx, self.num_ctx or 0))
+            if size < needed:
+                warnings.warn(
+                    f"Ollama: prompt needs ~{needed} tokens of context, more than "
+                    f"OLLAMA_MAX_NUM_CTX={self.max_num_ctx}; it will be truncated",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            self.num_ctx = size
+            return size
+
+    def _chat_params(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        prompt_tokens = count_tokens_approximately(messages)
+        if kwargs.get("tools"):
+            prompt_tokens += len(json.dumps(kwargs["tools"])) // 4
+        num_ctx = self.context_size(prompt_tokens)
+
+        params = super()._chat_params(messages, stop, **kwargs)
+        params["options"] = {**(params["options"] or {}), "num_ctx": num_ctx}
+        return params
+
+
+def _keep_alive(value: str) -> int | str:
+    """OLLAMA_KEEP_ALIVE as sent to Ollama (plain numbers are seconds)."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
 
 
 def create_ollama_model(model_name: str, max_tokens: int) -> Any:
     """Create an Ollama model for local inference.
 
+    The Ollama SDK creates its own httpx client bound to the server URL, so
+    it gets the shared pool limits rather than the shared client.
+
     Args:
         model_name: The Ollama model identifier (e.g., "devstral-small-2:24b-cloud")
         max_tokens: Maximum tokens for model output
@@ -15,9 +99,12 @@ def create_ollama_model(model_name: str, max_tokens: int) -> Any:
     Returns:
         Configured Ollama model
     """
-    return ChatOllama(
+    return SizedChatOllama(
         model=model_name,
         base_url=OLLAMA_BASE_URL,
         temperature=0.0,
         num_predict=max_tokens,
+        num_ctx=OLLAMA_NUM_CTX,
+        keep_alive=_keep_alive(OLLAMA_KEEP_ALIVE),
+        client_kwargs=http_client_kwargs(),
     )
@@ -0,0 +1,327 @@
+"""Record/replay model provider.
+
+With REPLAY_MODE=record every request goes to REPLAY_PROVIDER and is
+appended, with its response, to the REPLAY_CASSETTE file (JSON Lines). With
+REPLAY_MODE=replay the responses are served from the cassette without
+network access, so a real review can be re-run to measure everything except
+the model: tool calls, git, context building and prompt sizes.
+
+Requests are matched on a normalized form of the prompt: message roles,
+text and tool calls, with message IDs, tool call IDs, provider cache markers
+and trailing whitespace removed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Sequence
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict
+
+from ...config import REPLAY_CASSETTE, REPLAY_MODE, REPLAY_PROVIDER
+
+# Characters of context shown around the first difference in mismatch errors
+SNIPPET_LENGTH = 80
+
+
+class CassetteMismatchError(Exception):
+    """Raised when a replayed request has no recorded response."""
+
+
+def _normalize_text(text: str) -> str:
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+def _normalize_content(content: str | list[Any]) -> Any:
+    if isinstance(content, str):
+        return _normalize_text(content)
+
+    blocks: list[Any] = []
+    for block in content:
+        if isinstance(block, str):
+            blocks.append(_normalize_text(block))
+            continue
+        if "cachePoint" in block:
+            continue
+        block = {k: v for k, v in block.items() if k not in ("cache_control", "id")}
+        if isinstance(block.get("text"), str):
+            block["text"] = _normalize_text(block["text"])
+        blocks.append(block)
+
+    # A lone text block is the same prompt as a plain string
+    if len(blocks) == 1 and _is_text_block(blocks[0]):
+        return blocks[0]["text"]
+    return blocks
+
+
+def _is_text_block(block: Any) -> bool:
+    return (
+        isinstance(block, dict)
+        and block.keys() == {"type", "text"}
+        and block["type"] == "text"
+    )
+
+
+def normalize_request(
+    model_name: str, messages: Sequence[BaseMessage], tool_names: list[str]
+) -> dict[str, Any]:
+    """Reduce a model request to the parts that decide the response.
+
+    Args:
+        model_name: Model the request is sent to
+        messages: Prompt messages
+        tool_names: Names of the tools bound to the model
+
+    Returns:
+        JSON-serializable request used to match recordings
+    """
+    normalized = []
+    for message in messages:
+        entry: dict[str, Any] = {
+            "role": message.type,
+            "content": _normalize_content(message.content),
+        }
+        if isinstance(message, AIMessage) and message.tool_calls:
+            entry["tool_calls"] = [
+                {"name": call["name"], "args": call["args"]}
+                for call in message.tool_calls
+            ]
+        normalized.append(entry)
+
+    return {"model": model_name, "tools": tool_names, "messages": normalized}
+
+
+def request_key(request: dict[str, Any]) -> str:
+    """Stable hash of a normalized request."""
+    data = json.dumps(request, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _snippet(text: str, position: int) -> str:
+    start = max(position - SNIPPET_LENGTH // 2, 0)
+    snippet = text[start : start + SNIPPET_LENGTH].replace("\n", "\\n")
+    return ("..." if start else "") + snippet
+
+
+class Cassette:
+    """Recorded requests and responses of one cassette file.
+
+    Args:
+        path: Cassette file (JSON Lines, one interaction per line)
+        mode: "record" to start a new cassette, "replay" to load one
+    """
+
+    def __init__(self, path: str, mode: str) -> None:
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._requests: dict[str, dict[str, Any]] = {}
+        self._responses: dict[str, list[dict[str, Any]]] = {}
+        self._served: dict[str, int] = {}
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            open(path, "w").close()
+            return
+
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                key = interaction["key"]
+                self._requests[key] = interaction["request"]
+                self._responses.setdefault(key, []).append(interaction["response"])
+
+    def record(self, request: dict[str, Any], response: AIMessage) -> None:
+        """Append an interaction to the cassette file."""
+        line = json.dumps(
+            {
+                "key": request_key(request),
+                "request": request,
+                "response": message_to_dict(response),
+            },
+            ensure_ascii=False,
+        )
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+    def replay(self, request: dict[str, Any]) -> AIMessage:
+        """Return the recorded response to a request.
+
+        Identical requests get their recorded responses in order; once those
+        run out the last one is repeated.
+
+        Raises:
+            CassetteMismatchError: If the request was not recorded
+        """
+        key = request_key(request)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise CassetteMismatchError(self._describe_mismatch(request))
+            index = min(self._served.get(key, 0), len(responses) - 1)
+            self._served[key] = index + 1
+
+        message = messages_from_dict([responses[index]])[0]
+        if not isinstance(message, AIMessage):
+            raise CassetteMismatchError("Recorded response is not an AI message")
+        return message
+
+    def _describe_mismatch(self, request: dict[str, Any]) -> str:
+        """Explain how a request differs from the closest recorded one."""
+        messages = request["messages"]
+        header = (
+            f"No recorded response in {self.path} for a {request['model']} "
+            f"request with {len(messages)} messages"
+        )
+        hint = "Re-record with REPLAY_MODE=record if the prompts changed on purpose."
+
+        candidates = [
+            r for r in self._requests.values() if r["model"] == request["model"]
+        ]
+        if not candidates:
+            return f"{header}; the cassette has no requests for this model. {hint}"
+
+        def shared_messages(recorded: dict[str, Any]) -> int:
+            count = 0
+            for a, b in zip(recorded["messages"], messages):
+                if a != b:
+                    break
+                count += 1
+            return count
+
+        closest = max(candidates, key=shared_messages)
+        index = shared_messages(closest)
+        recorded_messages = closest["messages"]
+
+        if index == len(messages) == len(recorded_messages):
+            detail = (
+                f"messages match the closest recording but tools differ: "
+                f"recorded {closest['tools']}, got {request['tools']}"
+            )
+        elif index >= len(recorded_messages):
+            detail = (
+                f"closest recording has {len(recorded_messages)} messages, "
+                f"this request continues with a {messages[index]['role']} message"
+            )
+        elif index >= len(messages):
+            detail = (
+                f"closest recording continues past message {index} "
+                f"with a {recorded_messages[index]['role']} message"
+            )
+        else:
+            recorded = json.dumps(recorded_messages[index], ensure_ascii=False)
+            actual = json.dumps(messages[index], ensure_ascii=False)
+            position = len(os.path.commonprefix([recorded, actual]))
+            detail = (
+                f"message {index} ({messages[index]['role']}) differs from the "
+                f"closest recording at character {position}:\n"
+                f"  recorded: {_snippet(recorded, position)}\n"
+                f"  actual:   {_snippet(actual, position)}"
+            )
+
+        return f"{header}; {detail}\n{hint}"
+
+
+_cassettes: dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str, mode: str) -> Cassette:
+    """Return the cassette for a path, shared by all replay models."""
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None or cassette.mode != mode:
+            cassette = _cassettes[path] = Cassette(path, mode)
+        return cassette
+
+
+class ReplayChatModel(BaseChatModel):
+    """Chat model recording to or replaying from a cassette.
+
+    Attributes:
+        model_name: Model identifier, part of the matched request
+        cassette: Cassette to record to or replay from
+        inner: Real model requests are sent to when recording, None to replay
+        tools: Tools bound with bind_tools()
+        tool_kwargs: Keyword arguments of bind_tools(), passed on to `inner`
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model_name: str
+    cassette: Cassette
+    inner: BaseChatModel | None = None
+    tools: list[Any] = []
+    tool_kwargs: dict[str, Any] = {}
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"model_name": self.model_name}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Any:
+        return self.model_copy(update={"tools": list(tools), "tool_kwargs": kwargs})
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        tool_names = [convert_to_openai_tool(t)["function"]["name"] for t in self.tools]
+        request = normalize_request(self.model_name, messages, tool_names)
+
+        if self.inner is None:
+            message = self.cassette.replay(request)
+        else:
+            model: Any = self.inner
+            if self.tools:
+                model = model.bind_tools(self.tools, **self.tool_kwargs)
+            # No callbacks: the outer call already reports usage and latency
+            message = model.invoke(messages, stop=stop, config={"callbacks": []})
+            self.cassette.record(request, message)
+
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def create_replay_model(model_name: str, max_tokens: int) -> Any:
+    """Create a model recording to or replaying from REPLAY_CASSETTE.
+
+    Args:
+        model_name: Model identifier (of REPLAY_PROVIDER when recording)
+        max_tokens: Maximum tokens for model output (used when recording)
+
+    Returns:
+        ReplayChatModel in REPLAY_MODE
+    """
+    inner = None
+    if REPLAY_MODE == "record":
+        # Imported here: the registry module imports this one lazily
+        from . import PROVIDER_REGISTRY
+
+        inner = PROVIDER_REGISTRY[REPLAY_PROVIDER](
+            model_name=model_name, max_tokens=max_tokens
+        )
+
+    return ReplayChatModel(
+        model_name=model_name,
+        cassette=get_cassette(REPLAY_CASSETTE, REPLAY_MODE),
+        inner=inner,
+    )
@@ -2,15 +2,33 @@ from dataclasses import dataclass
 from typing import Any
 
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage
 
+from ..config import MODEL_NAME
 from .agent import create_review_agent
+from .cache import (
+    CacheStore,
+    FileFragment,
+    build_file_fragments,
+    load_cached_description,
+    load_cached_fragments,
+    save_cached_description,
+    save_fragments,
+)
+from .checkpointer import get_checkpointer, is_durable, new_run_id
+from .dedup import deduplicate_issues
+from .fast_path import build_fast_path_message, read_surrounding_code, use_fast_path
 from .formatting import build_review_context
 from .git_utils import FileChange
 from .progress_callback_handler import ProgressCallbackHandler
 from .prompts import build_review_system_prompt
-from .schema import Context, PrimaryReviewOutput
+from .schema import Context, PrimaryReviewOutput, ReviewIssue
 from .token_usage import TokenUsage
+from .token_usage_callback_handler import TokenUsageCallbackHandler
 from .tools import FileContext
+from .tools.read_file_part import _read_file_impl
+from .tools.search_in_files import _search_impl
+from .tracing import traced
 
 
 @dataclass
@@ -22,8 +40,10 @@ class ReviewResult:
     file_context: FileContext
     user_message: str
     system_prompt: str
+    run_id: str
 
 
+@traced("review")
 def run_review(
     repo_path: str,
     target_branch: str,
@@ -31,6 +51,10 @@ def run_review(
     show_progress: bool = True,
     additional_instructions: str | None = None,
     sast_findings: str | None = None,
+    run_id: str | None = None,
+    resume: bool = False,
+    fragment_cache: CacheStore | None = None,
+    model_name: str = MODEL_NAME,
 ) -> ReviewResult:
     """Run the code review agent and return structured output.
 
@@ -41,58 +65,145 @@ def run_review(
         show_progress: Whether to show progress messages
         additional_instructions: Optional additional review guidelines
         sast_findings: Optional trimmed SAST findings JSON to include in context
+        run_id: Run ID used as the checkpoint thread ID (generated if omitted)
+        resume: Continue the checkpointed run `run_id` from its last completed
+            step instead of starting a new conversation
+        fragment_cache: Optional store of per-file findings; files whose
+            normalized diff was reviewed before reuse their issues and are not
+            sent to the agent (ignored when resuming)
+        model_name: Model reviewing the changes (defaults to MODEL_NAME)
 
     Returns:
         ReviewResult containing output, token usage, and context for verification
+
+    Raises:
+        ValueError: If resuming without a durable checkpointer, or if no
+            checkpoint exists for `run_id`
     """
+    if resume and (run_id is None or not is_durable()):
+        raise ValueError(
+            "Resuming a review requires a run ID and CHECKPOINT_BACKEND=sqlite"
+        )
+
+    run_id = run_id or new_run_id()
+
     context = Context(
         repo_path=repo_path,
         target_branch=target_branch,
     )
 
-    # Build the review context with all diffs and commit messages
-    user_message = build_review_context(
-        repo_path, target_branch, changed_files, sast_findings
-    )
-
     # Build system prompt
     include_sast = sast_findings is not None
     system_prompt = build_review_system_prompt(
         additional_instructions, include_sast_guidance=include_sast
     )
 
+    # Split off files whose diff was already reviewed
+    fragments: list[FileFragment] = []
+    cached_issues: dict[str, list[ReviewIssue]] = {}
+    review_files = changed_files
+    if fragment_cache is not None and not resume:
+        fragments = build_file_fragments(
+            repo_path, target_branch, changed_files, system_prompt, sast_findings
+        )
+        cached_issues = load_cached_fragments(fragment_cache, fragments)
+        review_files = [f for f in changed_files if f.path not in cached_issues]
+        if cached_issues and show_progress:
+            print(
+                f"Reusing cached findings for {len(cached_issues)} of "
+                f"{len(changed_files)} files"
+            )
+
+    # Build the review context with all diffs and commit messages
+    user_message = build_review_context(
+        repo_path, target_branch, review_files, sast_findings
+    )
+
+    if cached_issues:
+        # Verification needs the diffs of cached files too
+        full_user_message = build_review_context(
+            repo_path, target_branch, changed_files, sast_findings
+        )
+
+        if not review_files and fragment_cache is not None:
+            description = load_cached_description(fragment_cache, fragments)
+            return ReviewResult(
+                output=PrimaryReviewOutput(
+                    description=description or _reused_note(len(cached_issues)),
+                    issues=deduplicate_issues(
+                        [i for issues in cached_issues.values() for i in issues]
+                    ),
+                ),
+                token_usage=None,
+                file_context=FileContext(),
+                user_message=full_user_message,
+                system_prompt=system_prompt,
+                run_id=run_id,
+            )
+    else:
+        full_user_message = user_message
+
+    # Small diffs are reviewed in one call, the surrounding code inlined
+    fast_path = not resume and use_fast_path(review_files)
+    if fast_path and show_progress:
+        print("Small diff: reviewing in a single model call without tools")
+
     # Create agent
     agent, file_context = create_review_agent(
         repo_path=repo_path,
-        additional_instructions=additional_instructions,
-        include_sast_guidance=include_sast,
+        system_prompt=system_prompt,
+        use_tools=not fast_path,
+        model_name=model_name,
     )
 
-    callbacks: list[BaseCallbackHandler] = []
+    prompt_message = user_message
+    if fast_path:
+        surrounding_code = read_surrounding_code(repo_path, target_branch, review_files)
+        # Verification sees the inlined code as code read during the review
+        file_context.update(surrounding_code)
+        prompt_message = build_fast_path_message(user_message, surrounding_code)
+
+    usage_handler = TokenUsageCallbackHandler(stage="review")
+    callbacks: list[BaseCallbackHandler] = [usage_handler]
     if show_progress:
         callbacks.append(ProgressCallbackHandler())
 
     config: dict[str, Any] = {
         "configurable": {
-            "thread_id": "1",
+            "thread_id": run_id,
         },
         "callbacks": callbacks,
     }
 
-    response = agent.invoke(
-        {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": user_message,
-                }
-            ],
-        },
-        config=config,
-        context=context,
-    )
+    if resume:
+        state = agent.get_state(config)
+        if not state.values:
+            raise ValueError(f"No checkpoint found for run {run_id}")
+
+        _restore_file_context(state.values["messages"], repo_path, file_context)
 
-    token_usage = TokenUsage.from_response(response)
+        if state.next:
+            response = agent.invoke(None, config=config, context=context)
+        else:
+            # Run had already finished, only the process died afterwards
+            response = state.values
+    else:
+        response = agent.invoke(
+            {
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt_message,
+                    }
+                ],
+            },
+            config=config,
+            context=context,
+        )
+
+    token_usage = usage_handler.token_usage() or TokenUsage.from_response(
+        response, stage="review"
+    )
 
     # Extract structured response
     if "structured_response" not in response:
@@ -100,10 +211,140 @@ def run_review(
 
     primary_output: PrimaryReviewOutput = response["structured_response"]
 
+    if fragment_cache is not None and not resume:
+        save_fragments(
+            fragment_cache,
+            [f for f in fragments if f.path not in cached_issues],
+            primary_output.issues,
+        )
+        if cached_issues:
+            primary_output = PrimaryReviewOutput(
+                description=(
+                    f"{primary_output.description}\n\n"
+                    f"{_reused_note(len(cached_issues))}"
+                ),
+                issues=primary_output.issues
+                + [i for issues in cached_issues.values() for i in issues],
+            )
+        save_cached_description(fragment_cache, fragments, primary_output.description)
+
+    # Collapse near-duplicates before they cost verification tokens
+    primary_output = primary_output.model_copy(
+        update={"issues": deduplicate_issues(primary_output.issues)}
+    )
+
+    # Finished runs are never resumed; drop their snapshots
+    checkpointer = get_checkpointer()
+    if checkpointer is not None:
+        checkpointer.delete_thread(run_id)
+
     return ReviewResult(
         output=primary_output,
         token_usage=token_usage,
         file_context=file_context,
-        user_message=user_message,
+        user_message=full_user_message,
         system_prompt=system_prompt,
+        run_id=run_id,
     )
+
+
+def merge_review_results(
+    repo_path: str,
+    target_branch: str,
+    changed_files: list[FileChange],
+    sast_findings: str | None,
+    run_id: str,
+    parts: list[tuple[str, ReviewResult]],
+) -> ReviewResult:
+    """Combine reviews of parts of a change set into one result.
+
+    Issues are concatenated and deduplicated, descriptions combined under a
+    heading per part, and the user message rebuilt for all files so the
+    result is usable for verification.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        changed_files: All files reviewed by the parts
+        sast_findings: Optional trimmed SAST findings JSON given to the parts
+        run_id: Run ID of the combined review
+        parts: Heading and result of each part
+
+    Returns:
+        ReviewResult covering all parts
+    """
+    file_context = FileContext()
+    token_usage: TokenUsage | None = None
+    descriptions = []
+    issues = []
+    for heading, result in parts:
+        file_context.update(result.file_context.files)
+        if result.token_usage:
+            token_usage = (
+                token_usage + result.token_usage if token_usage else result.token_usage
+            )
+        descriptions.append(f"### {heading}\n\n{result.output.description}")
+        issues.extend(result.output.issues)
+
+    return ReviewResult(
+        output=PrimaryReviewOutput(
+            description="\n\n".join(descriptions),
+            # Parts sharing code often report the same problem
+            issues=deduplicate_issues(issues),
+        ),
+        token_usage=token_usage,
+        file_context=file_context,
+        user_message=build_review_context(
+            repo_path, target_branch, changed_files, sast_findings
+        ),
+        system_prompt=parts[0][1].system_prompt,
+        run_id=run_id,
+    )
+
+
+def _reused_note(file_count: int) -> str:
+    """Note appended to the description when cached findings were reused."""
+    return (
+        f"_Findings for {file_count} file{'s' if file_count != 1 else ''} "
+        f"with unchanged diffs were reused from a previous review._"
+    )
+
+
+def _restore_file_context(
+    messages: list[Any], repo_path: str, file_context: FileContext
+) -> None:
+    """Rebuild FileContext after resume by replaying recorded file reads.
+
+    Tool results from before the crash live only in the checkpoint, so the
+    read_file_part and search_in_files calls found there are re-executed
+    against HEAD to recover the file content verification relies on.
+    """
+    for message in messages:
+        if not isinstance(message, AIMessage):
+            continue
+
+        for tool_call in message.tool_calls:
+            args = tool_call["args"]
+            try:
+                if tool_call["name"] == "read_file_part":
+                    file_context.update(
+                        _read_file_impl(
+                            repo_path,
+                            args["file_path"],
+                            args.get("start_line", 1),
+                            args.get("num_lines", 50),
+                        ).lines
+                    )
+                elif tool_call["name"] == "search_in_files":
+                    file_context.update(
+                        _search_impl(
+                            repo_path,
+                            args["pattern"],
+                            args.get("file_pattern"),
+                            args.get("context_lines", 2),
+                            args.get("max_results", 50),
+                        )
+                    )
+            except Exception:
+                # The original call failed the same way; nothing to restore
+                continue
@@ -5,6 +5,7 @@ import subprocess
 from dataclasses import dataclass
 from typing import Any
 
+from ..tracing import traced
 from .installer import ensure_opengrep_binary
 
 
@@ -44,6 +45,7 @@ def _trim_findings(raw_json: str) -> tuple[str, int]:
     return json.dumps(trimmed, indent=2), len(trimmed)
 
 
+@traced("opengrep scan", "subprocess")
 def run_sast_scan(repo_path: str, target_branch: str) -> SastResult | None:
     """Run OpenGrep SAST scan and return trimmed findings for LLM consumption.
 
@@ -0,0 +1,6 @@
+"""Sharded review of large change sets with parallel sub-agents."""
+
+from .clustering import cluster_files
+from .runner import run_sharded_review
+
+__all__ = ["cluster_files", "run_sharded_review"]
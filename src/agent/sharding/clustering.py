@@ -0,0 +1,139 @@
+"""Group changed files into review shards by directory and imports."""
+
+import posixpath
+import re
+
+from ..git_utils import FileChange, read_files_at_head
+
+# Python: "from x.y import z", "import x.y"
+_PY_IMPORT = re.compile(r"^\s*(?:from\s+([.\w]+)\s+import|import\s+([\w.]+))", re.M)
+# JS/TS: "from './x'", "import './x'", "require('./x')"
+_JS_IMPORT = re.compile(
+    r"""(?:from\s+|import\s+|require\(\s*)['"]([^'"]+)['"]""",
+)
+
+
+class _UnionFind:
+    def __init__(self, items: list[str]) -> None:
+        self.parent = {item: item for item in items}
+
+    def find(self, item: str) -> str:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: str, b: str) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Smallest path as root keeps grouping deterministic
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def _module_key(path: str) -> str:
+    """Path without extension (and without a trailing index/__init__)."""
+    stem = posixpath.splitext(path)[0]
+    for suffix in ("/__init__", "/index"):
+        if stem.endswith(suffix):
+            return stem[: -len(suffix)]
+    return stem
+
+
+def _import_targets(path: str, content: str) -> list[str]:
+    """Extract imported modules as repo-relative path stems, best effort."""
+    directory = posixpath.dirname(path)
+    targets: list[str] = []
+
+    if path.endswith(".py"):
+        for match in _PY_IMPORT.finditer(content):
+            module = match.group(1) or match.group(2)
+            dots = len(module) - len(module.lstrip("."))
+            name = module[dots:].replace(".", "/")
+            if dots:
+                base = directory
+                for _ in range(dots - 1):
+                    base = posixpath.dirname(base)
+                targets.append(posixpath.join(base, name) if name else base)
+            else:
+                targets.append(name)
+    else:
+        for match in _JS_IMPORT.finditer(content):
+            spec = match.group(1)
+            if spec.startswith("."):
+                targets.append(posixpath.normpath(posixpath.join(directory, spec)))
+
+    return targets
+
+
+def cluster_files(
+    repo_path: str,
+    changed_files: list[FileChange],
+    max_files: int,
+) -> list[list[FileChange]]:
+    """Split changed files into shards of related files.
+
+    Files in the same directory, and files where one imports another, are
+    grouped together. Groups are then packed into shards of at most
+    `max_files` files; a group larger than that is split by path order.
+
+    Args:
+        repo_path: Path to the git repository
+        changed_files: Files to split
+        max_files: Maximum number of files per shard
+
+    Returns:
+        List of shards, largest first, each a list of files in path order
+    """
+    max_files = max(max_files, 1)
+    by_path = {f.path: f for f in changed_files}
+    paths = sorted(by_path)
+    groups = _UnionFind(paths)
+
+    # Same directory
+    first_in_dir: dict[str, str] = {}
+    for path in paths:
+        directory = posixpath.dirname(path)
+        if directory in first_in_dir:
+            groups.union(first_in_dir[directory], path)
+        else:
+            first_in_dir[directory] = path
+
+    # Import relationships between changed files
+    module_index = {_module_key(path): path for path in paths}
+    contents = read_files_at_head(
+        repo_path, [f.path for f in changed_files if f.change_type != "deleted"]
+    )
+    for path, content in contents.items():
+        for target in _import_targets(path, content):
+            imported = module_index.get(target)
+            if imported is None:
+                # Absolute Python imports may be rooted below the repo root
+                imported = next(
+                    (p for k, p in module_index.items() if k.endswith("/" + target)),
+                    None,
+                )
+            if imported is not None and imported != path:
+                groups.union(path, imported)
+
+    clusters: dict[str, list[str]] = {}
+    for path in paths:
+        clusters.setdefault(groups.find(path), []).append(path)
+
+    # Split oversized clusters, then first-fit-decreasing into shards
+    chunks: list[list[str]] = []
+    for members in clusters.values():
+        chunks.extend(
+            members[i : i + max_files] for i in range(0, len(members), max_files)
+        )
+    chunks.sort(key=lambda chunk: (-len(chunk), chunk[0]))
+
+    shards: list[list[str]] = []
+    for chunk in chunks:
+        for shard in shards:
+            if len(shard) + len(chunk) <= max_files:
+                shard.extend(chunk)
+                break
+        else:
+            shards.append(list(chunk))
+
+    return [[by_path[path] for path in sorted(shard)] for shard in shards]
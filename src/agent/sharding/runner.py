@@ -0,0 +1,109 @@
+"""Run a review as parallel sub-agents over shards of the changed files."""
+
+from __future__ import annotations
+
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+
+from ...config import SHARD_CONCURRENCY, SHARD_MAX_FILES
+from ..cache import CacheStore
+from ..checkpointer import new_run_id
+from ..git_utils import FileChange
+from ..runner import ReviewResult, merge_review_results, run_review
+from ..tracing import traced
+from .clustering import cluster_files
+
+
+def _shard_label(files: list[FileChange]) -> str:
+    """Describe a shard by the directories it covers."""
+    directories = sorted({posixpath.dirname(f.path) or "." for f in files})
+    shown = ", ".join(f"`{d}`" for d in directories[:3])
+    if len(directories) > 3:
+        shown += f" and {len(directories) - 3} more"
+    return shown
+
+
+@traced("sharded review")
+def run_sharded_review(
+    repo_path: str,
+    target_branch: str,
+    changed_files: list[FileChange],
+    show_progress: bool = True,
+    additional_instructions: str | None = None,
+    sast_findings: str | None = None,
+    run_id: str | None = None,
+    fragment_cache: CacheStore | None = None,
+    max_files: int = SHARD_MAX_FILES,
+    concurrency: int = SHARD_CONCURRENCY,
+) -> ReviewResult:
+    """Review related groups of files with concurrent sub-agents.
+
+    Each shard gets its own review agent seeing only the diffs of its files,
+    so no single agent accumulates the context of the whole PR. Issues are
+    concatenated and the shard descriptions combined under per-shard headings.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        changed_files: List of changed files to review
+        show_progress: Whether to show per-shard completion messages
+        additional_instructions: Optional additional review guidelines
+        sast_findings: Optional trimmed SAST findings JSON to include in context
+        run_id: Run ID; shard thread IDs are derived from it
+        fragment_cache: Optional per-file findings cache passed to each shard
+        max_files: Maximum number of files per shard
+        concurrency: Maximum number of shards reviewed at the same time
+
+    Returns:
+        ReviewResult combining all shards, usable for verification
+    """
+    run_id = run_id or new_run_id()
+    shards = cluster_files(repo_path, changed_files, max_files)
+
+    if len(shards) <= 1:
+        return run_review(
+            repo_path=repo_path,
+            target_branch=target_branch,
+            changed_files=changed_files,
+            show_progress=show_progress,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings,
+            run_id=run_id,
+            fragment_cache=fragment_cache,
+        )
+
+    if show_progress:
+        print(
+            f"Reviewing {len(changed_files)} files in {len(shards)} shards "
+            f"({min(concurrency, len(shards))} at a time)"
+        )
+
+    def review_shard(index: int) -> ReviewResult:
+        result = run_review(
+            repo_path=repo_path,
+            target_branch=target_branch,
+            changed_files=shards[index],
+            show_progress=False,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings,
+            run_id=f"{run_id}-shard{index + 1}",
+            fragment_cache=fragment_cache,
+        )
+        if show_progress:
+            print(
+                f"  ✓ Shard {index + 1}/{len(shards)} done "
+                f"({len(shards[index])} files, {len(result.output.issues)} issues)"
+            )
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        results = list(executor.map(review_shard, range(len(shards))))
+
+    return merge_review_results(
+        repo_path,
+        target_branch,
+        changed_files,
+        sast_findings,
+        run_id,
+        [(_shard_label(files), result) for files, result in zip(shards, results)],
+    )
@@ -1,52 +1,235 @@
-"""Token usage tracking dataclass."""
+"""Token usage tracking dataclasses."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from langchain_core.messages.ai import UsageMetadata
+
+from .pricing import estimate_cost
+
+# Providers whose `input_tokens` excludes cache reads and writes
+# (langchain-aws reports the Converse API's uncached `inputTokens` as-is)
+UNCACHED_INPUT_PROVIDERS = {"bedrock_converse"}
+
+
+def normalized_usage(message: Any) -> UsageMetadata | None:
+    """Return a message's usage_metadata with cached tokens counted as input.
+
+    Anthropic reports `input_tokens` including cache reads and writes,
+    Bedrock reports only the uncached part. Everything downstream (cache
+    hit ratio, pricing, context size, budgets, rate limits) expects the
+    former, so Bedrock usage gets its cached tokens added back. Usage whose
+    cached tokens exceed its input tokens is treated the same way.
+
+    Args:
+        message: Message returned by the model
+
+    Returns:
+        Copy of the usage metadata with `input_tokens` and `total_tokens`
+        covering the whole prompt, or None if the message carries no usage
+    """
+    usage: UsageMetadata | None = getattr(message, "usage_metadata", None)
+    if not usage:
+        return None
+
+    metadata = getattr(message, "response_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    cached = (details.get("cache_read") or 0) + (details.get("cache_creation") or 0)
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    if metadata.get("model_provider") in UNCACHED_INPUT_PROVIDERS or (
+        cached > input_tokens
+    ):
+        input_tokens += cached
+
+    return {
+        **usage,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+    }
+
 
 @dataclass
-class TokenUsage:
-    """Tracks token usage for LLM calls.
+class LLMCallUsage:
+    """Token usage of a single LLM call.
 
     Attributes:
-        input_tokens: Total input tokens used
-        output_tokens: Total output tokens used
-        total_tokens: Total tokens (input + output)
+        stage: Pipeline stage (review, questions, answers, score)
+        model: Model identifier reported for the call
+        input_tokens: Input tokens, including cached ones
+        output_tokens: Output tokens
+        cache_read_tokens: Input tokens served from the provider cache
+        cache_creation_tokens: Input tokens written to the provider cache
+        latency_seconds: Wall-clock duration of the call (0 if unknown)
     """
 
+    stage: str
+    model: str
     input_tokens: int
     output_tokens: int
-    total_tokens: int
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    latency_seconds: float = 0.0
+
+    @property
+    def cost_usd(self) -> float | None:
+        """Estimated cost from the pricing table, None for unknown models."""
+        return estimate_cost(
+            self.model,
+            self.input_tokens,
+            self.output_tokens,
+            self.cache_read_tokens,
+            self.cache_creation_tokens,
+        )
 
     @staticmethod
-    def from_response(response: dict[str, Any]) -> "TokenUsage | None":
-        """Extract token usage from agent response.
+    def from_message(
+        message: Any, stage: str, model: str = "", latency_seconds: float = 0.0
+    ) -> "LLMCallUsage | None":
+        """Build a record from an AIMessage's usage_metadata.
+
+        Cache tokens are read from the standard `input_token_details`
+        (`cache_read`, `cache_creation`), which the Anthropic and Bedrock
+        integrations populate. Input tokens are normalized with
+        `normalized_usage` so they always include the cached ones.
+
+        Args:
+            message: Message returned by the model
+            stage: Pipeline stage name
+            model: Fallback model identifier when the message has none
+            latency_seconds: Duration of the call
+
+        Returns:
+            LLMCallUsage, or None if the message carries no usage data
+        """
+        usage = normalized_usage(message)
+        if not usage:
+            return None
+
+        metadata = getattr(message, "response_metadata", None) or {}
+        details = usage.get("input_token_details") or {}
+        return LLMCallUsage(
+            stage=stage,
+            model=metadata.get("model_name") or metadata.get("model_id") or model,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cache_read_tokens=details.get("cache_read") or 0,
+            cache_creation_tokens=details.get("cache_creation") or 0,
+            latency_seconds=latency_seconds,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "stage": self.stage,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "latency_seconds": round(self.latency_seconds, 3),
+            "cost_usd": self.cost_usd,
+        }
+
+
+@dataclass
+class TokenUsage:
+    """Tracks token usage for LLM calls.
+
+    Every figure is aggregated from the per-call records, so multi-call
+    agents count the input of each call (each call resends the
+    conversation, and each is billed).
+
+    Attributes:
+        calls: Per-call usage records in call order
+    """
+
+    calls: list[LLMCallUsage] = field(default_factory=list)
+
+    @property
+    def input_tokens(self) -> int:
+        """Total input tokens used, including cached ones."""
+        return sum(call.input_tokens for call in self.calls)
+
+    @property
+    def output_tokens(self) -> int:
+        """Total output tokens used."""
+        return sum(call.output_tokens for call in self.calls)
+
+    @property
+    def total_tokens(self) -> int:
+        """Total tokens (input + output)."""
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def cache_read_tokens(self) -> int:
+        """Input tokens served from the provider cache."""
+        return sum(call.cache_read_tokens for call in self.calls)
+
+    @property
+    def cache_creation_tokens(self) -> int:
+        """Input tokens written to the provider cache."""
+        return sum(call.cache_creation_tokens for call in self.calls)
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of input tokens read from the provider cache (0.0-1.0)."""
+        if self.input_tokens <= 0:
+            return 0.0
+        return self.cache_read_tokens / self.input_tokens
+
+    @property
+    def llm_calls(self) -> int:
+        """Number of LLM calls."""
+        return len(self.calls)
+
+    @property
+    def latency_seconds(self) -> float:
+        """Summed duration of the LLM calls."""
+        return sum(call.latency_seconds for call in self.calls)
+
+    @property
+    def cost_usd(self) -> float | None:
+        """Estimated cost of the priced calls, None if no call is priced."""
+        costs = [call.cost_usd for call in self.calls]
+        priced = [cost for cost in costs if cost is not None]
+        return sum(priced) if priced else None
+
+    @property
+    def stages(self) -> dict[str, "TokenUsage"]:
+        """Usage per pipeline stage, in order of first call."""
+        stages: dict[str, TokenUsage] = {}
+        for call in self.calls:
+            stages.setdefault(call.stage, TokenUsage()).calls.append(call)
+        return stages
+
+    @staticmethod
+    def from_response(
+        response: dict[str, Any], stage: str = "", model: str = ""
+    ) -> "TokenUsage | None":
+        """Extract token usage from agent response messages.
+
+        Used when no callback recorded the calls (e.g. a resumed run that had
+        already finished); latency is unknown in that case.
 
         Args:
             response: Agent response containing messages with usage_metadata
+            stage: Pipeline stage name to record the calls under
+            model: Fallback model identifier
 
         Returns:
             TokenUsage instance or None if no usage data found
         """
-        total_output = 0
-        cumulative_total = 0
-
-        if "messages" in response:
-            for msg in response["messages"]:
-                if hasattr(msg, "usage_metadata") and msg.usage_metadata:
-                    usage = msg.usage_metadata
-                    total_output += usage.get("output_tokens", 0)
-                    cumulative_total = usage.get("total_tokens", 0)
-
-        if cumulative_total > 0:
-            total_input = cumulative_total - total_output
-            return TokenUsage(
-                input_tokens=total_input,
-                output_tokens=total_output,
-                total_tokens=cumulative_total,
+        calls = [
+            call
+            for call in (
+                LLMCallUsage.from_message(msg, stage, model)
+                for msg in response.get("messages", [])
             )
-
-        return None
+            if call is not None
+        ]
+        return TokenUsage(calls) if calls else None
 
     def __add__(self, other: "TokenUsage") -> "TokenUsage":
         """Add two TokenUsage instances together.
@@ -55,13 +238,31 @@ class TokenUsage:
             other: Another TokenUsage instance
 
         Returns:
-            New TokenUsage with summed values
+            New TokenUsage with the calls of both
         """
-        return TokenUsage(
-            input_tokens=self.input_tokens + other.input_tokens,
-            output_tokens=self.output_tokens + other.output_tokens,
-            total_tokens=self.total_tokens + other.total_tokens,
-        )
+        return TokenUsage(self.calls + other.calls)
+
+    def _summary(self) -> dict[str, Any]:
+        cost = self.cost_usd
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 4),
+            "llm_calls": self.llm_calls,
+            "latency_seconds": round(self.latency_seconds, 3),
+            "cost_usd": round(cost, 6) if cost is not None else None,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize totals, per-stage totals and per-call records for JSON."""
+        return {
+            **self._summary(),
+            "stages": {name: usage._summary() for name, usage in self.stages.items()},
+            "calls": [call.to_dict() for call in self.calls],
+        }
 
     def print(self) -> None:
         """Print token usage in a formatted way."""
@@ -69,3 +270,25 @@ class TokenUsage:
         print(f"  Input tokens:  {self.input_tokens:>7,}")
         print(f"  Output tokens: {self.output_tokens:>7,}")
         print(f"  Total tokens:  {self.total_tokens:>7,}")
+
+        if self.cache_read_tokens or self.cache_creation_tokens:
+            print(f"  Cache read:    {self.cache_read_tokens:>7,}")
+            print(f"  Cache write:   {self.cache_creation_tokens:>7,}")
+            print(f"  Cache hits:    {self.cache_hit_ratio:>7.1%}")
+
+        cost = self.cost_usd
+        if cost is not None:
+            print(f"  Est. cost:     ${cost:.2f}")
+
+        print(f"  By stage:")
+        for name, usage in self.stages.items():
+            stage_cost = usage.cost_usd
+            print(
+                f"    {name:<10} {usage.llm_calls:>3} call"
+                f"{'s' if usage.llm_calls != 1 else ' '} "
+                f"{usage.input_tokens:>9,} in "
+                f"({usage.cache_hit_ratio:>4.0%} cached) "
+                f"{usage.output_tokens:>7,} out "
+                f"{usage.latency_seconds:>6.1f}s"
+                + (f"  ${stage_cost:.2f}" if stage_cost is not None else "")
+            )
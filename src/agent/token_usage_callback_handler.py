@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .token_usage import LLMCallUsage, TokenUsage
+
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """Callback handler recording the usage and latency of every LLM call."""
+
+    def __init__(self, stage: str) -> None:
+        super().__init__()
+        self.stage = stage
+        self.calls: list[LLMCallUsage] = []
+        self._started: dict[UUID, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(
+        self,
+        serialized: Any,
+        messages: Any,
+        *,
+        run_id: UUID,
+        invocation_params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a chat model call starts."""
+        params = invocation_params or {}
+        model = (
+            params.get("model") or params.get("model_id") or params.get("model_name")
+        )
+        with self._lock:
+            self._started[run_id] = (time.monotonic(), str(model or ""))
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Called when a model call finishes."""
+        with self._lock:
+            started, model = self._started.pop(run_id, (time.monotonic(), ""))
+        latency = time.monotonic() - started
+
+        for generations in response.generations:
+            for generation in generations:
+                call = LLMCallUsage.from_message(
+                    getattr(generation, "message", None),
+                    self.stage,
+                    model,
+                    latency,
+                )
+                if call is not None:
+                    with self._lock:
+                        self.calls.append(call)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Called when a model call fails."""
+        with self._lock:
+            self._started.pop(run_id, None)
+
+    def token_usage(self) -> TokenUsage | None:
+        """Usage of the calls recorded so far, or None if there were none."""
+        with self._lock:
+            return TokenUsage(list(self.calls)) if self.calls else None
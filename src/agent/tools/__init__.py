@@ -1,6 +1,7 @@
 from .file_context import FileContext
 from .list_files import ListFilesTool
 from .read_file_part import ReadFilePartTool
+from .review_tools import create_review_tools
 from .search_in_files import SearchInFilesTool
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "ListFilesTool",
     "ReadFilePartTool",
     "SearchInFilesTool",
+    "create_review_tools",
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 from ..formatting.format_file_lines import FileLinesMap, format_file_lines
 
 
@@ -19,6 +21,8 @@ class FileContext:
 
     def __init__(self) -> None:
         self.files: FileLinesMap = {}
+        # Tools of concurrently running agents may share one FileContext
+        self._lock = threading.Lock()
 
     def update(self, lines: FileLinesMap) -> None:
         """Merge lines from multiple files into tracked state.
@@ -26,10 +30,11 @@ class FileContext:
         Args:
             lines: FileLinesMap to merge into current state
         """
-        for file_path, file_lines in lines.items():
-            if file_path not in self.files:
-                self.files[file_path] = {}
-            self.files[file_path].update(file_lines)
+        with self._lock:
+            for file_path, file_lines in lines.items():
+                if file_path not in self.files:
+                    self.files[file_path] = {}
+                self.files[file_path].update(file_lines)
 
     def to_markdown(self) -> str:
         """Render all tracked file content as markdown.
@@ -1,10 +1,11 @@
 import fnmatch
-import subprocess
 from typing import Any
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ..tracing import run_traced
+
 
 def _list_files_impl(
     repo_path: str,
@@ -13,7 +14,7 @@ def _list_files_impl(
     max_files: int = 100,
 ) -> list[str]:
     """List files in repository."""
-    result = subprocess.run(
+    result = run_traced(
         ["git", "-C", repo_path, "ls-tree", "-r", "--name-only", "HEAD", directory],
         capture_output=True,
         text=True,
@@ -1,10 +1,10 @@
-import subprocess
 from typing import Any
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ..formatting.format_file_lines import FileLinesMap, format_file_lines
+from ..tracing import run_traced
 from .file_context import FileContext
 
 
@@ -22,7 +22,7 @@ def _read_file_impl(
     num_lines: int = 50,
 ) -> ReadFileResult:
     """Read lines from a file and return raw structure."""
-    result = subprocess.run(
+    result = run_traced(
         ["git", "-C", repo_path, "show", f"HEAD:{file_path}"],
         capture_output=True,
         text=True,
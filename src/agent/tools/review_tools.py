@@ -0,0 +1,25 @@
+"""Tool set shared by the review and verification agents."""
+
+from langchain_core.tools import BaseTool
+
+from .file_context import FileContext
+from .list_files import ListFilesTool
+from .read_file_part import ReadFilePartTool
+from .search_in_files import SearchInFilesTool
+
+
+def create_review_tools(repo_path: str, file_context: FileContext) -> list[BaseTool]:
+    """Create the code exploration tools of the review and answer agents.
+
+    Args:
+        repo_path: Path to the git repository
+        file_context: FileContext tracking file content read by the tools
+
+    Returns:
+        List of tool instances
+    """
+    return [
+        ReadFilePartTool(repo_path=repo_path, file_context=file_context),
+        SearchInFilesTool(repo_path=repo_path, file_context=file_context),
+        ListFilesTool(repo_path=repo_path),
+    ]
@@ -1,10 +1,10 @@
-import subprocess
 from typing import Any
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ..formatting.format_file_lines import FileLinesMap, format_file_lines
+from ..tracing import run_traced
 from .file_context import FileContext
 
 
@@ -54,7 +54,7 @@ def _search_impl(
     if file_pattern:
         cmd.extend(["--", file_pattern])
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_traced(cmd, capture_output=True, text=True)
 
     if result.returncode != 0 and result.returncode != 1:
         raise RuntimeError(f"Git grep failed: {result.stderr}")
@@ -0,0 +1,208 @@
+"""Span recording for LLM calls, tool calls and subprocesses.
+
+Spans are written as a Chrome trace-event JSON file, which opens in
+chrome://tracing or https://ui.perfetto.dev. Recording is off unless
+`enable_tracing()` was called (the CLI `--trace` flag), in which case every
+helper below is a no-op.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Literal, ParamSpec, TypeVar, overload
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Longest argument value kept in a span; traces are for timing, not content
+MAX_ARG_LENGTH = 200
+
+
+def summarize_arg(value: Any) -> Any:
+    """Shorten a span argument so large prompts or file contents stay out."""
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    if len(text) > MAX_ARG_LENGTH:
+        return text[:MAX_ARG_LENGTH] + f"... ({len(text)} chars)"
+    return text
+
+
+class TraceRecorder:
+    """Thread-safe collector of complete ("X") trace events."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a finished span.
+
+        Args:
+            name: Span name shown in the trace viewer
+            category: Span category (llm, tool, git, stage, ...)
+            start: Start time from time.perf_counter()
+            end: End time from time.perf_counter()
+            args: Attributes shown with the span
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1_000_000),
+            "dur": round((end - start) * 1_000_000),
+            "pid": os.getpid(),
+            "tid": thread.ident or 0,
+            "args": {k: summarize_arg(v) for k, v in (args or {}).items()},
+        }
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault(thread.ident or 0, thread.name)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Record the enclosed block as a span.
+
+        Yields:
+            Mutable dict of span arguments, for attributes known only at the end
+        """
+        span_args = dict(args)
+        start = time.perf_counter()
+        try:
+            yield span_args
+        except BaseException as e:
+            span_args["error"] = type(e).__name__
+            raise
+        finally:
+            self.add_span(name, category, start, time.perf_counter(), span_args)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the trace in Chrome trace-event format."""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in threads.items()
+        ]
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: str) -> None:
+        """Write the trace JSON file."""
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+
+_recorder: TraceRecorder | None = None
+
+
+def enable_tracing() -> TraceRecorder:
+    """Start recording spans process-wide and return the recorder."""
+    global _recorder
+    _recorder = TraceRecorder()
+    return _recorder
+
+
+def disable_tracing() -> None:
+    """Stop recording spans."""
+    global _recorder
+    _recorder = None
+
+
+def get_trace_recorder() -> TraceRecorder | None:
+    """Return the active recorder, or None when tracing is off."""
+    return _recorder
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Record the enclosed block as a span if tracing is enabled.
+
+    Yields:
+        Mutable dict of span arguments (discarded when tracing is off)
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield dict(args)
+        return
+
+    with recorder.span(name, category, **args) as span_args:
+        yield span_args
+
+
+def traced(
+    name: str, category: str = "stage"
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with trace_span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@overload
+def run_traced(
+    cmd: list[str], category: str = ..., *, text: Literal[True], **kwargs: Any
+) -> subprocess.CompletedProcess[str]: ...
+
+
+@overload
+def run_traced(
+    cmd: list[str], category: str = ..., *, text: Literal[False] = ..., **kwargs: Any
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+def run_traced(
+    cmd: list[str], category: str = "git", *, text: bool = False, **kwargs: Any
+) -> subprocess.CompletedProcess[Any]:
+    """subprocess.run() recorded as a span named after the command.
+
+    Args:
+        cmd: Command and arguments
+        category: Span category
+        text: Decode output as text (as in subprocess.run())
+        **kwargs: Passed to subprocess.run()
+
+    Returns:
+        The completed process
+    """
+    # "git -C <repo> diff ..." is named "git diff"
+    args = cmd[3:] if cmd[:2] == ["git", "-C"] else cmd[1:]
+    name = " ".join([os.path.basename(cmd[0])] + args[:1])
+
+    with trace_span(name, category, command=" ".join(cmd)) as span_args:
+        result = subprocess.run(cmd, text=text, **kwargs)
+        span_args["returncode"] = result.returncode
+        return result
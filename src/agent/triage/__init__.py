@@ -0,0 +1,7 @@
+"""Risk-based routing of changed files to a fast or the main review model."""
+
+from .classifier import classify_files
+from .runner import run_triaged_review
+from .scoring import FileRisk, Risk, score_files
+
+__all__ = ["FileRisk", "Risk", "classify_files", "run_triaged_review", "score_files"]
@@ -0,0 +1,108 @@
+"""Classification of files the heuristics cannot place, by the triage model."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from langchain.agents import create_agent
+from pydantic import BaseModel, Field
+
+from ...config import MAX_OUTPUT_TOKENS, TRIAGE_MODEL_NAME
+from ..git_utils import get_file_diff
+from ..middleware import init_agent_middleware
+from ..prompts import get_prompt
+from ..providers import get_model
+from ..token_usage import TokenUsage
+from ..token_usage_callback_handler import TokenUsageCallbackHandler
+from ..tracing import traced
+from .scoring import FileRisk, Risk
+
+
+class FileClassification(BaseModel):
+    """Triage model verdict for one file."""
+
+    path: str = Field(description="Path of the file as listed")
+    risk: Literal["low", "high"] = Field(description="Risk of the change")
+    reason: str = Field(description="One short sentence explaining the rating")
+
+
+class TriageOutput(BaseModel):
+    """Triage structured output wrapper."""
+
+    files: list[FileClassification] = Field(description="One entry per file")
+
+
+def _build_message(repo_path: str, target_branch: str, risks: list[FileRisk]) -> str:
+    parts = ["## Files to rate"]
+    for risk in risks:
+        change = risk.file
+        diff = (
+            None
+            if change.change_type == "deleted"
+            else get_file_diff(repo_path, target_branch, change.path)
+        )
+        parts.append(
+            f"### {change.path} ({change.change_type}, "
+            f"+{change.additions}/-{change.deletions})\n"
+            + (f"```diff\n{diff}\n```" if diff else "*No diff shown*")
+        )
+    return "\n\n".join(parts)
+
+
+@traced("triage classify")
+def classify_files(
+    repo_path: str, target_branch: str, risks: list[FileRisk]
+) -> tuple[list[FileRisk], TokenUsage | None]:
+    """Ask TRIAGE_MODEL_NAME to rate the files heuristics left unknown.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        risks: Heuristic verdicts for all changed files
+
+    Returns:
+        Tuple of (verdicts with unknown files rated where the model answered,
+        TokenUsage of the call or None if nothing needed rating)
+    """
+    unknown = [r for r in risks if r.risk == Risk.UNKNOWN]
+    if not unknown:
+        return risks, None
+
+    agent: Any = create_agent(
+        model=get_model(TRIAGE_MODEL_NAME, MAX_OUTPUT_TOKENS),
+        system_prompt=get_prompt("triage"),
+        tools=[],
+        middleware=init_agent_middleware(),
+        response_format=TriageOutput,
+    )
+
+    usage_handler = TokenUsageCallbackHandler("triage")
+    response = agent.invoke(
+        {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": _build_message(repo_path, target_branch, unknown),
+                }
+            ],
+        },
+        config={"callbacks": [usage_handler]},
+    )
+
+    if "structured_response" not in response:
+        raise ValueError("Triage agent did not return structured output")
+
+    output: TriageOutput = response["structured_response"]
+    verdicts = {c.path: c for c in output.files}
+
+    classified = []
+    for risk in risks:
+        verdict = verdicts.get(risk.file.path)
+        if risk.risk == Risk.UNKNOWN and verdict is not None:
+            risk = FileRisk(risk.file, Risk(verdict.risk), verdict.reason)
+        classified.append(risk)
+
+    token_usage = usage_handler.token_usage() or TokenUsage.from_response(
+        response, stage="triage"
+    )
+    return classified, token_usage
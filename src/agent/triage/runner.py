@@ -0,0 +1,116 @@
+"""Review low-risk files with the triage model and the rest with MODEL_NAME."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ...config import MODEL_NAME, TRIAGE_CLASSIFY, TRIAGE_MODEL_NAME
+from ..cache import CacheStore
+from ..checkpointer import new_run_id
+from ..git_utils import FileChange
+from ..runner import ReviewResult, merge_review_results, run_review
+from ..tracing import traced
+from .classifier import classify_files
+from .scoring import FileRisk, Risk, score_files
+
+
+@traced("triaged review")
+def run_triaged_review(
+    repo_path: str,
+    target_branch: str,
+    changed_files: list[FileChange],
+    show_progress: bool = True,
+    additional_instructions: str | None = None,
+    sast_findings: str | None = None,
+    run_id: str | None = None,
+    fragment_cache: CacheStore | None = None,
+    classify: bool = TRIAGE_CLASSIFY,
+) -> ReviewResult:
+    """Route files by risk to a fast or the main model and merge the reviews.
+
+    Files are scored with path heuristics and SAST findings; with `classify`
+    the triage model rates the files the heuristics leave unknown. Low-risk
+    files are reviewed by TRIAGE_MODEL_NAME, everything else by MODEL_NAME,
+    both at once.
+
+    Args:
+        repo_path: Path to the git repository
+        target_branch: Target branch to compare against
+        changed_files: List of changed files to review
+        show_progress: Whether to show progress messages
+        additional_instructions: Optional additional review guidelines
+        sast_findings: Optional trimmed SAST findings JSON to include in context
+        run_id: Run ID; the two reviews' thread IDs are derived from it
+        fragment_cache: Optional per-file findings cache, used for the files
+            reviewed by MODEL_NAME only (its entries are keyed by MODEL_NAME)
+        classify: Whether the triage model rates files heuristics cannot place
+
+    Returns:
+        ReviewResult combining both reviews, usable for verification
+    """
+    run_id = run_id or new_run_id()
+
+    risks = score_files(changed_files, sast_findings)
+    triage_usage = None
+    if classify:
+        risks, triage_usage = classify_files(repo_path, target_branch, risks)
+
+    low = [r.file for r in risks if r.risk == Risk.LOW]
+    high = [r.file for r in risks if r.risk != Risk.LOW]
+    if show_progress:
+        _print_triage(risks)
+
+    # (heading, run ID suffix, files, model, fragment cache) per review
+    groups = [
+        (f"Low-risk files ({TRIAGE_MODEL_NAME})", "low", low, TRIAGE_MODEL_NAME, None),
+        (f"Other files ({MODEL_NAME})", "high", high, MODEL_NAME, fragment_cache),
+    ]
+    groups = [g for g in groups if g[2]]
+
+    def review_group(index: int) -> ReviewResult:
+        _, suffix, files, model_name, cache = groups[index]
+        return run_review(
+            repo_path=repo_path,
+            target_branch=target_branch,
+            changed_files=files,
+            show_progress=show_progress and len(groups) == 1,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings,
+            run_id=f"{run_id}-{suffix}",
+            fragment_cache=cache,
+            model_name=model_name,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        results = list(executor.map(review_group, range(len(groups))))
+
+    if len(results) == 1:
+        result = results[0]
+    else:
+        result = merge_review_results(
+            repo_path,
+            target_branch,
+            changed_files,
+            sast_findings,
+            run_id,
+            [(heading, r) for (heading, *_), r in zip(groups, results)],
+        )
+
+    if triage_usage:
+        result.token_usage = (
+            triage_usage + result.token_usage if result.token_usage else triage_usage
+        )
+    return result
+
+
+def _print_triage(risks: list[FileRisk]) -> None:
+    low = [r for r in risks if r.risk == Risk.LOW]
+    print(
+        f"Triage: {len(low)} low-risk files for {TRIAGE_MODEL_NAME}, "
+        f"{len(risks) - len(low)} for {MODEL_NAME}"
+    )
+    for risk in low[:10]:
+        print(f"  - {risk.file.path} ({risk.reason})")
+    if len(low) > 10:
+        print(f"  ... and {len(low) - 10} more")
+    print()
@@ -0,0 +1,139 @@
+"""Risk scoring of changed files from their paths and SAST findings."""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import posixpath
+from dataclasses import dataclass
+from enum import Enum
+
+from ..git_utils import FileChange
+
+
+class Risk(str, Enum):
+    """How much scrutiny a changed file needs."""
+
+    LOW = "low"
+    HIGH = "high"
+    # Heuristics cannot tell; reviewed as HIGH unless classified
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class FileRisk:
+    """Triage verdict for one changed file.
+
+    Attributes:
+        file: The changed file
+        risk: Assigned risk
+        reason: Short explanation shown in progress output
+    """
+
+    file: FileChange
+    risk: Risk
+    reason: str
+
+
+# Documentation, tests, fixtures and static assets (matched on the lowercase
+# path and on the file name). No "*.txt": requirements*.txt and similar
+# dependency manifests are not documentation. No "*.svg": SVG can carry
+# scripts and is served as markup
+LOW_RISK_PATTERNS = [
+    "*.md",
+    "*.rst",
+    "*.adoc",
+    "docs/*",
+    "*/docs/*",
+    "license*",
+    "changelog*",
+    "test_*.py",
+    "*_test.*",
+    "*.test.*",
+    "*.spec.*",
+    "test/*",
+    "tests/*",
+    "*/test/*",
+    "*/tests/*",
+    "*/__tests__/*",
+    "*/fixtures/*",
+    "*/testdata/*",
+    "*/__snapshots__/*",
+    "*.png",
+    "*.jpg",
+    "*.gif",
+    "*.ico",
+]
+
+# Path fragments of code that guards data, money or access
+HIGH_RISK_KEYWORDS = [
+    "auth",
+    "login",
+    "session",
+    "password",
+    "secret",
+    "token",
+    "crypt",
+    "permission",
+    "acl",
+    "admin",
+    "payment",
+    "billing",
+    "security",
+    "saniti",
+    "migration",
+    "sql",
+    ".github/workflows",
+    "dockerfile",
+]
+
+
+def sast_paths(sast_findings: str | None) -> set[str]:
+    """Paths with at least one finding in trimmed SAST findings JSON."""
+    if not sast_findings:
+        return set()
+    try:
+        findings = json.loads(sast_findings)
+    except json.JSONDecodeError:
+        return set()
+    return {f["path"] for f in findings if isinstance(f, dict) and f.get("path")}
+
+
+def score_file(change: FileChange, flagged_paths: set[str]) -> FileRisk:
+    """Assign a risk to a changed file.
+
+    SAST findings and paths naming security-sensitive areas make a file high
+    risk, checked first so that e.g. auth test fixtures get the full review;
+    otherwise documentation, tests and assets are low risk. Everything else
+    is unknown.
+
+    Args:
+        change: The changed file
+        flagged_paths: Paths with SAST findings
+
+    Returns:
+        FileRisk with the reason for the verdict
+    """
+    paths = [change.path] + ([change.old_path] if change.old_path else [])
+    if any(p in flagged_paths for p in paths):
+        return FileRisk(change, Risk.HIGH, "SAST finding")
+
+    for keyword in HIGH_RISK_KEYWORDS:
+        if any(keyword in p.lower() for p in paths):
+            return FileRisk(change, Risk.HIGH, f"path contains {keyword!r}")
+
+    path = change.path.lower()
+    name = posixpath.basename(path)
+    for pattern in LOW_RISK_PATTERNS:
+        if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(name, pattern):
+            return FileRisk(change, Risk.LOW, f"matches {pattern}")
+
+    return FileRisk(change, Risk.UNKNOWN, "no heuristic matched")
+
+
+def score_files(
+    changed_files: list[FileChange], sast_findings: str | None = None
+) -> list[FileRisk]:
+    """Score every changed file (see score_file)."""
+    flagged = sast_paths(sast_findings)
+    return [score_file(f, flagged) for f in changed_files]
@@ -6,11 +6,7 @@ from langchain.agents import create_agent
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
 
-from ...config import (
-    MAX_OUTPUT_TOKENS,
-    MODEL_PROVIDER,
-    VERIFY_MODEL_NAME,
-)
+from ...config import MAX_OUTPUT_TOKENS, VERIFY_MODEL_NAME
 from ..formatting.format_verification import (
     format_issues_with_answers,
     format_issues_with_ids,
@@ -19,15 +15,12 @@ from ..formatting.format_verification import (
 from ..middleware import init_agent_middleware
 from ..progress_callback_handler import ProgressCallbackHandler
 from ..prompts import get_prompt
-from ..providers import PROVIDER_REGISTRY
+from ..providers import get_model
 from ..schema import ReviewIssue
 from ..token_usage import TokenUsage
-from ..tools import (
-    FileContext,
-    ListFilesTool,
-    ReadFilePartTool,
-    SearchInFilesTool,
-)
+from ..token_usage_callback_handler import TokenUsageCallbackHandler
+from ..tools import FileContext, create_review_tools
+from ..tracing import traced
 from .schema import (
     AnswersOutput,
     QuestionsOutput,
@@ -36,7 +29,10 @@ from .schema import (
 
 
 def get_verification_model() -> BaseChatModel:
-    """Create model instance using VERIFY_MODEL_NAME config.
+    """Return the shared model instance for VERIFY_MODEL_NAME.
+
+    When VERIFY_MODEL_NAME equals MODEL_NAME this is the same instance the
+    primary review used.
 
     Returns:
         Configured model instance for verification.
@@ -44,19 +40,7 @@ def get_verification_model() -> BaseChatModel:
     Raises:
         ValueError: If MODEL_PROVIDER is not supported.
     """
-    factory = PROVIDER_REGISTRY.get(MODEL_PROVIDER)
-
-    if factory is None:
-        supported = ", ".join(PROVIDER_REGISTRY.keys())
-        raise ValueError(
-            f"Unsupported MODEL_PROVIDER: {MODEL_PROVIDER}. "
-            f"Supported providers: {supported}"
-        )
-
-    model: BaseChatModel = factory(
-        model_name=VERIFY_MODEL_NAME,
-        max_tokens=MAX_OUTPUT_TOKENS,
-    )
+    model: BaseChatModel = get_model(VERIFY_MODEL_NAME, MAX_OUTPUT_TOKENS)
     return model
 
 
@@ -64,6 +48,7 @@ def _invoke_agent(
     system_prompt: str,
     user_message: str,
     response_format: type,
+    stage: str,
 ) -> tuple[Any, TokenUsage | None]:
     """Invoke a verification agent and return structured output with token usage.
 
@@ -71,6 +56,7 @@ def _invoke_agent(
         system_prompt: System prompt for the agent
         user_message: User message content
         response_format: Pydantic model for structured output
+        stage: Pipeline stage name for token accounting
 
     Returns:
         Tuple of (structured output, TokenUsage or None)
@@ -84,6 +70,7 @@ def _invoke_agent(
         response_format=response_format,
     )
 
+    usage_handler = TokenUsageCallbackHandler(stage)
     response = agent.invoke(
         {
             "messages": [
@@ -93,15 +80,19 @@ def _invoke_agent(
                 }
             ],
         },
+        config={"callbacks": [usage_handler]},
     )
 
     if "structured_response" not in response:
         raise ValueError("Verification agent did not return structured output")
 
-    token_usage = TokenUsage.from_response(response)
+    token_usage = usage_handler.token_usage() or TokenUsage.from_response(
+        response, stage=stage
+    )
     return response["structured_response"], token_usage
 
 
+@traced("verify questions")
 def generate_questions(
     system_prompt: str,
     user_message: str,
@@ -131,9 +122,11 @@ def generate_questions(
         system_prompt=prompt,
         user_message="Generate verification questions for each issue.",
         response_format=QuestionsOutput,
+        stage="questions",
     )
 
 
+@traced("verify answers")
 def answer_questions(
     system_prompt: str,
     user_message: str,
@@ -169,12 +162,13 @@ def answer_questions(
     )
 
     # Create tools for additional code exploration
-    tools = [
-        ReadFilePartTool(repo_path=repo_path, file_context=file_context_tracker),
-        SearchInFilesTool(repo_path=repo_path, file_context=file_context_tracker),
-        ListFilesTool(repo_path=repo_path),
-    ]
+    tools = create_review_tools(repo_path, file_context_tracker)
+
+    callbacks: list[BaseCallbackHandler] = []
+    if show_progress:
+        callbacks.append(ProgressCallbackHandler())
 
+    usage_handler = TokenUsageCallbackHandler(stage="answers")
     model = get_verification_model()
     agent: Any = create_agent(
         model=model,
@@ -184,10 +178,6 @@ def answer_questions(
         response_format=AnswersOutput,
     )
 
-    callbacks: list[BaseCallbackHandler] = []
-    if show_progress:
-        callbacks.append(ProgressCallbackHandler())
-
     response = agent.invoke(
         {
             "messages": [
@@ -198,37 +188,43 @@ def answer_questions(
             ],
         },
         config={
-            "callbacks": callbacks,
+            "callbacks": [usage_handler, *callbacks],
         },
     )
 
     if "structured_response" not in response:
         raise ValueError("Verification agent did not return structured output")
 
-    token_usage = TokenUsage.from_response(response)
+    token_usage = usage_handler.token_usage() or TokenUsage.from_response(
+        response, stage="answers"
+    )
     return response["structured_response"], token_usage
 
 
+@traced("verify score")
 def score_issues(
     issues: list[ReviewIssue],
     answers: AnswersOutput,
+    issue_ids: list[int] | None = None,
 ) -> tuple[VerificationOutput, TokenUsage | None]:
     """Step 3: Call LLM to score confidence 1-10 based on Q&A evidence.
 
     Args:
         issues: List of issues being verified
         answers: Answers from step 2
+        issue_ids: IDs of `issues` when scoring a subset (default: 1..N)
 
     Returns:
         Tuple of (VerificationOutput, TokenUsage or None)
     """
     prompt_template = get_prompt("verify_score")
     prompt = prompt_template.format(
-        issues_with_answers=format_issues_with_answers(issues, answers),
+        issues_with_answers=format_issues_with_answers(issues, answers, issue_ids),
     )
 
     return _invoke_agent(
         system_prompt=prompt,
         user_message="Score confidence for each issue based on the Q&A evidence.",
         response_format=VerificationOutput,
+        stage="score",
     )
@@ -22,6 +22,20 @@ def assign_issue_ids(issues: list[ReviewIssue]) -> dict[int, ReviewIssue]:
     return {idx: issue for idx, issue in enumerate(issues, 1)}
 
 
+def group_issue_ids(issue_ids: list[int], group_size: int) -> list[list[int]]:
+    """Split issue IDs into consecutive groups for parallel verification.
+
+    Args:
+        issue_ids: IDs assigned in step 0.5
+        group_size: Maximum number of issues per group
+
+    Returns:
+        List of ID groups in original order
+    """
+    size = max(group_size, 1)
+    return [issue_ids[i : i + size] for i in range(0, len(issue_ids), size)]
+
+
 def merge_verification_results(
     issues: dict[int, ReviewIssue],
     verification: VerificationOutput,
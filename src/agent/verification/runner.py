@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from ..schema import PrimaryReviewOutput
+from ...config import VERIFY_CONCURRENCY, VERIFY_GROUP_SIZE
+from ..schema import PrimaryReviewOutput, ReviewIssue
 from ..token_usage import TokenUsage
 from ..tools import FileContext
+from ..tracing import traced
 from .agent import answer_questions, generate_questions, score_issues
-from .helpers import assign_issue_ids, merge_verification_results
-from .schema import VerifiedReviewOutput
+from .helpers import (
+    assign_issue_ids,
+    group_issue_ids,
+    merge_verification_results,
+)
+from .schema import (
+    QuestionsOutput,
+    VerificationOutput,
+    VerifiedReviewOutput,
+)
 
 
 def _show_progress(step: int, total: int = 3) -> None:
@@ -17,6 +28,7 @@ def _show_progress(step: int, total: int = 3) -> None:
     print(f"\r🔍 Verifying... (step {step}/{total})", end="", flush=True)
 
 
+@traced("verification")
 def run_verification(
     primary_output: PrimaryReviewOutput,
     system_prompt: str,
@@ -24,6 +36,8 @@ def run_verification(
     file_context: FileContext,
     repo_path: str,
     show_progress: bool = True,
+    concurrency: int = VERIFY_CONCURRENCY,
+    group_size: int = VERIFY_GROUP_SIZE,
 ) -> tuple[VerifiedReviewOutput, TokenUsage | None]:
     """Main entry point. Orchestrates steps 0.5->1->2->3->3.5.
 
@@ -31,6 +45,10 @@ def run_verification(
     Returns VerifiedReviewOutput with confidence scores, or unverified for
     issues with hallucinated/missing IDs.
 
+    With concurrency > 1, steps 2 and 3 run per group of `group_size` issues,
+    with up to `concurrency` groups in flight, so latency follows the slowest
+    group instead of the sum over all issues.
+
     Args:
         primary_output: Output from primary review agent
         system_prompt: Original review system prompt
@@ -38,6 +56,8 @@ def run_verification(
         file_context: FileContext with file content read during review
         repo_path: Path to the git repository (for answer agent tools)
         show_progress: Whether to show progress messages
+        concurrency: Maximum number of issue groups verified at once
+        group_size: Number of issues per group when running concurrently
 
     Returns:
         Tuple of (VerifiedReviewOutput, TokenUsage or None)
@@ -70,6 +90,89 @@ def run_verification(
     if usage1:
         token_usage = usage1
 
+    groups = group_issue_ids(list(issues_by_id), group_size)
+    if concurrency > 1 and len(groups) > 1:
+        # Steps 2-3 per issue group, in parallel
+        if show_progress:
+            _show_progress(2)
+            print(f" - {len(groups)} issue groups, {concurrency} at a time")
+
+        def verify_group(
+            issue_ids: list[int],
+        ) -> tuple[VerificationOutput, TokenUsage | None]:
+            return _answer_and_score(
+                issues_by_id,
+                issue_ids,
+                questions,
+                system_prompt,
+                user_message,
+                file_context_md,
+                repo_path,
+                file_context,
+                show_progress=False,
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            group_results = list(executor.map(verify_group, groups))
+
+        # Ignore scores a group reports for IDs outside the group
+        verification = VerificationOutput(
+            issues=[
+                v
+                for group, (result, _) in zip(groups, group_results)
+                for v in result.issues
+                if v.issue_id in group
+            ]
+        )
+        for _, group_usage in group_results:
+            if group_usage:
+                token_usage = token_usage + group_usage if token_usage else group_usage
+    else:
+        verification, usage23 = _answer_and_score(
+            issues_by_id,
+            list(issues_by_id),
+            questions,
+            system_prompt,
+            user_message,
+            file_context_md,
+            repo_path,
+            file_context,
+            show_progress=show_progress,
+        )
+        if usage23:
+            token_usage = token_usage + usage23 if token_usage else usage23
+
+    # Step 3.5: Merge results
+    verified_issues = merge_verification_results(issues_by_id, verification)
+
+    if show_progress:
+        # Clear progress line and show completion
+        print("\r" + " " * 40 + "\r", end="", file=sys.stdout)
+        print("✓ Verification completed")
+
+    return (
+        VerifiedReviewOutput(
+            description=primary_output.description,
+            issues=verified_issues,
+        ),
+        token_usage,
+    )
+
+
+def _answer_and_score(
+    issues_by_id: dict[int, ReviewIssue],
+    issue_ids: list[int],
+    questions: QuestionsOutput,
+    system_prompt: str,
+    user_message: str,
+    file_context_md: str,
+    repo_path: str,
+    file_context: FileContext,
+    show_progress: bool,
+) -> tuple[VerificationOutput, TokenUsage | None]:
+    """Run steps 2 and 3 for the given issue IDs."""
+    token_usage: TokenUsage | None = None
+
     # Step 2: Answer questions (with tools for additional code exploration)
     if show_progress:
         _show_progress(2)
@@ -78,36 +181,25 @@ def run_verification(
         system_prompt=system_prompt,
         user_message=user_message,
         file_context=file_context_md,
-        questions=questions,
+        questions=QuestionsOutput(
+            issues=[q for q in questions.issues if q.issue_id in issue_ids]
+        ),
         repo_path=repo_path,
         file_context_tracker=file_context,
         show_progress=show_progress,
     )
     if usage2:
-        token_usage = token_usage + usage2 if token_usage else usage2
+        token_usage = usage2
 
     # Step 3: Score issues
     if show_progress:
         _show_progress(3)
     verification, usage3 = score_issues(
-        issues=issues_list,
+        issues=[issues_by_id[issue_id] for issue_id in issue_ids],
         answers=answers,
+        issue_ids=issue_ids,
     )
     if usage3:
         token_usage = token_usage + usage3 if token_usage else usage3
 
-    # Step 3.5: Merge results
-    verified_issues = merge_verification_results(issues_by_id, verification)
-
-    if show_progress:
-        # Clear progress line and show completion
-        print("\r" + " " * 40 + "\r", end="", file=sys.stdout)
-        print("✓ Verification completed")
-
-    return (
-        VerifiedReviewOutput(
-            description=primary_output.description,
-            issues=verified_issues,
-        ),
-        token_usage,
-    )
+    return verification, token_usage
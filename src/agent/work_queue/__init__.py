@@ -0,0 +1,15 @@
+"""Shared job queue for running reviews on a fleet of workers."""
+
+from .sqlite_queue import SqliteJobQueue
+from .types import JobRecord, JobStatus, ReviewJob
+from .worker import process_job, run_job, run_worker
+
+__all__ = [
+    "JobRecord",
+    "JobStatus",
+    "ReviewJob",
+    "SqliteJobQueue",
+    "process_job",
+    "run_job",
+    "run_worker",
+]
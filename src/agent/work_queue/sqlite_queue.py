@@ -0,0 +1,250 @@
+"""SQLite-backed review job queue with leases and heartbeats."""
+
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+from .types import JobRecord, JobStatus, ReviewJob
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_token TEXT,
+    lease_expires_at REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class SqliteJobQueue:
+    """Review job queue shared by workers through a SQLite database file.
+
+    A claimed job is leased to one worker for `lease_seconds`. Workers extend
+    the lease with `heartbeat()`; if a worker dies, the lease expires and the
+    job becomes claimable again. Every claim issues a fresh lease token, and
+    `complete()`/`fail()` only succeed for the current token, so a worker that
+    lost its lease can never overwrite the result of the worker that took over.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        lease_seconds: int = 300,
+        max_attempts: int = 3,
+    ) -> None:
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # Rollback journal, not WAL: WAL's shared-memory index only works
+            # on one host, and workers on several hosts share this file
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, job: ReviewJob, job_id: str | None = None) -> str:
+        """Add a job to the queue.
+
+        Enqueueing is idempotent: if a job with the same ID already exists it
+        is left untouched, so retried submissions never create duplicates.
+
+        Args:
+            job: Review job description
+            job_id: Optional caller-chosen ID (e.g. "<repo>@<sha>")
+
+        Returns:
+            The job ID
+        """
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs "
+                "(id, payload, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, job.model_dump_json(), JobStatus.PENDING.value, now, now),
+            )
+        return job_id
+
+    def claim(self, worker_id: str) -> JobRecord | None:
+        """Lease the oldest claimable job to a worker.
+
+        A job is claimable when it is pending, or when it is running but its
+        lease has expired (the previous worker crashed or hung).
+
+        Args:
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            The claimed job with its lease token, or None if the queue is idle
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._fail_exhausted(conn, now)
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? "
+                    "OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (JobStatus.PENDING.value, JobStatus.RUNNING.value, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                lease_token = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, "
+                    "worker_id = ?, lease_token = ?, lease_expires_at = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    (
+                        JobStatus.RUNNING.value,
+                        worker_id,
+                        lease_token,
+                        now + self.lease_seconds,
+                        now,
+                        row["id"],
+                    ),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return self.get(row["id"])
+
+    def _fail_exhausted(self, conn: sqlite3.Connection, now: float) -> None:
+        """Mark expired jobs that used up all attempts as failed."""
+        conn.execute(
+            "UPDATE jobs SET status = ?, lease_token = NULL, updated_at = ?, "
+            "error = COALESCE(error, 'Lease expired') "
+            "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+            (
+                JobStatus.FAILED.value,
+                now,
+                JobStatus.RUNNING.value,
+                now,
+                self.max_attempts,
+            ),
+        )
+
+    def heartbeat(self, job_id: str, lease_token: str) -> bool:
+        """Extend the lease of a running job.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND lease_token = ? AND status = ?",
+                (
+                    now + self.lease_seconds,
+                    now,
+                    job_id,
+                    lease_token,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, lease_token: str, result: str) -> bool:
+        """Store the result of a job and mark it done.
+
+        Returns:
+            False if the lease was lost; the result is discarded in that case
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, "
+                "lease_token = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_token = ? AND status = ?",
+                (
+                    JobStatus.DONE.value,
+                    result,
+                    now,
+                    job_id,
+                    lease_token,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, lease_token: str, error: str) -> bool:
+        """Release a job after an error.
+
+        The job goes back to pending for another attempt, or to failed once
+        `max_attempts` is reached.
+
+        Returns:
+            False if the lease was lost
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "error = ?, lease_token = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_token = ? AND status = ?",
+                (
+                    self.max_attempts,
+                    JobStatus.FAILED.value,
+                    JobStatus.PENDING.value,
+                    error,
+                    now,
+                    job_id,
+                    lease_token,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> JobRecord | None:
+        """Fetch a job by ID."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        if row is None:
+            return None
+
+        return JobRecord(
+            id=row["id"],
+            job=ReviewJob.model_validate_json(row["payload"]),
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            worker_id=row["worker_id"],
+            lease_token=row["lease_token"],
+            result=row["result"],
+            error=row["error"],
+        )
+
+    def list_jobs(self) -> list[JobRecord]:
+        """List all jobs, oldest first."""
+        with self._connect() as conn:
+            ids = [
+                row["id"]
+                for row in conn.execute("SELECT id FROM jobs ORDER BY created_at")
+            ]
+        return [job for job_id in ids if (job := self.get(job_id))]
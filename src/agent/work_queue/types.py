@@ -0,0 +1,41 @@
+"""Type definitions for the review work queue."""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a queued review job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ReviewJob(BaseModel):
+    """A review request as submitted to the queue."""
+
+    repo_path: str = Field(description="Path to the git repository on the worker")
+    target_branch: str = Field(default="main", description="Branch to compare against")
+    instructions: str | None = Field(
+        default=None, description="Additional review guidelines (markdown content)"
+    )
+    verify: bool = Field(default=False, description="Run Chain of Verification")
+    sast: bool = Field(default=False, description="Run OpenGrep SAST pre-scan")
+
+
+class JobRecord(BaseModel):
+    """A job as stored in the queue, including lease and result state."""
+
+    id: str
+    job: ReviewJob
+    status: JobStatus
+    attempts: int
+    worker_id: str | None = None
+    lease_token: str | None = None
+    result: str | None = Field(
+        default=None, description="JSON-serialized review output"
+    )
+    error: str | None = None
@@ -0,0 +1,160 @@
+"""Worker loop that pulls review jobs from the queue and runs them."""
+
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+
+from ..git_utils import get_changed_files
+from ..runner import run_review
+from ..sast import run_sast_scan
+from ..schema import PrimaryReviewOutput
+from ..verification import VerifiedReviewOutput, run_verification
+from .sqlite_queue import SqliteJobQueue
+from .types import JobRecord, ReviewJob
+
+
+def default_worker_id() -> str:
+    """Build a worker ID that is unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _Heartbeat(threading.Thread):
+    """Background thread that keeps a job lease alive while it is processed."""
+
+    def __init__(self, queue: SqliteJobQueue, job_id: str, lease_token: str) -> None:
+        super().__init__(daemon=True)
+        self._queue = queue
+        self._job_id = job_id
+        self._lease_token = lease_token
+        self._interval = max(queue.lease_seconds / 3, 1.0)
+        self._stopped = threading.Event()
+        self.lease_lost = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            if not self._queue.heartbeat(self._job_id, self._lease_token):
+                self.lease_lost.set()
+                return
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def process_job(job: ReviewJob, show_progress: bool = True) -> str:
+    """Run a review job and return the JSON-serialized final output.
+
+    Args:
+        job: Review job description
+        show_progress: Whether to show progress messages
+
+    Returns:
+        JSON string of PrimaryReviewOutput or VerifiedReviewOutput
+    """
+    changed_files = get_changed_files(job.repo_path, job.target_branch)
+    if not changed_files:
+        empty = PrimaryReviewOutput(
+            description="No changes detected between current branch and target branch."
+        )
+        return json.dumps(empty.model_dump(), indent=2)
+
+    sast_findings_str = None
+    if job.sast:
+        sast_result = run_sast_scan(job.repo_path, job.target_branch)
+        if sast_result:
+            sast_findings_str = sast_result.findings
+
+    review_result = run_review(
+        repo_path=job.repo_path,
+        target_branch=job.target_branch,
+        changed_files=changed_files,
+        show_progress=show_progress,
+        additional_instructions=job.instructions,
+        sast_findings=sast_findings_str,
+    )
+
+    final_output: PrimaryReviewOutput | VerifiedReviewOutput = review_result.output
+    if job.verify and review_result.output.issues:
+        final_output, _ = run_verification(
+            primary_output=review_result.output,
+            system_prompt=review_result.system_prompt,
+            user_message=review_result.user_message,
+            file_context=review_result.file_context,
+            repo_path=job.repo_path,
+            show_progress=show_progress,
+        )
+
+    return json.dumps(final_output.model_dump(), indent=2)
+
+
+def run_job(
+    queue: SqliteJobQueue, record: JobRecord, show_progress: bool = True
+) -> bool:
+    """Process one claimed job, keeping its lease alive, and record the outcome.
+
+    Args:
+        queue: Queue the job was claimed from
+        record: Claimed job (must carry a lease token)
+        show_progress: Whether to show progress messages
+
+    Returns:
+        True if the job completed and its result was stored
+    """
+    assert record.lease_token is not None
+    heartbeat = _Heartbeat(queue, record.id, record.lease_token)
+    heartbeat.start()
+
+    try:
+        result = process_job(record.job, show_progress=show_progress)
+    except Exception:
+        heartbeat.stop()
+        queue.fail(record.id, record.lease_token, traceback.format_exc())
+        return False
+
+    heartbeat.stop()
+    if heartbeat.lease_lost.is_set():
+        print(f"⚠️  Lost lease on job {record.id}, discarding result")
+        return False
+
+    return queue.complete(record.id, record.lease_token, result)
+
+
+def run_worker(
+    queue: SqliteJobQueue,
+    worker_id: str | None = None,
+    poll_interval: float = 5.0,
+    once: bool = False,
+    show_progress: bool = True,
+) -> int:
+    """Pull and process jobs until the queue is drained (once) or forever.
+
+    Args:
+        queue: Shared job queue
+        worker_id: Worker identifier (defaults to hostname:pid)
+        poll_interval: Seconds to sleep when the queue is empty
+        once: Exit as soon as no job is claimable
+        show_progress: Whether to show progress messages
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+
+    while True:
+        record = queue.claim(worker_id)
+        if record is None:
+            if once:
+                return completed
+            time.sleep(poll_interval)
+            continue
+
+        print(f"▶ Job {record.id} (attempt {record.attempts}): {record.job.repo_path}")
+        if run_job(queue, record, show_progress=show_progress):
+            completed += 1
+            print(f"✓ Job {record.id} completed")
+        else:
+            print(f"✗ Job {record.id} did not complete")
@@ -21,6 +21,12 @@ ANTHROPIC_API_KEY = SecretStr(_anthropic_key)
 
 # Ollama configuration (required only if MODEL_PROVIDER=ollama)
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+# Context window requested at first and the most it may grow to for larger
+# prompts (every change reloads the model), and how long the model stays
+# loaded after a request (duration like "30m", or seconds, -1 = forever)
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "32768"))
+OLLAMA_MAX_NUM_CTX = int(os.getenv("OLLAMA_MAX_NUM_CTX", "131072"))
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
 # Moonshot configuration (required only if MODEL_PROVIDER=moonshot)
 _moonshot_key = os.getenv("MOONSHOT_API_KEY", "")
@@ -28,48 +34,166 @@ MOONSHOT_API_KEY = SecretStr(_moonshot_key)
 MOONSHOT_API_BASE = os.getenv("MOONSHOT_API_BASE", "https://api.moonshot.ai/v1")
 
 
+# Record/replay configuration (required only if MODEL_PROVIDER=replay):
+# "record" sends requests to REPLAY_PROVIDER and saves them with their
+# responses to REPLAY_CASSETTE; "replay" serves the saved responses offline
+REPLAY_MODE = os.getenv("REPLAY_MODE", "replay")
+REPLAY_CASSETTE = os.getenv("REPLAY_CASSETTE", "")
+REPLAY_PROVIDER = os.getenv("REPLAY_PROVIDER", "bedrock")
+
+
 # Model configuration
-def _get_default_model() -> str:
-    match MODEL_PROVIDER:
+def _get_default_model(provider: str = MODEL_PROVIDER) -> str:
+    match provider:
         case "bedrock":
             return "us.anthropic.claude-opus-4-5-20251101-v1:0"
         case "anthropic":
             return "claude-opus-4-5-20251101"
         case "moonshot":
             return "kimi-k2.5"
+        case "replay" if REPLAY_PROVIDER != "replay":
+            return _get_default_model(REPLAY_PROVIDER)
         case _:  # ollama
             return "deepseek-v3.1:671b-cloud"
 
 
 MODEL_NAME = os.getenv("MODEL_NAME", _get_default_model())
+
+
+def _get_default_triage_model(provider: str = MODEL_PROVIDER) -> str:
+    match provider:
+        case "bedrock":
+            return "us.anthropic.claude-haiku-4-5-20251001-v1:0"
+        case "anthropic":
+            return "claude-haiku-4-5-20251001"
+        case "replay" if REPLAY_PROVIDER != "replay":
+            return _get_default_triage_model(REPLAY_PROVIDER)
+        case _:  # no smaller default model, set TRIAGE_MODEL_NAME
+            return MODEL_NAME
+
+
+# Triage (--triage): low-risk files are reviewed by TRIAGE_MODEL_NAME; with
+# TRIAGE_CLASSIFY it also classifies files the path heuristics cannot place
+TRIAGE_MODEL_NAME = os.getenv("TRIAGE_MODEL_NAME", _get_default_triage_model())
+TRIAGE_CLASSIFY = os.getenv("TRIAGE_CLASSIFY", "false").lower() == "true"
 MAX_OUTPUT_TOKENS = int(os.getenv("MAX_OUTPUT_TOKENS", "10000"))
 TOOL_CALL_LIMIT = int(os.getenv("TOOL_CALL_LIMIT", "100"))
+# Wall-clock seconds and model tokens (input + output) per agent run before
+# final output is forced (0 = no limit)
+AGENT_TIME_BUDGET = float(os.getenv("AGENT_TIME_BUDGET", "0"))
+AGENT_TOKEN_BUDGET = int(os.getenv("AGENT_TOKEN_BUDGET", "0"))
+# HTTP connections per provider connection pool, seconds an idle connection
+# stays open, and HTTP/2 for providers that support it (needs the h2 package).
+# Over HTTP/1.1 the pool caps concurrent model calls of the process: calls
+# from shards and verification groups beyond it wait for a free connection
+MODEL_MAX_CONNECTIONS = int(os.getenv("MODEL_MAX_CONNECTIONS", "100"))
+MODEL_KEEPALIVE_SECONDS = float(os.getenv("MODEL_KEEPALIVE_SECONDS", "60"))
+MODEL_HTTP2 = os.getenv("MODEL_HTTP2", "false").lower() == "true"
+
+# Model calls per minute and input + output tokens per minute allowed per
+# model across all concurrent agents in the process (0 = unlimited), and
+# retries of throttled calls with jittered exponential backoff. These retry
+# after the provider SDK's own retries give up (Bedrock: 3 attempts,
+# Anthropic/Moonshot: 2 retries), so a call is attempted up to
+# SDK attempts x (RATE_LIMIT_MAX_RETRIES + 1) times
+RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_RPM", "0"))
+RATE_LIMIT_TPM = int(os.getenv("RATE_LIMIT_TPM", "0"))
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "6"))
+
+# JSON file adding to or overriding the built-in model price table used for
+# cost estimates (USD per million tokens)
+MODEL_PRICING_FILE = os.getenv("MODEL_PRICING_FILE", "")
 
 # Verification model (optional, defaults to MODEL_NAME)
 VERIFY_MODEL_NAME = os.getenv("VERIFY_MODEL_NAME", MODEL_NAME)
+# Verification steps 2-3 run per group of VERIFY_GROUP_SIZE issues, up to
+# VERIFY_CONCURRENCY groups at once (1 = all issues in a single batch)
+VERIFY_CONCURRENCY = int(os.getenv("VERIFY_CONCURRENCY", "1"))
+VERIFY_GROUP_SIZE = int(os.getenv("VERIFY_GROUP_SIZE", "1"))
 
 # Context management
 CONTEXT_COMPACT_THRESHOLD = int(os.getenv("CONTEXT_COMPACT_THRESHOLD", "140000"))
 MAX_DIFF_PER_FILE = int(os.getenv("MAX_DIFF_PER_FILE", "10000"))  # characters
+# Diffs with at most this many changed lines are reviewed in one model call
+# without tools, the code around each change inlined (0 = always use tools)
+FAST_PATH_MAX_DIFF_LINES = int(os.getenv("FAST_PATH_MAX_DIFF_LINES", "50"))
+
+# Sharded review (--shard): max files per sub-agent and sub-agents run at once
+SHARD_MAX_FILES = int(os.getenv("SHARD_MAX_FILES", "20"))
+SHARD_CONCURRENCY = int(os.getenv("SHARD_CONCURRENCY", "4"))
+
+# Checkpointing: "none" (default, no history), "memory", or "sqlite"
+# (durable, enables --resume). KEEP_LAST bounds retained snapshots per run
+# (0 = keep every step).
+CHECKPOINT_BACKEND = os.getenv("CHECKPOINT_BACKEND", "none")
+CHECKPOINT_KEEP_LAST = int(os.getenv("CHECKPOINT_KEEP_LAST", "1"))
+CHECKPOINT_DB_PATH = os.getenv(
+    "CHECKPOINT_DB_PATH",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "reviewcerberus", "checkpoints.sqlite"
+    ),
+)
+
+# Review result cache (--cache)
+REVIEW_CACHE_DIR = os.getenv(
+    "REVIEW_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "reviewcerberus", "reviews"),
+)
+
+# Work queue (reviewcerberus-worker)
+QUEUE_LEASE_SECONDS = int(os.getenv("QUEUE_LEASE_SECONDS", "300"))
+QUEUE_MAX_ATTEMPTS = int(os.getenv("QUEUE_MAX_ATTEMPTS", "3"))
+
+
+def validate_provider_config() -> None:
+    """Check that the credentials required by MODEL_PROVIDER are set.
+
+    Called before the first model is created rather than at import, so
+    commands that never reach a model (--help, no changes) skip it.
+
+    Raises:
+        ValueError: If MODEL_PROVIDER is unknown or its credentials are missing.
+    """
+    _validate_provider(MODEL_PROVIDER)
+
 
-# Validate required credentials based on provider
-if MODEL_PROVIDER == "bedrock":
-    if not all([AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION_NAME]):
+def _validate_provider(provider: str) -> None:
+    if provider == "bedrock":
+        if not all([AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION_NAME]):
+            raise ValueError(
+                "AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, and AWS_REGION_NAME "
+                "are required when MODEL_PROVIDER=bedrock"
+            )
+    elif provider == "anthropic":
+        if not _anthropic_key:
+            raise ValueError(
+                "ANTHROPIC_API_KEY is required when MODEL_PROVIDER=anthropic"
+            )
+    elif provider == "ollama":
+        # Ollama has no required credentials, base_url has default
+        pass
+    elif provider == "moonshot":
+        if not _moonshot_key:
+            raise ValueError(
+                "MOONSHOT_API_KEY is required when MODEL_PROVIDER=moonshot"
+            )
+    elif provider == "replay":
+        if not REPLAY_CASSETTE:
+            raise ValueError("REPLAY_CASSETTE is required when MODEL_PROVIDER=replay")
+        if REPLAY_MODE == "record":
+            if REPLAY_PROVIDER == "replay":
+                raise ValueError("REPLAY_PROVIDER cannot be 'replay'")
+            # Recording talks to the real provider
+            _validate_provider(REPLAY_PROVIDER)
+        elif REPLAY_MODE == "replay":
+            if not os.path.exists(REPLAY_CASSETTE):
+                raise ValueError(f"REPLAY_CASSETTE not found: {REPLAY_CASSETTE}")
+        else:
+            raise ValueError(
+                f"Invalid REPLAY_MODE: {REPLAY_MODE}. Must be 'record' or 'replay'"
+            )
+    else:
         raise ValueError(
-            "AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, and AWS_REGION_NAME "
-            "are required when MODEL_PROVIDER=bedrock"
+            f"Invalid MODEL_PROVIDER: {provider}. "
+            f"Must be 'bedrock', 'anthropic', 'ollama', 'moonshot', or 'replay'"
         )
-elif MODEL_PROVIDER == "anthropic":
-    if not _anthropic_key:
-        raise ValueError("ANTHROPIC_API_KEY is required when MODEL_PROVIDER=anthropic")
-elif MODEL_PROVIDER == "ollama":
-    # Ollama has no required credentials, base_url has default
-    pass
-elif MODEL_PROVIDER == "moonshot":
-    if not _moonshot_key:
-        raise ValueError("MOONSHOT_API_KEY is required when MODEL_PROVIDER=moonshot")
-else:
-    raise ValueError(
-        f"Invalid MODEL_PROVIDER: {MODEL_PROVIDER}. "
-        f"Must be 'bedrock', 'anthropic', 'ollama', or 'moonshot'"
-    )
@@ -1,22 +1,37 @@
+from __future__ import annotations
+
 import argparse
 import json
 import re
 import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+# Only lightweight modules are imported here; the review pipeline (langchain,
+# langgraph, provider SDKs) is imported in main() once there is work to do
 from .agent.formatting import format_review_content, render_structured_output
 from .agent.git_utils import (
     FileChange,
     get_changed_files,
     get_current_branch,
     get_repo_root,
+    is_ancestor,
+)
+from .agent.tracing import enable_tracing, trace_span
+from .config import (
+    CHECKPOINT_BACKEND,
+    MODEL_NAME,
+    MODEL_PROVIDER,
+    REVIEW_CACHE_DIR,
+    validate_provider_config,
 )
-from .agent.runner import run_review
-from .agent.sast import run_sast_scan
-from .agent.schema import PrimaryReviewOutput
-from .agent.verification import VerifiedReviewOutput, run_verification
-from .config import MODEL_NAME, MODEL_PROVIDER
+
+if TYPE_CHECKING:
+    from .agent.incremental import IncrementalReviewOutput
+    from .agent.schema import PrimaryReviewOutput
+    from .agent.token_usage import TokenUsage
+    from .agent.verification import VerifiedReviewOutput
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -54,6 +69,49 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="[Experimental] Run OpenGrep SAST pre-scan to augment the review",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse stored results: the whole review when the same commits were "
+        "already reviewed with the same prompt, model and flags, otherwise the "
+        "findings of files whose diff is unchanged (REVIEW_CACHE_DIR)",
+    )
+    parser.add_argument(
+        "--shard",
+        action="store_true",
+        help="Split large change sets into groups of related files reviewed by "
+        "parallel sub-agents (SHARD_MAX_FILES, SHARD_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--triage",
+        action="store_true",
+        help="Review low-risk files (docs, tests, fixtures) with the faster "
+        "TRIAGE_MODEL_NAME and the rest with MODEL_NAME, merging the results",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume an interrupted review from its last checkpoint "
+        "(requires CHECKPOINT_BACKEND=sqlite; pass the same options as the "
+        "original run)",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="SHA",
+        help="Incremental mode: review only commits after SHA (the HEAD of the "
+        "previous review) and merge with --previous-review",
+    )
+    parser.add_argument(
+        "--previous-review",
+        metavar="FILE",
+        help="JSON output of the previous review, used with --since",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write a Chrome trace-event JSON of LLM calls, tool calls and git "
+        "commands to FILE (open in chrome://tracing or ui.perfetto.dev)",
+    )
     return parser.parse_args()
 
 
@@ -104,9 +162,42 @@ def print_changed_files_summary(changed_files: list[FileChange]) -> None:
     print()
 
 
+def write_review_output(
+    output: PrimaryReviewOutput | VerifiedReviewOutput | IncrementalReviewOutput,
+    output_file: str,
+    json_output: bool,
+    token_usage: TokenUsage | None = None,
+) -> None:
+    if json_output:
+        data = output.model_dump()
+        if token_usage:
+            data["token_usage"] = token_usage.to_dict()
+        review_content = json.dumps(data, indent=2)
+    else:
+        review_content = render_structured_output(output)
+        review_content = format_review_content(review_content)
+
+    Path(output_file).write_text(review_content)
+    print(f"✓ Review completed and saved to: {output_file}")
+
+
 def main() -> None:
     args = parse_arguments()
 
+    if not args.trace:
+        run(args)
+        return
+
+    recorder = enable_tracing()
+    try:
+        with trace_span("reviewcerberus", "run"):
+            run(args)
+    finally:
+        recorder.write(args.trace)
+        print(f"Trace written to: {args.trace}")
+
+
+def run(args: argparse.Namespace) -> None:
     try:
         repo_path = get_repo_root(args.repo_path)
     except subprocess.CalledProcessError:
@@ -122,20 +213,102 @@ def main() -> None:
         print(f"Error: Could not determine current branch: {e.stderr}", file=sys.stderr)
         sys.exit(1)
 
+    # Same check as checkpointer.is_durable(), without importing langgraph
+    if args.resume and CHECKPOINT_BACKEND != "sqlite":
+        print("Error: --resume requires CHECKPOINT_BACKEND=sqlite", file=sys.stderr)
+        sys.exit(1)
+
+    if args.shard and args.resume:
+        print("Error: --shard cannot be combined with --resume", file=sys.stderr)
+        sys.exit(1)
+
+    if args.triage and (args.shard or args.resume):
+        print(
+            "Error: --triage cannot be combined with --shard or --resume",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    if bool(args.since) != bool(args.previous_review):
+        print(
+            "Error: --since and --previous-review must be used together",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    previous_review = ""
+    if args.since:
+        if args.verify or args.cache or args.resume or args.shard or args.triage:
+            print(
+                "Error: --since cannot be combined with --verify, --cache, "
+                "--resume, --shard or --triage",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        if not is_ancestor(repo_path, args.since):
+            print(
+                f"Error: {args.since} is not an ancestor of HEAD "
+                "(history rewritten?); run a full review instead",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        try:
+            previous_review = Path(args.previous_review).read_text()
+        except OSError as e:
+            print(f"Error: Could not read previous review: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Incremental mode diffs against the previously reviewed HEAD
+    diff_base = args.since or args.target_branch
+
     output_file = determine_output_file(args.output, current_branch, args.json)
     print_summary(repo_path, current_branch, args.target_branch, output_file)
     print_model_config(has_instructions=bool(args.instructions))
 
     try:
-        changed_files = get_changed_files(repo_path, args.target_branch)
+        changed_files = get_changed_files(repo_path, diff_base)
     except subprocess.CalledProcessError as e:
         print(f"Error: Could not get changed files: {e.stderr}", file=sys.stderr)
         sys.exit(1)
 
     if not changed_files:
-        print("No changes detected between current branch and target branch.")
+        if args.since:
+            print(f"No changes detected since {args.since}.")
+        else:
+            print("No changes detected between current branch and target branch.")
         sys.exit(0)
 
+    try:
+        validate_provider_config()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    from .agent.cache import (
+        DirectoryCacheStore,
+        build_review_cache_key,
+        load_cached_review,
+        save_cached_review,
+    )
+    from .agent.checkpointer import is_durable, new_run_id
+    from .agent.incremental import load_previous_issues, run_incremental_review
+    from .agent.prompts import build_review_system_prompt
+    from .agent.runner import run_review
+    from .agent.sast import run_sast_scan
+    from .agent.sharding import run_sharded_review
+    from .agent.triage import run_triaged_review
+    from .agent.verification import run_verification
+
+    previous_issues = []
+    if args.since:
+        try:
+            previous_issues = load_previous_issues(previous_review)
+        except ValueError as e:
+            print(f"Error: Could not read previous review: {e}", file=sys.stderr)
+            sys.exit(1)
+
     print_changed_files_summary(changed_files)
 
     print("Starting code review...")
@@ -151,10 +324,36 @@ def main() -> None:
         except Exception as e:
             print(f"Warning: Could not read instructions file: {e}", file=sys.stderr)
 
+    review_cache = None
+    cache_key = None
+    if args.cache:
+        review_cache = DirectoryCacheStore(REVIEW_CACHE_DIR)
+        cache_key = build_review_cache_key(
+            repo_path,
+            args.target_branch,
+            build_review_system_prompt(
+                additional_instructions, include_sast_guidance=args.sast
+            ),
+            verify=args.verify,
+            sast=args.sast,
+            shard=args.shard,
+            triage=args.triage,
+        )
+        cached_output = load_cached_review(review_cache, cache_key)
+        if cached_output is not None:
+            print("✓ Found cached review for these commits, skipping model calls")
+            write_review_output(cached_output, output_file, args.json)
+            return
+
+    run_id = args.resume or new_run_id()
+    if is_durable():
+        print(f"Run ID: {run_id} (resume with --resume {run_id})")
+        print()
+
     sast_findings_str = None
     if args.sast:
         print("Running SAST pre-scan (OpenGrep)...")
-        sast_result = run_sast_scan(repo_path, args.target_branch)
+        sast_result = run_sast_scan(repo_path, diff_base)
         if sast_result:
             sast_findings_str = sast_result.findings
             print(
@@ -165,13 +364,65 @@ def main() -> None:
             print("SAST: No findings")
         print()
 
-    review_result = run_review(
-        repo_path=repo_path,
-        target_branch=args.target_branch,
-        changed_files=changed_files,
-        additional_instructions=additional_instructions,
-        sast_findings=sast_findings_str,
-    )
+    if args.since:
+        print(
+            f"Incremental review since {args.since[:7]} "
+            f"({len(previous_issues)} previous issues)"
+        )
+        print()
+        incremental_result = run_incremental_review(
+            repo_path=repo_path,
+            previous_head=args.since,
+            changed_files=changed_files,
+            previous_issues=previous_issues,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings_str,
+        )
+
+        print()
+        write_review_output(
+            incremental_result.output,
+            output_file,
+            args.json,
+            incremental_result.token_usage,
+        )
+
+        if incremental_result.token_usage:
+            print()
+            incremental_result.token_usage.print()
+        return
+
+    if args.triage:
+        review_result = run_triaged_review(
+            repo_path=repo_path,
+            target_branch=args.target_branch,
+            changed_files=changed_files,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings_str,
+            run_id=run_id,
+            fragment_cache=review_cache,
+        )
+    elif args.shard:
+        review_result = run_sharded_review(
+            repo_path=repo_path,
+            target_branch=args.target_branch,
+            changed_files=changed_files,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings_str,
+            run_id=run_id,
+            fragment_cache=review_cache,
+        )
+    else:
+        review_result = run_review(
+            repo_path=repo_path,
+            target_branch=args.target_branch,
+            changed_files=changed_files,
+            additional_instructions=additional_instructions,
+            sast_findings=sast_findings_str,
+            run_id=run_id,
+            resume=bool(args.resume),
+            fragment_cache=review_cache,
+        )
 
     # Optionally run verification
     final_output: PrimaryReviewOutput | VerifiedReviewOutput
@@ -186,21 +437,21 @@ def main() -> None:
             file_context=review_result.file_context,
             repo_path=repo_path,
         )
-        if verify_token_usage and total_token_usage:
-            total_token_usage = total_token_usage + verify_token_usage
+        if verify_token_usage:
+            total_token_usage = (
+                total_token_usage + verify_token_usage
+                if total_token_usage
+                else verify_token_usage
+            )
     else:
         final_output = review_result.output
 
+    if review_cache is not None and cache_key is not None:
+        save_cached_review(review_cache, cache_key, final_output)
+
     # Render output
     print()
-    if args.json:
-        review_content = json.dumps(final_output.model_dump(), indent=2)
-    else:
-        review_content = render_structured_output(final_output)
-        review_content = format_review_content(review_content)
-
-    Path(output_file).write_text(review_content)
-    print(f"✓ Review completed and saved to: {output_file}")
+    write_review_output(final_output, output_file, args.json, total_token_usage)
 
     if total_token_usage:
         print()
@@ -0,0 +1,142 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .agent.formatting import format_review_content, render_structured_output
+from .agent.schema import PrimaryReviewOutput
+from .agent.verification import VerifiedReviewOutput
+from .agent.work_queue import JobStatus, ReviewJob, SqliteJobQueue, run_worker
+from .config import QUEUE_LEASE_SECONDS, QUEUE_MAX_ATTEMPTS
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Distributed review workers backed by a shared SQLite queue"
+    )
+    parser.add_argument(
+        "--queue", required=True, help="Path to the shared queue database file"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = subparsers.add_parser("enqueue", help="Submit a review job")
+    enqueue.add_argument(
+        "--repo-path", required=True, help="Repository path on workers"
+    )
+    enqueue.add_argument(
+        "--target-branch",
+        default="main",
+        help="Target branch or commit hash to compare against (default: main)",
+    )
+    enqueue.add_argument(
+        "--instructions",
+        help="Path to markdown file with additional instructions for the reviewer",
+    )
+    enqueue.add_argument(
+        "--job-id",
+        help="Job ID; re-submitting an existing ID is a no-op (default: random)",
+    )
+    enqueue.add_argument("--verify", action="store_true", help="Run verification")
+    enqueue.add_argument("--sast", action="store_true", help="Run SAST pre-scan")
+
+    work = subparsers.add_parser("work", help="Process jobs from the queue")
+    work.add_argument("--worker-id", help="Worker identifier (default: host:pid)")
+    work.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between polls when the queue is empty (default: 5)",
+    )
+    work.add_argument(
+        "--once", action="store_true", help="Exit when no job is claimable"
+    )
+
+    subparsers.add_parser("status", help="List jobs and their state")
+
+    result = subparsers.add_parser("result", help="Print or save a job result")
+    result.add_argument("job_id", help="Job ID")
+    result.add_argument("--output", help="Output file path (default: stdout)")
+    result.add_argument(
+        "--json", action="store_true", help="Output JSON instead of markdown"
+    )
+
+    return parser.parse_args()
+
+
+def _render_result(result: str, json_output: bool) -> str:
+    if json_output:
+        return result
+
+    data = json.loads(result)
+    output: PrimaryReviewOutput | VerifiedReviewOutput
+    if any("confidence" in issue for issue in data.get("issues", [])):
+        output = VerifiedReviewOutput.model_validate(data)
+    else:
+        output = PrimaryReviewOutput.model_validate(data)
+    return format_review_content(render_structured_output(output))
+
+
+def main() -> None:
+    args = parse_arguments()
+    queue = SqliteJobQueue(
+        args.queue,
+        lease_seconds=QUEUE_LEASE_SECONDS,
+        max_attempts=QUEUE_MAX_ATTEMPTS,
+    )
+
+    if args.command == "enqueue":
+        instructions = None
+        if args.instructions:
+            instructions = Path(args.instructions).read_text()
+        job_id = queue.enqueue(
+            ReviewJob(
+                repo_path=args.repo_path,
+                target_branch=args.target_branch,
+                instructions=instructions,
+                verify=args.verify,
+                sast=args.sast,
+            ),
+            job_id=args.job_id,
+        )
+        print(job_id)
+
+    elif args.command == "work":
+        completed = run_worker(
+            queue,
+            worker_id=args.worker_id,
+            poll_interval=args.poll_interval,
+            once=args.once,
+        )
+        print(f"Completed {completed} job{'s' if completed != 1 else ''}")
+
+    elif args.command == "status":
+        for job_record in queue.list_jobs():
+            print(
+                f"{job_record.id}  {job_record.status.value:<8} "
+                f"attempts={job_record.attempts}  "
+                f"{job_record.job.repo_path}@{job_record.job.target_branch}"
+            )
+
+    elif args.command == "result":
+        record = queue.get(args.job_id)
+        if record is None:
+            print(f"Error: Unknown job '{args.job_id}'", file=sys.stderr)
+            sys.exit(1)
+        if record.status != JobStatus.DONE or record.result is None:
+            print(
+                f"Error: Job '{args.job_id}' is {record.status.value}"
+                + (f": {record.error}" if record.error else ""),
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        content = _render_result(record.result, args.json)
+        if args.output:
+            Path(args.output).write_text(content)
+            print(f"✓ Result saved to: {args.output}")
+        else:
+            print(content)
+
+
+if __name__ == "__main__":
+    main()
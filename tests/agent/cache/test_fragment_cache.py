@@ -0,0 +1,100 @@
+"""Tests for the per-file fragment cache."""
+
+import tempfile
+
+from src.agent.cache import (
+    DirectoryCacheStore,
+    FileFragment,
+    build_file_fragments,
+    load_cached_fragments,
+    normalize_diff,
+    save_fragments,
+)
+from src.agent.git_utils import get_changed_files
+from src.agent.schema import IssueCategory, IssueLocation, IssueSeverity, ReviewIssue
+from tests.test_helper import create_test_repo
+
+DIFF = """diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -10,3 +10,4 @@ def handler():
+     value = load()
++    check(value)
+     return value
+"""
+
+REBASED_DIFF = """diff --git a/app.py b/app.py
+index 3333333..4444444 100644
+--- a/app.py
++++ b/app.py
+@@ -30,3 +30,4 @@ def handler():
+     value = load()
++    check(value)
+     return value
+"""
+
+
+def _make_issue(*locations: IssueLocation) -> ReviewIssue:
+    return ReviewIssue(
+        title="Issue",
+        category=IssueCategory.LOGIC,
+        severity=IssueSeverity.MEDIUM,
+        location=list(locations),
+        explanation="Explanation",
+        suggested_fix="Fix",
+    )
+
+
+def test_normalize_diff_ignores_blob_hashes_and_offsets() -> None:
+    normalized, hunk_starts = normalize_diff(DIFF)
+    rebased, rebased_starts = normalize_diff(REBASED_DIFF)
+
+    assert normalized == rebased
+    assert hunk_starts == [10]
+    assert rebased_starts == [30]
+
+
+def test_cached_issue_lines_follow_hunk_offset() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = DirectoryCacheStore(tmpdir)
+        issue = _make_issue(IssueLocation(filename="app.py", line=11))
+        save_fragments(store, [FileFragment("app.py", "k" * 64, [10])], [issue])
+
+        hits = load_cached_fragments(store, [FileFragment("app.py", "k" * 64, [30])])
+
+        assert hits["app.py"][0].location[0].line == 31
+
+
+def test_files_with_cross_file_issues_are_not_cached() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = DirectoryCacheStore(tmpdir)
+        fragments = [
+            FileFragment("a.py", "a" * 64, [1]),
+            FileFragment("b.py", "b" * 64, [1]),
+            FileFragment("c.py", "c" * 64, [1]),
+        ]
+        cross_file = _make_issue(
+            IssueLocation(filename="a.py"), IssueLocation(filename="b.py")
+        )
+        save_fragments(store, fragments, [cross_file])
+
+        hits = load_cached_fragments(store, fragments)
+
+        # c.py had no issues and is cached as clean
+        assert hits == {"c.py": []}
+
+
+def test_fragment_keys_cover_sast_findings() -> None:
+    with create_test_repo() as repo_path:
+        changed_files = get_changed_files(str(repo_path), "main")
+
+        def keys(sast_findings: str | None) -> list[str]:
+            fragments = build_file_fragments(
+                str(repo_path), "main", changed_files, "prompt", sast_findings
+            )
+            return [f.key for f in fragments]
+
+        assert keys('{"findings": [1]}') == keys('{"findings": [1]}')
+        assert keys('{"findings": [1]}') != keys('{"findings": [2]}')
+        assert keys(None) != keys('{"findings": [1]}')
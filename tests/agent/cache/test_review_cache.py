@@ -0,0 +1,95 @@
+"""Tests for the whole-review result cache."""
+
+import subprocess
+import tempfile
+from unittest.mock import patch
+
+from src.agent.cache import (
+    DirectoryCacheStore,
+    build_review_cache_key,
+    load_cached_review,
+    save_cached_review,
+)
+from src.agent.schema import PrimaryReviewOutput
+from src.agent.verification import VerifiedReviewOutput
+from tests.test_helper import create_test_repo
+
+
+def test_key_is_stable_for_unchanged_inputs() -> None:
+    with create_test_repo() as repo_path:
+        key1 = build_review_cache_key(str(repo_path), "main", "prompt", False, False)
+        key2 = build_review_cache_key(str(repo_path), "main", "prompt", False, False)
+
+        assert key1 == key2
+
+
+def test_key_changes_with_prompt_and_flags() -> None:
+    with create_test_repo() as repo_path:
+        base = build_review_cache_key(str(repo_path), "main", "prompt", False, False)
+
+        assert base != build_review_cache_key(
+            str(repo_path), "main", "other prompt", False, False
+        )
+        assert base != build_review_cache_key(
+            str(repo_path), "main", "prompt", True, False
+        )
+        assert base != build_review_cache_key(
+            str(repo_path), "main", "prompt", False, True
+        )
+
+
+def test_key_changes_with_review_and_verification_settings() -> None:
+    with create_test_repo() as repo_path:
+        base = build_review_cache_key(str(repo_path), "main", "prompt", True, False)
+
+        with patch("src.agent.cache.review_cache.FAST_PATH_MAX_DIFF_LINES", 0):
+            assert base != build_review_cache_key(
+                str(repo_path), "main", "prompt", True, False
+            )
+        with patch("src.agent.cache.review_cache.VERIFY_CONCURRENCY", 4):
+            assert base != build_review_cache_key(
+                str(repo_path), "main", "prompt", True, False
+            )
+        with patch("src.agent.cache.review_cache.VERIFY_GROUP_SIZE", 3):
+            assert base != build_review_cache_key(
+                str(repo_path), "main", "prompt", True, False
+            )
+
+
+def test_key_changes_with_new_commit() -> None:
+    with create_test_repo() as repo_path:
+        before = build_review_cache_key(str(repo_path), "main", "prompt", False, False)
+
+        (repo_path / "file2.py").write_text("def world():\n    return 1\n")
+        subprocess.run(
+            ["git", "-C", str(repo_path), "commit", "-am", "Change file2"],
+            check=True,
+            capture_output=True,
+        )
+
+        after = build_review_cache_key(str(repo_path), "main", "prompt", False, False)
+        assert before != after
+
+
+def test_store_roundtrip_keeps_output_type() -> None:
+    primary = PrimaryReviewOutput(description="Primary", issues=[])
+    verified = VerifiedReviewOutput(description="Verified", issues=[])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = DirectoryCacheStore(tmpdir)
+        save_cached_review(store, "a" * 64, primary)
+        save_cached_review(store, "b" * 64, verified)
+
+        assert load_cached_review(store, "a" * 64) == primary
+        loaded = load_cached_review(store, "b" * 64)
+        assert isinstance(loaded, VerifiedReviewOutput)
+        assert loaded.description == "Verified"
+
+
+def test_miss_and_corrupt_entry_return_none() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = DirectoryCacheStore(tmpdir)
+        assert load_cached_review(store, "c" * 64) is None
+
+        store.put("d" * 64, "not json")
+        assert load_cached_review(store, "d" * 64) is None
@@ -0,0 +1,62 @@
+"""Tests for the bounded in-memory checkpointer."""
+
+import operator
+from typing import Annotated, Any, TypedDict
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+from src.agent.checkpointer import BoundedInMemorySaver
+
+CONFIG: RunnableConfig = {"configurable": {"thread_id": "run1"}}
+
+
+class _State(TypedDict):
+    messages: Annotated[list[str], operator.add]
+
+
+def _append(state: _State) -> dict[str, Any]:
+    return {"messages": [f"message {len(state['messages'])}"]}
+
+
+def _build_graph(saver: BoundedInMemorySaver, steps: int) -> CompiledStateGraph[Any]:
+    graph = StateGraph(_State)
+    previous = START
+    for i in range(steps):
+        graph.add_node(f"step{i}", _append)
+        graph.add_edge(previous, f"step{i}")
+        previous = f"step{i}"
+    graph.add_edge(previous, END)
+    return graph.compile(checkpointer=saver)
+
+
+def test_keeps_only_latest_checkpoints() -> None:
+    saver = BoundedInMemorySaver(keep_last=2)
+    graph = _build_graph(saver, steps=20)
+
+    result = graph.invoke({"messages": []}, CONFIG)
+
+    assert len(result["messages"]) == 20
+    assert len(saver.storage["run1"][""]) == 2
+    assert len(list(saver.list(CONFIG))) == 2
+
+    # Only blobs for the retained checkpoints remain
+    message_blobs = [key for key in saver.blobs if key[2] == "messages"]
+    assert len(message_blobs) <= 2
+
+    # Latest state is intact
+    state = graph.get_state(CONFIG)
+    assert state.values["messages"][-1] == "message 19"
+
+
+def test_pruning_is_per_thread() -> None:
+    saver = BoundedInMemorySaver(keep_last=1)
+    graph = _build_graph(saver, steps=5)
+
+    graph.invoke({"messages": []}, CONFIG)
+    graph.invoke({"messages": []}, {"configurable": {"thread_id": "run2"}})
+
+    assert len(saver.storage["run1"][""]) == 1
+    assert len(saver.storage["run2"][""]) == 1
+    assert len(graph.get_state(CONFIG).values["messages"]) == 5
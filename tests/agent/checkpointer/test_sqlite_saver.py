@@ -0,0 +1,107 @@
+"""Tests for the SQLite checkpointer."""
+
+import operator
+import tempfile
+from pathlib import Path
+from typing import Annotated, Any, TypedDict
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+from src.agent.checkpointer import SqliteSaver
+
+CONFIG: RunnableConfig = {"configurable": {"thread_id": "run1"}}
+
+
+class _State(TypedDict):
+    steps: Annotated[list[str], operator.add]
+    crash: bool
+
+
+def _step_a(state: _State) -> dict[str, Any]:
+    return {"steps": ["a"]}
+
+
+def _step_b(state: _State) -> dict[str, Any]:
+    return {"steps": ["b"]}
+
+
+def _step_c(state: _State) -> dict[str, Any]:
+    if state["crash"]:
+        raise RuntimeError("crash in c")
+    return {"steps": ["c"]}
+
+
+def _build_graph(saver: SqliteSaver) -> CompiledStateGraph[Any]:
+    graph = StateGraph(_State)
+    graph.add_node("a", _step_a)
+    graph.add_node("b", _step_b)
+    graph.add_node("c", _step_c)
+    graph.add_edge(START, "a")
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "c")
+    graph.add_edge("c", END)
+    return graph.compile(checkpointer=saver)
+
+
+def test_checkpoints_survive_new_saver_instance() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "checkpoints.sqlite")
+
+        _build_graph(SqliteSaver(db_path)).invoke({"steps": [], "crash": False}, CONFIG)
+
+        # A fresh process (new saver) sees the finished state
+        state = _build_graph(SqliteSaver(db_path)).get_state(CONFIG)
+        assert state.values["steps"] == ["a", "b", "c"]
+        assert not state.next
+
+
+def test_resume_continues_from_last_completed_step() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "checkpoints.sqlite")
+
+        try:
+            _build_graph(SqliteSaver(db_path)).invoke(
+                {"steps": [], "crash": True}, CONFIG
+            )
+        except RuntimeError:
+            pass
+
+        resumed = _build_graph(SqliteSaver(db_path))
+        state = resumed.get_state(CONFIG)
+        assert state.values["steps"] == ["a", "b"]
+        assert state.next == ("c",)
+
+        resumed.update_state(CONFIG, {"crash": False})
+        result = resumed.invoke(None, CONFIG)
+
+        # a and b are not re-run
+        assert result["steps"] == ["a", "b", "c"]
+
+
+def test_list_and_delete_thread() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        saver = SqliteSaver(str(Path(tmpdir) / "checkpoints.sqlite"))
+        _build_graph(saver).invoke({"steps": [], "crash": False}, CONFIG)
+
+        assert len(list(saver.list(CONFIG))) > 2
+        assert len(list(saver.list(CONFIG, limit=2))) == 2
+
+        saver.delete_thread("run1")
+        assert saver.get_tuple(CONFIG) is None
+
+
+def test_keep_last_prunes_old_checkpoints() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        saver = SqliteSaver(str(Path(tmpdir) / "checkpoints.sqlite"), keep_last=1)
+        _build_graph(saver).invoke({"steps": [], "crash": False}, CONFIG)
+
+        assert len(list(saver.list(CONFIG))) == 1
+        checkpoint_tuple = saver.get_tuple(CONFIG)
+        assert checkpoint_tuple is not None
+        assert checkpoint_tuple.checkpoint["channel_values"]["steps"] == [
+            "a",
+            "b",
+            "c",
+        ]
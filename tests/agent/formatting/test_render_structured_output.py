@@ -5,6 +5,11 @@ from src.agent.formatting.render_structured_output import (
     _sort_issues,
     render_structured_output,
 )
+from src.agent.incremental import (
+    IncrementalReviewOutput,
+    IssueStatus,
+    TrackedReviewIssue,
+)
 from src.agent.schema import (
     IssueCategory,
     IssueLocation,
@@ -74,3 +79,26 @@ def test_render_structured_output_no_issues() -> None:
     result = render_structured_output(output)
 
     assert "No issues found during the review. ✅" in result
+
+
+def test_render_incremental_output_shows_status() -> None:
+    output = IncrementalReviewOutput(
+        description="Fixup commit.",
+        issues=[
+            TrackedReviewIssue(
+                **_make_issue(title="Fixed", severity=IssueSeverity.HIGH).model_dump(),
+                status=IssueStatus.RESOLVED,
+                status_rationale="Null check added",
+            ),
+            TrackedReviewIssue(
+                **_make_issue(title="Fresh", severity=IssueSeverity.LOW).model_dump(),
+                status=IssueStatus.NEW,
+            ),
+        ],
+    )
+    result = render_structured_output(output)
+
+    assert "| Status |" in result
+    assert "**Status:** ✅ Resolved - Null check added" in result
+    # Resolved issues are listed after unresolved ones regardless of severity
+    assert result.index("### 1. Fresh") < result.index("### 2. Fixed")
@@ -0,0 +1,21 @@
+"""Tests for get_merge_base and get_head_sha."""
+
+import subprocess
+
+from src.agent.git_utils import get_head_sha, get_merge_base
+from tests.test_helper import create_test_repo
+
+
+def test_get_merge_base_returns_fork_point() -> None:
+    """Test that the merge base is the tip of main and differs from HEAD."""
+    with create_test_repo() as repo_path:
+        main_sha = subprocess.run(
+            ["git", "-C", str(repo_path), "rev-parse", "main"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        assert get_merge_base(str(repo_path), "main") == main_sha
+        assert get_head_sha(str(repo_path)) != main_sha
+        assert len(get_head_sha(str(repo_path))) == 40
@@ -0,0 +1,11 @@
+"""Tests for is_ancestor."""
+
+from src.agent.git_utils import is_ancestor
+from tests.test_helper import create_test_repo
+
+
+def test_is_ancestor() -> None:
+    with create_test_repo() as repo_path:
+        assert is_ancestor(str(repo_path), "main")
+        assert is_ancestor(str(repo_path), "HEAD")
+        assert not is_ancestor(str(repo_path), "0" * 40)
@@ -0,0 +1,82 @@
+"""Tests for incremental re-review helpers."""
+
+import json
+
+import pytest
+
+from src.agent.incremental.helpers import (
+    format_previous_issues,
+    load_previous_issues,
+    merge_incremental_results,
+)
+from src.agent.incremental.schema import (
+    IncrementalReviewResponse,
+    IssueStatus,
+    PriorIssueStatus,
+)
+from src.agent.schema import IssueCategory, IssueLocation, IssueSeverity, ReviewIssue
+
+
+def _make_issue(title: str) -> ReviewIssue:
+    return ReviewIssue(
+        title=title,
+        category=IssueCategory.LOGIC,
+        severity=IssueSeverity.MEDIUM,
+        location=[IssueLocation(filename="app.py", line=3)],
+        explanation="Explanation",
+        suggested_fix="Fix",
+    )
+
+
+def test_load_previous_issues_skips_resolved() -> None:
+    raw = json.dumps(
+        {
+            "description": "Earlier review",
+            "issues": [
+                {**_make_issue("Open").model_dump(), "status": "OPEN"},
+                {**_make_issue("Done").model_dump(), "status": "RESOLVED"},
+                {**_make_issue("Verified").model_dump(), "confidence": 8},
+            ],
+        }
+    )
+
+    issues = load_previous_issues(raw)
+
+    assert [issue.title for issue in issues] == ["Open", "Verified"]
+
+
+def test_load_previous_issues_rejects_non_review_json() -> None:
+    with pytest.raises(ValueError):
+        load_previous_issues('["not", "a", "review"]')
+
+
+def test_format_previous_issues_numbers_issues() -> None:
+    text = format_previous_issues([_make_issue("First"), _make_issue("Second")])
+
+    assert "### Issue 1: First" in text
+    assert "### Issue 2: Second" in text
+    assert "app.py:3" in text
+
+
+def test_merge_marks_prior_issues_and_appends_new() -> None:
+    previous = [_make_issue("Fixed"), _make_issue("Untouched")]
+    response = IncrementalReviewResponse(
+        description="Fixup",
+        prior_issues=[
+            PriorIssueStatus(
+                issue_id=1, status=IssueStatus.RESOLVED, rationale="Guard added"
+            ),
+            PriorIssueStatus(issue_id=99, status=IssueStatus.RESOLVED, rationale="?"),
+        ],
+        new_issues=[_make_issue("Regression")],
+    )
+
+    merged = merge_incremental_results(previous, response)
+
+    assert [(i.title, i.status) for i in merged] == [
+        ("Fixed", IssueStatus.RESOLVED),
+        ("Untouched", IssueStatus.OPEN),
+        ("Regression", IssueStatus.NEW),
+    ]
+    assert merged[0].status_rationale == "Guard added"
+    assert merged[1].status_rationale is None
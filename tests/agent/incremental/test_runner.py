@@ -0,0 +1,67 @@
+"""Tests for the incremental review runner."""
+
+import subprocess
+from unittest.mock import patch
+
+from src.agent.git_utils import get_changed_files
+from src.agent.incremental import IssueStatus, run_incremental_review
+from src.agent.incremental.schema import IncrementalReviewResponse, PriorIssueStatus
+from src.agent.schema import IssueCategory, IssueLocation, IssueSeverity, ReviewIssue
+from tests.fake_chat_model import ScriptedChatModel, structured_response
+from tests.test_helper import create_test_repo
+
+
+def test_incremental_review_covers_only_new_commits() -> None:
+    previous_issue = ReviewIssue(
+        title="Missing return value check",
+        category=IssueCategory.LOGIC,
+        severity=IssueSeverity.HIGH,
+        location=[IssueLocation(filename="file1.py", line=3)],
+        explanation="Explanation",
+        suggested_fix="Fix",
+    )
+    response = IncrementalReviewResponse(
+        description="Fixup commit",
+        prior_issues=[
+            PriorIssueStatus(
+                issue_id=1, status=IssueStatus.RESOLVED, rationale="Check added"
+            )
+        ],
+    )
+
+    with create_test_repo() as repo_path:
+        previous_head = subprocess.run(
+            ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        (repo_path / "file2.py").write_text("def world():\n    return 'fixed'\n")
+        subprocess.run(
+            ["git", "-C", str(repo_path), "commit", "-am", "Fixup"],
+            check=True,
+            capture_output=True,
+        )
+
+        changed_files = get_changed_files(str(repo_path), previous_head)
+        model = ScriptedChatModel(script=[structured_response(response)])
+
+        with patch("src.agent.agent.model", model):
+            result = run_incremental_review(
+                repo_path=str(repo_path),
+                previous_head=previous_head,
+                changed_files=changed_files,
+                previous_issues=[previous_issue],
+                show_progress=False,
+            )
+
+    assert [f.path for f in changed_files] == ["file2.py"]
+
+    prompt = str(model.prompts[0][-1].content)
+    assert "### file2.py" in prompt
+    assert "### file1.py" not in prompt
+    assert "### Issue 1: Missing return value check" in prompt
+
+    assert result.output.description == "Fixup commit"
+    assert result.output.issues[0].status == IssueStatus.RESOLVED
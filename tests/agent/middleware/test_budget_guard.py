@@ -0,0 +1,87 @@
+"""Tests for the time and token budget guard."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agent.git_utils import get_changed_files
+from src.agent.middleware import BudgetExceeded, BudgetGuard
+from src.agent.prompts import get_prompt
+from src.agent.runner import run_review
+from src.agent.schema import PrimaryReviewOutput
+from tests.fake_chat_model import ScriptedChatModel, structured_response, tool_call
+from tests.test_helper import create_test_repo
+
+
+def test_token_budget_forces_final_output() -> None:
+    final = PrimaryReviewOutput(description="Partial review", issues=[])
+    model = ScriptedChatModel(
+        script=[
+            tool_call("read_file_part", {"file_path": "file1.py"}, "call1"),
+            # Ignores the warning
+            tool_call("read_file_part", {"file_path": "file3.py"}, "call2"),
+            structured_response(final),
+        ]
+    )
+
+    with create_test_repo() as repo_path, patch("src.agent.agent.model", model), patch(
+        "src.agent.middleware.AGENT_TOKEN_BUDGET", 100
+    ), patch("src.agent.middleware.budget_guard.AGENT_TOKEN_BUDGET", 100):
+        result = run_review(
+            repo_path=str(repo_path),
+            target_branch="main",
+            changed_files=get_changed_files(str(repo_path), "main"),
+            show_progress=False,
+        )
+
+    assert result.output.description == "Partial review"
+    assert model.prompts[1][-1].content == get_prompt("last_step")
+
+
+def _state(*messages: Any) -> Any:
+    return {"messages": list(messages)}
+
+
+def test_withholds_tools_then_stops() -> None:
+    with patch("src.agent.middleware.budget_guard.AGENT_TOKEN_BUDGET", 100):
+        guard = BudgetGuard()
+    state = _state(HumanMessage(content="diff"))
+    usage = {"input_tokens": 85, "output_tokens": 5, "total_tokens": 90}
+
+    guard.after_model(_state(AIMessage(content="", usage_metadata=usage)), Mock())
+    update = guard.before_model(state, Mock())
+    assert update is not None and guard.warned
+
+    guard.after_model(_state(AIMessage(content="")), Mock())
+    assert guard.before_model(state, Mock()) is None
+    assert guard.forced
+
+    request = Mock()
+    handler = Mock()
+    guard.wrap_model_call(request, handler)
+    request.override.assert_called_once_with(tools=[])
+    handler.assert_called_once_with(request.override.return_value)
+
+    with pytest.raises(BudgetExceeded):
+        guard.before_model(state, Mock())
+
+
+def test_counts_bedrock_cached_input() -> None:
+    with patch("src.agent.middleware.budget_guard.AGENT_TOKEN_BUDGET", 1000):
+        guard = BudgetGuard()
+    message = AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": 4,
+            "output_tokens": 38,
+            "total_tokens": 42,
+            "input_token_details": {"cache_read": 1525, "cache_creation": 0},
+        },
+        response_metadata={"model_provider": "bedrock_converse"},
+    )
+
+    guard.after_model(_state(message), Mock())
+
+    assert guard.tokens == 1567
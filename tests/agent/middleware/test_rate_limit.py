@@ -0,0 +1,125 @@
+"""Tests for shared model call rate limits."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain.agents.middleware.types import ModelResponse
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agent.middleware import RateLimiter, RateLimitMiddleware
+from src.agent.middleware.rate_limit import is_throttling_error
+
+
+class ThrottlingError(Exception):
+    """Shaped like a botocore ClientError for a throttled Bedrock call."""
+
+    response = {"Error": {"Code": "ThrottlingException"}}
+
+
+def test_token_limit_spaces_out_requests() -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+
+    with patch("src.agent.middleware.rate_limit.time.sleep") as sleep:
+        assert limiter.acquire(600) == 0
+        waited = limiter.acquire(100)
+
+    # 600 tokens per minute refill 10 per second
+    assert waited == pytest.approx(10, abs=0.1)
+    sleep.assert_called_once_with(waited)
+
+
+def test_settle_returns_overestimated_tokens() -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+
+    with patch("src.agent.middleware.rate_limit.time.sleep"):
+        limiter.acquire(600)
+        limiter.settle(estimated=600, actual=100)
+        assert limiter.acquire(400) == 0
+
+
+def _request() -> Mock:
+    request = Mock()
+    request.system_message = None
+    request.messages = [HumanMessage(content="diff")]
+    return request
+
+
+def test_retries_throttled_calls_with_backoff() -> None:
+    response = ModelResponse(result=[AIMessage(content="done")])
+    handler = Mock(side_effect=[ThrottlingError(), ThrottlingError(), response])
+
+    with patch("src.agent.middleware.rate_limit.time.sleep") as sleep, patch(
+        "src.agent.middleware.rate_limit.random.uniform", side_effect=[1.0, 3.0]
+    ):
+        result = RateLimitMiddleware().wrap_model_call(_request(), handler)
+
+    assert result is response
+    assert handler.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [
+        pytest.approx(1.0, abs=0.1),
+        pytest.approx(3.0, abs=0.1),
+    ]
+
+
+def test_retries_return_their_token_reservation() -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+    request = _request()
+    request.messages = [HumanMessage(content="x" * 400)]
+    response = ModelResponse(
+        result=[
+            AIMessage(
+                content="done",
+                usage_metadata={
+                    "input_tokens": 40,
+                    "output_tokens": 10,
+                    "total_tokens": 50,
+                },
+            )
+        ]
+    )
+    handler = Mock(side_effect=[ThrottlingError(), ThrottlingError(), response])
+
+    # No backoff pause, so the next acquire waits only for tokens
+    with patch("src.agent.middleware.rate_limit.time.sleep"), patch(
+        "src.agent.middleware.rate_limit.random.uniform", return_value=0.0
+    ), patch("src.agent.middleware.rate_limit.get_rate_limiter", return_value=limiter):
+        RateLimitMiddleware().wrap_model_call(request, handler)
+
+        # Only the successful call's 50 tokens were drawn from the bucket
+        assert limiter.acquire(540) == 0
+
+
+def test_settles_bedrock_usage_with_cached_input() -> None:
+    limiter = Mock()
+    response = ModelResponse(
+        result=[
+            AIMessage(
+                content="done",
+                usage_metadata={
+                    "input_tokens": 4,
+                    "output_tokens": 38,
+                    "total_tokens": 42,
+                    "input_token_details": {"cache_read": 1525, "cache_creation": 300},
+                },
+                response_metadata={"model_provider": "bedrock_converse"},
+            )
+        ]
+    )
+
+    with patch(
+        "src.agent.middleware.rate_limit.get_rate_limiter", return_value=limiter
+    ):
+        RateLimitMiddleware().wrap_model_call(_request(), Mock(return_value=response))
+
+    limiter.settle.assert_called_once()
+    assert limiter.settle.call_args.args[1] == 4 + 1525 + 300 + 38
+
+
+def test_other_errors_are_not_retried() -> None:
+    handler = Mock(side_effect=TimeoutError("provider timeout"))
+
+    with pytest.raises(TimeoutError):
+        RateLimitMiddleware().wrap_model_call(_request(), handler)
+
+    assert handler.call_count == 1
+    assert not is_throttling_error(TimeoutError())
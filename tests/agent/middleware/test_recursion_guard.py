@@ -0,0 +1,55 @@
+"""Tests for the tool call limit guard."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from src.agent.middleware import RecursionGuard, ToolCallLimitExceeded
+
+
+def _tool_round(n: int) -> list[BaseMessage]:
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_files", "args": {}, "id": f"c{n}"}],
+            id=f"a{n}",
+        ),
+        ToolMessage(content="files", tool_call_id=f"c{n}", id=f"t{n}"),
+    ]
+
+
+def _state(messages: list[BaseMessage]) -> Any:
+    return {"messages": list(messages)}
+
+
+def test_counts_tool_messages_across_steps() -> None:
+    guard = RecursionGuard()
+    messages: list[BaseMessage] = [HumanMessage(content="diff", id="h")]
+
+    with patch("src.agent.middleware.recursion_guard.TOOL_CALL_LIMIT", 3):
+        for n in range(2):
+            messages += _tool_round(n)
+            assert guard.before_model(_state(messages), Mock()) is None
+
+        messages += _tool_round(2)
+        update = guard.before_model(_state(messages), Mock())
+        assert update is not None
+        assert guard.warned_at_count == 3
+
+        messages += update["messages"] + _tool_round(3)
+        with pytest.raises(ToolCallLimitExceeded):
+            guard.before_model(_state(messages), Mock())
+
+
+def test_recounts_rewritten_history() -> None:
+    guard = RecursionGuard()
+    messages: list[BaseMessage] = [HumanMessage(content="diff", id="h")]
+    messages += _tool_round(0) + _tool_round(1)
+    guard.before_model(_state(messages), Mock())
+
+    # Compaction keeps the first message and replaces the rest
+    compacted = [messages[0]] + _tool_round(2)
+
+    assert guard._count_tool_messages(compacted) == 1
@@ -0,0 +1,125 @@
+"""Tests for context compaction."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from src.agent.middleware import SummarizingMiddleware
+
+
+def _state(*messages: Any) -> Any:
+    return {"messages": list(messages)}
+
+
+def test_compacts_after_tool_calls_over_threshold() -> None:
+    middleware = SummarizingMiddleware()
+    state = _state(
+        HumanMessage(content="diff"),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_files", "args": {}, "id": "1"}],
+        ),
+        ToolMessage(content="files " * 100, tool_call_id="1"),
+    )
+
+    with patch(
+        "src.agent.middleware.summarizing_middleware.CONTEXT_COMPACT_THRESHOLD", 50
+    ):
+        update = middleware.before_model(state, Mock())
+
+    assert update is not None
+    assert middleware.summary_requested
+
+
+def test_skips_compaction_before_any_tool_call() -> None:
+    middleware = SummarizingMiddleware()
+    state = _state(HumanMessage(content="diff " * 100))
+
+    with patch(
+        "src.agent.middleware.summarizing_middleware.CONTEXT_COMPACT_THRESHOLD", 10
+    ):
+        update = middleware.before_model(state, Mock())
+
+    assert update is None
+    assert not middleware.summary_requested
+
+
+def test_skips_compaction_when_first_message_is_over_threshold() -> None:
+    middleware = SummarizingMiddleware()
+    state = _state(
+        HumanMessage(content="diff " * 100),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_files", "args": {}, "id": "1"}],
+        ),
+        ToolMessage(content="files", tool_call_id="1"),
+    )
+
+    with patch(
+        "src.agent.middleware.summarizing_middleware.CONTEXT_COMPACT_THRESHOLD", 50
+    ):
+        update = middleware.before_model(state, Mock())
+
+    assert update is None
+
+
+def _read_round(n: int) -> list[Any]:
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": "read_file_part",
+                    "args": {"file_path": f"f{n}.py"},
+                    "id": f"c{n}",
+                }
+            ],
+            id=f"a{n}",
+        ),
+        ToolMessage(
+            content="code " * 100,
+            name="read_file_part",
+            tool_call_id=f"c{n}",
+            id=f"t{n}",
+        ),
+    ]
+
+
+def test_evicts_seen_tool_results_before_summarizing() -> None:
+    middleware = SummarizingMiddleware()
+    messages: list[Any] = [HumanMessage(content="diff", id="h")]
+    for n in range(3):
+        messages += _read_round(n)
+    state = _state(*messages)
+
+    with patch(
+        "src.agent.middleware.summarizing_middleware.CONTEXT_COMPACT_THRESHOLD", 300
+    ):
+        update = middleware.before_model(state, Mock())
+
+    assert update is not None
+    assert not middleware.summary_requested
+    evicted = update["messages"]
+    # Oldest first, and never the result the model has not seen yet
+    assert [m.id for m in evicted] == ["t0", "t1"]
+    assert evicted[0].content == (
+        "[read_file_part f0.py: output evicted, call again if needed]"
+    )
+    assert evicted[0].tool_call_id == "c0"
+
+
+def test_summarizes_when_eviction_is_not_enough() -> None:
+    middleware = SummarizingMiddleware()
+    state = _state(
+        HumanMessage(content="diff", id="h"), *_read_round(0), *_read_round(1)
+    )
+
+    with patch(
+        "src.agent.middleware.summarizing_middleware.CONTEXT_COMPACT_THRESHOLD", 100
+    ):
+        update = middleware.before_model(state, Mock())
+
+    assert update is not None
+    assert middleware.summary_requested
+    assert isinstance(update["messages"][0], HumanMessage)
@@ -0,0 +1,110 @@
+"""Tests for the running conversation token count."""
+
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from src.agent.middleware.token_counter import MessageTokenCounter
+
+
+def test_counts_from_last_reported_usage() -> None:
+    tool_result = ToolMessage(content="x" * 400, tool_call_id="1", id="t1")
+    messages = [
+        HumanMessage(content="diff " * 1000, id="h1"),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_files", "args": {}, "id": "1"}],
+            usage_metadata={
+                "input_tokens": 5000,
+                "output_tokens": 20,
+                "total_tokens": 5020,
+            },
+            id="a1",
+        ),
+        tool_result,
+    ]
+
+    count = MessageTokenCounter().count(messages)
+
+    assert count == 5020 + count_tokens_approximately([tool_result])
+
+
+def test_bedrock_usage_counts_cached_prompt() -> None:
+    messages = [
+        HumanMessage(content="diff " * 1000, id="h1"),
+        AIMessage(
+            content="done",
+            usage_metadata={
+                "input_tokens": 4,
+                "output_tokens": 38,
+                "total_tokens": 42,
+                "input_token_details": {"cache_read": 1525, "cache_creation": 3000},
+            },
+            response_metadata={"model_provider": "bedrock_converse"},
+            id="a1",
+        ),
+    ]
+
+    assert MessageTokenCounter().count(messages) == 4 + 1525 + 3000 + 38
+
+
+def test_estimates_without_usage() -> None:
+    messages = [HumanMessage(content="diff " * 100, id="h1")]
+
+    assert MessageTokenCounter().count(messages) == count_tokens_approximately(messages)
+
+
+def test_estimates_each_message_once() -> None:
+    counter = MessageTokenCounter()
+    messages = [HumanMessage(content=f"message {i}", id=f"m{i}") for i in range(3)]
+
+    with patch(
+        "src.agent.middleware.token_counter.count_tokens_approximately",
+        side_effect=count_tokens_approximately,
+    ) as estimate:
+        counter.count(messages)
+        counter.count(messages + [HumanMessage(content="new", id="m3")])
+
+    assert estimate.call_count == 4
+
+
+def test_subtracts_rewrites_from_stale_usage() -> None:
+    counter = MessageTokenCounter()
+    tool_result = ToolMessage(content="x" * 4000, tool_call_id="1", id="t1")
+    messages: list[BaseMessage] = [
+        HumanMessage(content="diff", id="h1"),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_files", "args": {}, "id": "1"}],
+            id="a1",
+        ),
+        tool_result,
+        AIMessage(
+            content="",
+            usage_metadata={
+                "input_tokens": 2000,
+                "output_tokens": 10,
+                "total_tokens": 2010,
+            },
+            id="a2",
+        ),
+    ]
+    counter.count(messages)
+
+    stub = tool_result.model_copy(update={"content": "evicted"})
+    saving = counter.replace(tool_result, stub)
+    messages[2] = stub
+
+    assert saving > 0
+    assert counter.count(messages) == 2010 - saving
+
+    # A newer response reports usage that already reflects the rewrite
+    messages.append(
+        AIMessage(
+            content="",
+            usage_metadata={"input_tokens": 50, "output_tokens": 5, "total_tokens": 55},
+            id="a3",
+        )
+    )
+    assert counter.count(messages) == 55
@@ -0,0 +1,80 @@
+"""Tests for the HTTP client shared by model providers."""
+
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.agent.providers.anthropic import create_anthropic_model
+from src.agent.providers.http_client import (
+    close_http_client,
+    get_http_client,
+    http_client_kwargs,
+)
+from src.agent.providers.moonshot import create_moonshot_model
+
+
+@pytest.fixture(autouse=True)
+def fresh_client() -> Iterator[None]:
+    close_http_client()
+    yield
+    close_http_client()
+
+
+def test_client_is_shared_and_tuned() -> None:
+    with patch("src.agent.providers.http_client.MODEL_MAX_CONNECTIONS", 3), patch(
+        "src.agent.providers.http_client.MODEL_KEEPALIVE_SECONDS", 42.0
+    ):
+        client = get_http_client()
+
+    assert get_http_client() is client
+    pool: Any = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 42.0
+
+
+def test_http2_requires_h2() -> None:
+    with patch("src.agent.providers.http_client.MODEL_HTTP2", True), patch(
+        "importlib.util.find_spec", return_value=None
+    ):
+        with pytest.raises(ValueError, match="h2"):
+            http_client_kwargs()
+
+
+def test_providers_send_requests_through_shared_client() -> None:
+    with patch("src.agent.providers.anthropic.ANTHROPIC_API_KEY", "key"), patch(
+        "src.agent.providers.moonshot.MOONSHOT_API_KEY", "key"
+    ):
+        anthropic_model = create_anthropic_model("claude-test", 100)
+        moonshot_model = create_moonshot_model("kimi-test", 100)
+
+    shared = get_http_client()
+    assert anthropic_model._client._client is shared
+    assert moonshot_model.root_client._client is shared
+
+
+def test_proxied_models_share_a_proxy_client() -> None:
+    with patch("src.agent.providers.anthropic.ANTHROPIC_API_KEY", "key"), patch.dict(
+        "os.environ",
+        {"ANTHROPIC_PROXY": "http://proxy:3128", "OPENAI_PROXY": "http://proxy:3128"},
+    ), patch("src.agent.providers.moonshot.MOONSHOT_API_KEY", "key"):
+        anthropic_model = create_anthropic_model("claude-test", 100)
+        moonshot_model = create_moonshot_model("kimi-test", 100)
+
+    proxied = get_http_client("http://proxy:3128")
+    assert proxied is not get_http_client()
+    assert anthropic_model._client._client is proxied
+    assert moonshot_model.root_client._client is proxied
+    transport: Any = proxied._transport_for_url(httpx.URL("https://api.anthropic.com"))
+    assert transport._pool._proxy_url.host == b"proxy"
+
+
+def test_provider_accepts_own_client() -> None:
+    own = httpx.Client()
+    with patch("src.agent.providers.anthropic.ANTHROPIC_API_KEY", "key"):
+        model = create_anthropic_model("claude-test", 100, http_client=own)
+
+    assert model._client._client is own
+    own.close()
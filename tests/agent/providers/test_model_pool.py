@@ -0,0 +1,60 @@
+"""Tests for the shared model instance pool."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.providers import PROVIDER_REGISTRY, clear_model_pool, get_model
+
+
+@pytest.fixture
+def counting_factory() -> Any:
+    calls: list[tuple[str, int]] = []
+    lock = threading.Lock()
+
+    def factory(model_name: str, max_tokens: int) -> object:
+        with lock:
+            calls.append((model_name, max_tokens))
+        return object()
+
+    clear_model_pool()
+    with patch.dict(PROVIDER_REGISTRY, {"fake": factory}):
+        yield calls
+    clear_model_pool()
+
+
+def test_same_key_returns_same_instance(counting_factory: Any) -> None:
+    first = get_model("model-a", 100, provider="fake")
+    second = get_model("model-a", 100, provider="fake")
+
+    assert first is second
+    assert counting_factory == [("model-a", 100)]
+
+
+def test_different_keys_get_different_instances(counting_factory: Any) -> None:
+    a = get_model("model-a", 100, provider="fake")
+    b = get_model("model-b", 100, provider="fake")
+    c = get_model("model-a", 200, provider="fake")
+
+    assert len({id(a), id(b), id(c)}) == 3
+    assert len(counting_factory) == 3
+
+
+def test_concurrent_callers_share_one_instance(counting_factory: Any) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        models = list(
+            executor.map(
+                lambda _: get_model("model-a", 100, provider="fake"), range(32)
+            )
+        )
+
+    assert all(m is models[0] for m in models)
+    assert len(counting_factory) == 1
+
+
+def test_unknown_provider_raises() -> None:
+    with pytest.raises(ValueError, match="Unsupported MODEL_PROVIDER"):
+        get_model("model-a", 100, provider="missing")
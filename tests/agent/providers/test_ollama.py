@@ -0,0 +1,40 @@
+"""Tests for Ollama context sizing and keep-alive."""
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.agent.providers.ollama import SizedChatOllama, create_ollama_model
+
+
+def _model(num_ctx: int = 4096, max_num_ctx: int = 32768) -> SizedChatOllama:
+    return SizedChatOllama(
+        model="test-model", num_ctx=num_ctx, num_predict=1000, max_num_ctx=max_num_ctx
+    )
+
+
+def test_context_grows_to_fit_and_never_shrinks() -> None:
+    model = _model()
+
+    assert model.context_size(1000) == 4096
+    assert model.context_size(6000) == 16384
+    assert model.context_size(100) == 16384
+
+
+def test_context_is_capped_with_warning() -> None:
+    model = _model()
+
+    with pytest.warns(UserWarning, match="OLLAMA_MAX_NUM_CTX"):
+        assert model.context_size(100_000) == 32768
+
+
+def test_requests_carry_context_size_and_keep_alive() -> None:
+    with patch("src.agent.providers.ollama.OLLAMA_KEEP_ALIVE", "-1"):
+        model = create_ollama_model("test-model", 1000)
+
+    params = model._chat_params([HumanMessage(content="x" * 200_000)])
+
+    assert params["keep_alive"] == -1
+    assert params["options"]["num_ctx"] == 65536
+    assert params["options"]["num_predict"] == 1000
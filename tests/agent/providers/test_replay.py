@@ -0,0 +1,117 @@
+"""Tests for the record/replay model provider."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.agent.git_utils import get_changed_files
+from src.agent.providers.replay import (
+    Cassette,
+    CassetteMismatchError,
+    ReplayChatModel,
+    normalize_request,
+)
+from src.agent.runner import ReviewResult, run_review
+from src.agent.schema import PrimaryReviewOutput
+from tests.fake_chat_model import ScriptedChatModel, structured_response, tool_call
+from tests.test_helper import create_test_repo
+
+
+def _review(model: Any, additional_instructions: str | None = None) -> ReviewResult:
+    with create_test_repo() as repo_path, patch("src.agent.agent.model", model):
+        return run_review(
+            repo_path=str(repo_path),
+            target_branch="main",
+            changed_files=get_changed_files(str(repo_path), "main"),
+            show_progress=False,
+            additional_instructions=additional_instructions,
+        )
+
+
+@pytest.fixture(autouse=True)
+def fixed_commit_dates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give recorded and replayed test repos the same commit hashes."""
+    for variable in ("GIT_AUTHOR_DATE", "GIT_COMMITTER_DATE"):
+        monkeypatch.setenv(variable, "1700000000 +0000")
+
+
+@pytest.fixture
+def cassette_path(tmp_path: Path) -> str:
+    """Cassette recorded from a two-step review."""
+    path = str(tmp_path / "review.jsonl")
+    inner = ScriptedChatModel(
+        script=[
+            tool_call("read_file_part", {"file_path": "file1.py"}, "call1"),
+            structured_response(PrimaryReviewOutput(description="Recorded", issues=[])),
+        ]
+    )
+    _review(
+        ReplayChatModel(
+            model_name="model-a", cassette=Cassette(path, "record"), inner=inner
+        )
+    )
+    return path
+
+
+def test_replay_serves_recorded_responses(cassette_path: str) -> None:
+    assert len(Path(cassette_path).read_text().splitlines()) == 2
+
+    replayed = _review(
+        ReplayChatModel(
+            model_name="model-a", cassette=Cassette(cassette_path, "replay")
+        )
+    )
+
+    assert replayed.output.description == "Recorded"
+    assert "file1.py" in replayed.file_context.files
+    assert replayed.token_usage is not None
+    assert replayed.token_usage.llm_calls == 2
+
+
+def test_changed_prompt_reports_mismatch(cassette_path: str) -> None:
+    model = ReplayChatModel(
+        model_name="model-a", cassette=Cassette(cassette_path, "replay")
+    )
+
+    with pytest.raises(CassetteMismatchError) as error:
+        _review(model, additional_instructions="Focus on naming.")
+
+    assert "message 0 (system) differs" in str(error.value)
+    assert "REPLAY_MODE=record" in str(error.value)
+
+
+def test_other_model_reports_mismatch(cassette_path: str) -> None:
+    model = ReplayChatModel(
+        model_name="model-b", cassette=Cassette(cassette_path, "replay")
+    )
+
+    with pytest.raises(CassetteMismatchError, match="no requests for this model"):
+        _review(model)
+
+
+def test_normalization_ignores_ids_and_cache_markers() -> None:
+    plain = normalize_request(
+        "m", [SystemMessage("Review  \n"), HumanMessage("diff")], ["read_file_part"]
+    )
+    marked = normalize_request(
+        "m",
+        [
+            SystemMessage("Review", id="system-1"),
+            HumanMessage(
+                [
+                    {
+                        "type": "text",
+                        "text": "diff",
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"cachePoint": {"type": "default"}},
+                ]
+            ),
+        ],
+        ["read_file_part"],
+    )
+
+    assert plain == marked
@@ -0,0 +1,95 @@
+"""Tests for clustering changed files into shards."""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from src.agent.git_utils import FileChange, read_files_at_head
+from src.agent.sharding import cluster_files
+
+
+def _create_repo(files: dict[str, str]) -> Path:
+    repo_path = Path(tempfile.mkdtemp())
+    for path, content in files.items():
+        (repo_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo_path / path).write_text(content)
+    for args in (
+        ["init", "-b", "main"],
+        ["config", "user.name", "Test User"],
+        ["config", "user.email", "test@example.com"],
+        ["add", "."],
+        ["commit", "-m", "Initial commit"],
+    ):
+        subprocess.run(
+            ["git", "-C", str(repo_path), *args], check=True, capture_output=True
+        )
+    return repo_path
+
+
+def _changes(*paths: str) -> list[FileChange]:
+    return [
+        FileChange(path=p, change_type="modified", additions=1, deletions=0)
+        for p in paths
+    ]
+
+
+def _shard_paths(shards: list[list[FileChange]]) -> list[list[str]]:
+    return [[f.path for f in shard] for shard in shards]
+
+
+def test_groups_by_directory_and_imports() -> None:
+    repo_path = _create_repo(
+        {
+            "api/handlers.py": "from services.billing import charge\n",
+            "api/routes.py": "",
+            "services/billing.py": "def charge(): ...\n",
+            "web/app.ts": "import { x } from './util';\n",
+            "web/util.ts": "export const x = 1;\n",
+            "docs/guide.md": "# Guide\n",
+        }
+    )
+    try:
+        shards = cluster_files(
+            str(repo_path),
+            _changes(
+                "api/handlers.py",
+                "api/routes.py",
+                "services/billing.py",
+                "web/app.ts",
+                "web/util.ts",
+                "docs/guide.md",
+            ),
+            max_files=3,
+        )
+    finally:
+        shutil.rmtree(repo_path, ignore_errors=True)
+
+    assert _shard_paths(shards) == [
+        ["api/handlers.py", "api/routes.py", "services/billing.py"],
+        ["docs/guide.md", "web/app.ts", "web/util.ts"],
+    ]
+
+
+def test_splits_oversized_groups() -> None:
+    paths = [f"pkg/mod{i}.py" for i in range(5)]
+    repo_path = _create_repo({p: "" for p in paths})
+    try:
+        shards = cluster_files(str(repo_path), _changes(*paths), max_files=2)
+    finally:
+        shutil.rmtree(repo_path, ignore_errors=True)
+
+    assert [len(shard) for shard in shards] == [2, 2, 1]
+    assert sorted(f.path for shard in shards for f in shard) == paths
+
+
+def test_read_files_at_head_skips_missing_files() -> None:
+    repo_path = _create_repo({"a file.txt": "content\n", "b.txt": "other\n"})
+    try:
+        contents = read_files_at_head(
+            str(repo_path), ["a file.txt", "missing.txt", "b.txt"]
+        )
+    finally:
+        shutil.rmtree(repo_path, ignore_errors=True)
+
+    assert contents == {"a file.txt": "content\n", "b.txt": "other\n"}
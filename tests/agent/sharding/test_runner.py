@@ -0,0 +1,41 @@
+"""Tests for the sharded review runner."""
+
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from src.agent.git_utils import get_changed_files
+from src.agent.schema import PrimaryReviewOutput
+from src.agent.sharding import run_sharded_review
+from tests.fake_chat_model import ScriptedChatModel, structured_response
+from tests.test_helper import create_test_repo
+
+
+def _review_listed_files(messages: list[BaseMessage]) -> AIMessage:
+    """Describe the shard by the file diffs present in the prompt."""
+    prompt = str(messages[-1].content)
+    files = [name for name in ("file1.py", "file3.py") if f"### {name}" in prompt]
+    return structured_response(
+        PrimaryReviewOutput(description=f"Reviewed {', '.join(files)}", issues=[])
+    )
+
+
+def test_shards_are_reviewed_separately_and_merged() -> None:
+    with create_test_repo() as repo_path:
+        model = ScriptedChatModel(script=[_review_listed_files, _review_listed_files])
+
+        with patch("src.agent.agent.model", model):
+            result = run_sharded_review(
+                repo_path=str(repo_path),
+                target_branch="main",
+                changed_files=get_changed_files(str(repo_path), "main"),
+                show_progress=False,
+                max_files=1,
+                concurrency=2,
+            )
+
+    assert len(model.prompts) == 2
+    assert "Reviewed file1.py" in result.output.description
+    assert "Reviewed file3.py" in result.output.description
+    assert "### file1.py" in result.user_message
+    assert "### file3.py" in result.user_message
@@ -0,0 +1,79 @@
+"""Tests for issue deduplication."""
+
+from src.agent.dedup import deduplicate_issues
+from src.agent.schema import IssueCategory, IssueLocation, IssueSeverity, ReviewIssue
+
+
+def _make_issue(
+    title: str,
+    filename: str = "app.py",
+    line: int | None = 10,
+    category: IssueCategory = IssueCategory.LOGIC,
+    severity: IssueSeverity = IssueSeverity.MEDIUM,
+) -> ReviewIssue:
+    return ReviewIssue(
+        title=title,
+        category=category,
+        severity=severity,
+        location=[IssueLocation(filename=filename, line=line)],
+        explanation=f"Explanation of {title}",
+        suggested_fix="Fix",
+    )
+
+
+def test_same_bug_at_several_call_sites_is_merged() -> None:
+    issues = [
+        _make_issue("Missing null check on user", "a.py", 5),
+        _make_issue(
+            "Missing null check on user.", "b.py", 40, severity=IssueSeverity.HIGH
+        ),
+        _make_issue("Unrelated SQL injection", "c.py", 7, IssueCategory.SECURITY),
+    ]
+
+    result = deduplicate_issues(issues)
+
+    assert len(result) == 2
+    merged = result[0]
+    assert merged.severity == IssueSeverity.HIGH
+    assert [(loc.filename, loc.line) for loc in merged.location] == [
+        ("b.py", 40),
+        ("a.py", 5),
+    ]
+    assert result[1].title == "Unrelated SQL injection"
+
+
+def test_overlapping_location_needs_only_similar_title() -> None:
+    issues = [
+        _make_issue("Off-by-one in pagination loop", line=20),
+        _make_issue("Pagination loop skips last page", line=22),
+    ]
+
+    assert len(deduplicate_issues(issues)) == 1
+
+
+def test_different_category_or_distant_code_is_kept() -> None:
+    issues = [
+        _make_issue("Off-by-one in pagination loop", line=20),
+        _make_issue("Pagination loop skips last page", line=200),
+        _make_issue(
+            "Off-by-one in pagination loop", line=20, category=IssueCategory.TESTING
+        ),
+    ]
+
+    assert len(deduplicate_issues(issues)) == 3
+
+
+def test_similar_titles_in_different_files_are_kept() -> None:
+    issues = [
+        _make_issue("SQL injection in get_user query", "users.py", 12),
+        _make_issue("SQL injection in get_order query", "orders.py", 30),
+        _make_issue("Unvalidated redirect in login handler", "login.py", 8),
+        _make_issue("Unvalidated redirect in logout handler", "logout.py", 8),
+    ]
+
+    result = deduplicate_issues(issues)
+
+    assert len(result) == 4
+    assert [issue.explanation for issue in result] == [
+        issue.explanation for issue in issues
+    ]
@@ -0,0 +1,50 @@
+"""Tests for the single-shot review of small diffs."""
+
+from unittest.mock import patch
+
+from src.agent.fast_path import read_surrounding_code, use_fast_path
+from src.agent.git_utils import get_changed_files
+from src.agent.runner import run_review
+from src.agent.schema import PrimaryReviewOutput
+from tests.fake_chat_model import ScriptedChatModel, structured_response
+from tests.test_helper import create_test_repo
+
+
+def test_small_diff_is_reviewed_in_one_call() -> None:
+    final = PrimaryReviewOutput(description="Fast review", issues=[])
+    model = ScriptedChatModel(script=[structured_response(final)])
+
+    with create_test_repo() as repo_path, patch("src.agent.agent.model", model), patch(
+        "src.agent.fast_path.FAST_PATH_MAX_DIFF_LINES", 50
+    ):
+        result = run_review(
+            repo_path=str(repo_path),
+            target_branch="main",
+            changed_files=get_changed_files(str(repo_path), "main"),
+            show_progress=False,
+        )
+
+    assert result.output.description == "Fast review"
+    assert len(model.prompts) == 1
+    assert "## Surrounding Code" in str(model.prompts[0][-1].content)
+    # The inlined code is handed to verification like code read by tools
+    assert set(result.file_context.files) == {"file1.py", "file3.py"}
+    assert "## Surrounding Code" not in result.user_message
+    assert isinstance(model.prompts[0][-1].content, str)
+
+
+def test_reads_code_around_changes() -> None:
+    with create_test_repo() as repo_path:
+        changed_files = get_changed_files(str(repo_path), "main")
+        with patch("src.agent.fast_path.FAST_PATH_MAX_DIFF_LINES", 5):
+            assert use_fast_path(changed_files)
+        with patch("src.agent.fast_path.FAST_PATH_MAX_DIFF_LINES", 4):
+            assert not use_fast_path(changed_files)
+
+        code = read_surrounding_code(str(repo_path), "main", changed_files)
+
+    assert code["file1.py"] == {
+        1: "def hello():",
+        2: "    print('hello world')",
+        3: "    return True",
+    }
@@ -0,0 +1,143 @@
+"""Tests for the review runner."""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.cache import DirectoryCacheStore
+from src.agent.checkpointer import SqliteSaver
+from src.agent.git_utils import get_changed_files
+from src.agent.runner import run_review
+from src.agent.schema import (
+    IssueCategory,
+    IssueLocation,
+    IssueSeverity,
+    PrimaryReviewOutput,
+    ReviewIssue,
+)
+from tests.fake_chat_model import ScriptedChatModel, structured_response, tool_call
+from tests.test_helper import create_test_repo
+
+
+def test_resume_continues_crashed_review() -> None:
+    """Test that a resumed review skips the steps completed before the crash."""
+    final = PrimaryReviewOutput(description="Resumed review", issues=[])
+
+    with create_test_repo() as repo_path, tempfile.TemporaryDirectory() as tmpdir:
+        saver = SqliteSaver(str(Path(tmpdir) / "checkpoints.sqlite"))
+        changed_files = get_changed_files(str(repo_path), "main")
+
+        crashing_model = ScriptedChatModel(
+            script=[
+                tool_call("read_file_part", {"file_path": "file1.py"}, "call1"),
+                TimeoutError("provider timeout"),
+            ]
+        )
+        with patch("src.agent.agent.model", crashing_model), patch(
+            "src.agent.checkpointer._checkpointer", saver
+        ), patch("src.agent.runner.is_durable", return_value=True):
+            with pytest.raises(TimeoutError):
+                run_review(
+                    repo_path=str(repo_path),
+                    target_branch="main",
+                    changed_files=changed_files,
+                    show_progress=False,
+                    run_id="run1",
+                )
+
+        resumed_model = ScriptedChatModel(script=[structured_response(final)])
+        with patch("src.agent.agent.model", resumed_model), patch(
+            "src.agent.checkpointer._checkpointer", saver
+        ), patch("src.agent.runner.is_durable", return_value=True):
+            result = run_review(
+                repo_path=str(repo_path),
+                target_branch="main",
+                changed_files=changed_files,
+                show_progress=False,
+                run_id="run1",
+                resume=True,
+            )
+
+        assert result.output.description == "Resumed review"
+        assert result.run_id == "run1"
+
+        # Only the failed step was re-run, with the earlier tool result intact
+        assert len(resumed_model.prompts) == 1
+        assert "hello world" in str(resumed_model.prompts[0][-1].content)
+
+        # File reads from before the crash are available for verification
+        assert "file1.py" in result.file_context.files
+
+
+def test_resume_requires_durable_checkpointer() -> None:
+    with patch("src.agent.runner.is_durable", return_value=False):
+        with pytest.raises(ValueError, match="CHECKPOINT_BACKEND=sqlite"):
+            run_review(
+                repo_path="/repo",
+                target_branch="main",
+                changed_files=[],
+                run_id="run1",
+                resume=True,
+            )
+
+
+def test_fragment_cache_skips_files_with_unchanged_diffs() -> None:
+    """Test that a second run only sends files with new diffs to the agent."""
+    first = PrimaryReviewOutput(
+        description="First review",
+        issues=[
+            ReviewIssue(
+                title="Unchecked return",
+                category=IssueCategory.LOGIC,
+                severity=IssueSeverity.LOW,
+                location=[IssueLocation(filename="file3.py", line=2)],
+                explanation="Explanation",
+                suggested_fix="Fix",
+            )
+        ],
+    )
+    second = PrimaryReviewOutput(description="Second review", issues=[])
+
+    with create_test_repo() as repo_path, tempfile.TemporaryDirectory() as tmpdir:
+        store = DirectoryCacheStore(tmpdir)
+
+        with patch(
+            "src.agent.agent.model",
+            ScriptedChatModel(script=[structured_response(first)]),
+        ):
+            run_review(
+                repo_path=str(repo_path),
+                target_branch="main",
+                changed_files=get_changed_files(str(repo_path), "main"),
+                show_progress=False,
+                fragment_cache=store,
+            )
+
+        (repo_path / "file1.py").write_text("def hello():\n    return False\n")
+        subprocess.run(
+            ["git", "-C", str(repo_path), "commit", "-am", "Change file1"],
+            check=True,
+            capture_output=True,
+        )
+
+        model = ScriptedChatModel(script=[structured_response(second)])
+        with patch("src.agent.agent.model", model):
+            result = run_review(
+                repo_path=str(repo_path),
+                target_branch="main",
+                changed_files=get_changed_files(str(repo_path), "main"),
+                show_progress=False,
+                fragment_cache=store,
+            )
+
+    prompt = str(model.prompts[0][-1].content)
+    assert "### file1.py" in prompt
+    assert "### file3.py" not in prompt
+
+    assert [issue.title for issue in result.output.issues] == ["Unchecked return"]
+    assert "reused from a previous review" in result.output.description
+    # Verification still sees every diff
+    assert "### file3.py" in result.user_message
@@ -0,0 +1,138 @@
+"""Tests for per-call token accounting and cost estimation."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agent.pricing import estimate_cost
+from src.agent.token_usage import LLMCallUsage, TokenUsage
+from src.agent.token_usage_callback_handler import TokenUsageCallbackHandler
+from tests.fake_chat_model import ScriptedChatModel
+
+
+def _ai(input_tokens: int, output_tokens: int, cache_read: int = 0) -> AIMessage:
+    return AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {"cache_read": cache_read, "cache_creation": 0},
+        },
+        response_metadata={"model_name": "claude-sonnet-4-5-20250929"},
+    )
+
+
+def test_from_response_counts_input_of_every_call() -> None:
+    response = {
+        "messages": [
+            HumanMessage(content="review"),
+            _ai(1000, 50),
+            _ai(1200, 100, cache_read=1000),
+        ]
+    }
+
+    usage = TokenUsage.from_response(response, stage="review")
+
+    assert usage is not None
+    assert usage.llm_calls == 2
+    assert usage.input_tokens == 2200
+    assert usage.output_tokens == 150
+    assert usage.total_tokens == 2350
+    assert usage.cache_read_tokens == 1000
+    assert usage.cache_hit_ratio == 1000 / 2200
+    assert usage.calls[0].model == "claude-sonnet-4-5-20250929"
+
+
+def _bedrock_ai(
+    input_tokens: int, output_tokens: int, cache_read: int, cache_creation: int = 0
+) -> AIMessage:
+    # Bedrock Converse reports only the uncached input tokens
+    return AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {
+                "cache_read": cache_read,
+                "cache_creation": cache_creation,
+            },
+        },
+        response_metadata={
+            "model_id": "us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+            "model_provider": "bedrock_converse",
+        },
+    )
+
+
+def test_bedrock_input_includes_cached_tokens() -> None:
+    usage = TokenUsage.from_response(
+        {"messages": [_bedrock_ai(4, 38, cache_read=1525)]}, stage="review"
+    )
+
+    assert usage is not None
+    assert usage.input_tokens == 1529
+    assert usage.total_tokens == 1567
+    assert usage.cache_hit_ratio == 1525 / 1529
+
+
+def test_add_groups_stages_by_name() -> None:
+    review = TokenUsage.from_response({"messages": [_ai(100, 10)]}, stage="review")
+    score1 = TokenUsage.from_response(
+        {"messages": [_ai(50, 5, cache_read=40)]}, stage="score"
+    )
+    score2 = TokenUsage.from_response({"messages": [_ai(50, 5)]}, stage="score")
+    assert review and score1 and score2
+
+    total = review + score1 + score2
+
+    assert list(total.stages) == ["review", "score"]
+    assert total.stages["score"].llm_calls == 2
+    data = total.to_dict()
+    assert data["stages"]["score"]["cache_hit_ratio"] == 0.4
+    assert len(data["calls"]) == 3
+
+
+def test_cost_uses_longest_matching_price() -> None:
+    # claude-opus-4-5 ($5/$25) must win over claude-opus-4 ($15/$75)
+    cost = estimate_cost("us.anthropic.claude-opus-4-5-20251101-v1:0", 1_000_000, 0)
+    assert cost == 5.0
+
+    # Cached input is billed at the cache read price
+    cost = estimate_cost("claude-opus-4-5", 1_000_000, 0, cache_read_tokens=500_000)
+    assert cost == 2.5 + 0.25
+
+
+def test_bedrock_uncached_input_is_billed() -> None:
+    usage = TokenUsage.from_response(
+        {"messages": [_bedrock_ai(4, 38, cache_read=1525, cache_creation=200)]}
+    )
+
+    assert usage is not None
+    # $3 uncached, $0.30 cache read, $3.75 cache write, $15 output per million
+    expected = (4 * 3.0 + 1525 * 0.3 + 200 * 3.75 + 38 * 15.0) / 1_000_000
+    assert usage.cost_usd == pytest.approx(expected)
+
+
+def test_unknown_model_has_no_cost() -> None:
+    call = LLMCallUsage(
+        stage="review", model="local-model", input_tokens=10, output_tokens=1
+    )
+
+    assert call.cost_usd is None
+    assert TokenUsage([call]).cost_usd is None
+
+
+def test_callback_handler_records_each_call() -> None:
+    model = ScriptedChatModel(script=[AIMessage(content="a"), AIMessage(content="b")])
+    handler = TokenUsageCallbackHandler(stage="questions")
+
+    model.invoke("first", config={"callbacks": [handler]})
+    model.invoke("second", config={"callbacks": [handler]})
+
+    usage = handler.token_usage()
+    assert usage is not None
+    assert usage.llm_calls == 2
+    assert all(call.stage == "questions" for call in usage.calls)
+    assert all(call.latency_seconds >= 0 for call in usage.calls)
+    assert usage.input_tokens == sum(c.input_tokens for c in usage.calls) > 0
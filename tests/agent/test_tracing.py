@@ -0,0 +1,88 @@
+"""Tests for trace span recording."""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.git_utils import get_changed_files
+from src.agent.runner import run_review
+from src.agent.schema import PrimaryReviewOutput
+from src.agent.tracing import (
+    TraceRecorder,
+    disable_tracing,
+    enable_tracing,
+    run_traced,
+    summarize_arg,
+    trace_span,
+)
+from tests.fake_chat_model import ScriptedChatModel, structured_response, tool_call
+from tests.test_helper import create_test_repo
+
+
+@pytest.fixture
+def recorder() -> Iterator[TraceRecorder]:
+    yield enable_tracing()
+    disable_tracing()
+
+
+def test_trace_span_is_noop_when_disabled() -> None:
+    disable_tracing()
+    with trace_span("work", "stage") as args:
+        args["ignored"] = True
+
+
+def test_git_subprocess_and_errors_are_recorded(recorder: TraceRecorder) -> None:
+    run_traced(["git", "-C", ".", "rev-parse", "HEAD"], capture_output=True)
+    with pytest.raises(ValueError):
+        with trace_span("failing", "stage"):
+            raise ValueError("boom")
+
+    events = [e for e in recorder.to_dict()["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in events] == ["git rev-parse", "failing"]
+    assert events[0]["cat"] == "git"
+    assert events[0]["args"]["returncode"] == 0
+    assert events[1]["args"]["error"] == "ValueError"
+
+
+def test_review_trace_has_llm_tool_and_stage_spans(recorder: TraceRecorder) -> None:
+    model = ScriptedChatModel(
+        script=[
+            tool_call("read_file_part", {"file_path": "file1.py"}, "call_1"),
+            structured_response(PrimaryReviewOutput(description="ok", issues=[])),
+        ]
+    )
+
+    with create_test_repo() as repo_path, patch("src.agent.agent.model", model):
+        run_review(
+            repo_path=str(repo_path),
+            target_branch="main",
+            changed_files=get_changed_files(str(repo_path), "main"),
+            show_progress=False,
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "trace.json"
+        recorder.write(str(path))
+        trace = json.loads(path.read_text())
+
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    by_category: dict[str, list[dict[str, Any]]] = {}
+    for span in spans:
+        by_category.setdefault(span["cat"], []).append(span)
+
+    assert [s["name"] for s in by_category["stage"]] == ["review"]
+    assert len(by_category["llm"]) == 2
+    assert by_category["llm"][0]["args"]["input_tokens"] > 0
+    assert [s["name"] for s in by_category["tool"]] == ["tool read_file_part"]
+    assert "git diff" in {s["name"] for s in by_category["git"]}
+
+
+def test_long_arguments_are_truncated() -> None:
+    summary = summarize_arg("x" * 1000)
+    assert isinstance(summary, str)
+    assert summary.endswith("(1000 chars)")
+    assert len(summary) < 300
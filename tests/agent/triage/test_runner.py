@@ -0,0 +1,76 @@
+"""Tests for the triaged review runner."""
+
+from typing import Any
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from src.agent.git_utils import get_changed_files
+from src.agent.schema import PrimaryReviewOutput
+from src.agent.triage import run_triaged_review
+from src.agent.triage.classifier import (
+    FileClassification,
+    TriageOutput,
+)
+from tests.fake_chat_model import ScriptedChatModel, structured_response
+from tests.test_helper import create_test_repo
+
+
+def _review_as(name: str) -> Any:
+    def reply(messages: list[BaseMessage]) -> AIMessage:
+        prompt = str(messages[-1].content)
+        files = [f for f in ("file1.py", "file3.py") if f"### {f}" in prompt]
+        return structured_response(
+            PrimaryReviewOutput(
+                description=f"{name} reviewed {', '.join(files)}", issues=[]
+            )
+        )
+
+    return reply
+
+
+def test_routes_classified_files_to_models() -> None:
+    triage_model = ScriptedChatModel(
+        script=[
+            structured_response(
+                TriageOutput(
+                    files=[
+                        FileClassification(
+                            path="file1.py", risk="high", reason="Changes logic"
+                        ),
+                        FileClassification(
+                            path="file3.py", risk="low", reason="Empty stub"
+                        ),
+                    ]
+                )
+            ),
+            _review_as("fast"),
+        ]
+    )
+    main_model = ScriptedChatModel(script=[_review_as("main")])
+    models = {"fast-model": triage_model, "main-model": main_model}
+
+    with create_test_repo() as repo_path, patch(
+        "src.agent.agent.get_model", lambda name: models[name]
+    ), patch(
+        "src.agent.triage.classifier.get_model", lambda name, _: models[name]
+    ), patch(
+        "src.agent.triage.classifier.TRIAGE_MODEL_NAME", "fast-model"
+    ), patch(
+        "src.agent.triage.runner.TRIAGE_MODEL_NAME", "fast-model"
+    ), patch(
+        "src.agent.triage.runner.MODEL_NAME", "main-model"
+    ):
+        result = run_triaged_review(
+            repo_path=str(repo_path),
+            target_branch="main",
+            changed_files=get_changed_files(str(repo_path), "main"),
+            show_progress=False,
+            classify=True,
+        )
+
+    assert "fast reviewed file3.py" in result.output.description
+    assert "main reviewed file1.py" in result.output.description
+    assert "### file1.py" in result.user_message
+    assert result.token_usage is not None
+    assert list(result.token_usage.stages) == ["triage", "review"]
@@ -0,0 +1,50 @@
+"""Tests for triage risk scoring."""
+
+import json
+
+from src.agent.git_utils import FileChange
+from src.agent.triage import Risk, score_files
+
+
+def _change(path: str) -> FileChange:
+    return FileChange(path=path, change_type="modified", additions=3, deletions=1)
+
+
+def test_scores_files_by_path_and_sast_findings() -> None:
+    sast_findings = json.dumps([{"path": "src/api/handlers.py", "start_line": 3}])
+
+    risks = score_files(
+        [
+            _change("README.md"),
+            _change("tests/test_parser.py"),
+            _change("src/components/Button.spec.tsx"),
+            _change("src/auth/tokens.py"),
+            _change("src/api/handlers.py"),
+            _change("src/utils/strings.py"),
+            _change("requirements-dev.txt"),
+        ],
+        sast_findings,
+    )
+
+    assert [r.risk for r in risks] == [
+        Risk.LOW,
+        Risk.LOW,
+        Risk.LOW,
+        Risk.HIGH,
+        Risk.HIGH,
+        Risk.UNKNOWN,
+        Risk.UNKNOWN,
+    ]
+    assert risks[4].reason == "SAST finding"
+
+
+def test_sensitive_tests_and_svg_are_not_low_risk() -> None:
+    risks = score_files(
+        [
+            _change("tests/fixtures/auth_fixture.py"),
+            _change("docs/security.md"),
+            _change("static/logo.svg"),
+        ]
+    )
+
+    assert [r.risk for r in risks] == [Risk.HIGH, Risk.HIGH, Risk.UNKNOWN]
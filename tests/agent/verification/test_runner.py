@@ -120,3 +120,69 @@ def test_run_verification() -> None:
     assert result.issues[0].title == "Null pointer"
     assert result.issues[0].confidence == 9
     assert result.issues[0].rationale == "Issue confirmed"
+
+
+def test_run_verification_parallel_groups() -> None:
+    """Test that steps 2-3 run once per issue group and results are merged."""
+    issues = [
+        ReviewIssue(
+            title=f"Issue {i}",
+            category=IssueCategory.LOGIC,
+            severity=IssueSeverity.MEDIUM,
+            location=[IssueLocation(filename="main.py", line=i)],
+            explanation=f"Explanation {i}",
+            suggested_fix="Fix",
+        )
+        for i in range(1, 4)
+    ]
+    questions_response = QuestionsOutput(
+        issues=[IssueQuestions(issue_id=i, questions=[f"Q{i}?"]) for i in range(1, 4)]
+    )
+
+    def mock_invoke(input_dict: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        content = input_dict["messages"][0]["content"]
+        if content.startswith("Generate"):
+            response: Any = questions_response
+        elif content.startswith("Answer"):
+            response = AnswersOutput(issues=[])
+        else:
+            response = VerificationOutput(issues=[])
+        return {"structured_response": response, "messages": []}
+
+    def mock_create_agent(**kwargs: Any) -> MagicMock:
+        agent = MagicMock()
+        agent.invoke.side_effect = mock_invoke
+        # Score every issue ID in this group's prompt (and a stray ID 99)
+        if kwargs["response_format"] == VerificationOutput:
+            prompt = kwargs["system_prompt"]
+            scored = [i for i in range(1, 4) if f"### Issue {i}:" in prompt] + [99]
+            agent.invoke.side_effect = lambda *a, **k: {
+                "structured_response": VerificationOutput(
+                    issues=[
+                        IssueVerification(
+                            issue_id=i, confidence=min(i, 10), rationale="ok"
+                        )
+                        for i in scored
+                    ]
+                ),
+                "messages": [],
+            }
+        return agent
+
+    with patch(
+        "src.agent.verification.agent.create_agent", side_effect=mock_create_agent
+    ) as create_agent:
+        result, _ = run_verification(
+            primary_output=PrimaryReviewOutput(description="Summary", issues=issues),
+            system_prompt="Review prompt",
+            user_message="Diff content",
+            file_context=FileContext(),
+            repo_path="/test/repo",
+            show_progress=False,
+            concurrency=3,
+            group_size=1,
+        )
+
+    # Step 1 once, then steps 2 and 3 for each of the three groups
+    assert create_agent.call_count == 7
+    assert [issue.confidence for issue in result.issues] == [1, 2, 3]
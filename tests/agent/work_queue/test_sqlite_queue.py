@@ -0,0 +1,125 @@
+"""Tests for the SQLite job queue."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from src.agent.work_queue import JobStatus, ReviewJob, SqliteJobQueue
+
+
+@pytest.fixture
+def db_path() -> Generator[str, None, None]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield str(Path(tmpdir) / "queue.sqlite")
+
+
+def test_enqueue_is_idempotent(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path)
+    job = ReviewJob(repo_path="/repo")
+
+    assert queue.enqueue(job, job_id="repo@abc") == "repo@abc"
+    assert queue.enqueue(job, job_id="repo@abc") == "repo@abc"
+
+    assert len(queue.list_jobs()) == 1
+
+
+def test_queue_uses_rollback_journal(db_path: str) -> None:
+    # A queue file created in WAL mode is switched back as well
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+
+    SqliteJobQueue(db_path)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    conn.close()
+
+
+def test_claim_leases_job_to_single_worker(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path)
+    queue.enqueue(ReviewJob(repo_path="/repo"), job_id="job1")
+
+    record = queue.claim("worker-a")
+    assert record is not None
+    assert record.status == JobStatus.RUNNING
+    assert record.attempts == 1
+    assert record.worker_id == "worker-a"
+
+    # Lease is still valid, nothing else to claim
+    assert queue.claim("worker-b") is None
+
+
+def test_complete_stores_result(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path)
+    queue.enqueue(ReviewJob(repo_path="/repo"), job_id="job1")
+    record = queue.claim("worker-a")
+    assert record is not None and record.lease_token
+
+    assert queue.heartbeat("job1", record.lease_token)
+    assert queue.complete("job1", record.lease_token, '{"issues": []}')
+
+    stored = queue.get("job1")
+    assert stored is not None
+    assert stored.status == JobStatus.DONE
+    assert stored.result == '{"issues": []}'
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_fenced(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path, lease_seconds=-1)
+    queue.enqueue(ReviewJob(repo_path="/repo"), job_id="job1")
+
+    first = queue.claim("worker-a")
+    assert first is not None and first.lease_token
+
+    # Lease already expired: another worker takes over
+    second = queue.claim("worker-b")
+    assert second is not None and second.lease_token
+    assert second.attempts == 2
+    assert second.lease_token != first.lease_token
+
+    # The crashed worker can no longer touch the job
+    assert not queue.heartbeat("job1", first.lease_token)
+    assert not queue.complete("job1", first.lease_token, "stale")
+
+    assert queue.complete("job1", second.lease_token, "fresh")
+    stored = queue.get("job1")
+    assert stored is not None
+    assert stored.result == "fresh"
+
+
+def test_fail_retries_until_max_attempts(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path, max_attempts=2)
+    queue.enqueue(ReviewJob(repo_path="/repo"), job_id="job1")
+
+    record = queue.claim("worker-a")
+    assert record is not None and record.lease_token
+    assert queue.fail("job1", record.lease_token, "boom")
+    stored = queue.get("job1")
+    assert stored is not None
+    assert stored.status == JobStatus.PENDING
+
+    record = queue.claim("worker-a")
+    assert record is not None and record.lease_token
+    assert queue.fail("job1", record.lease_token, "boom again")
+    stored = queue.get("job1")
+    assert stored is not None
+    assert stored.status == JobStatus.FAILED
+    assert stored.error == "boom again"
+
+    assert queue.claim("worker-a") is None
+
+
+def test_expired_job_fails_after_max_attempts(db_path: str) -> None:
+    queue = SqliteJobQueue(db_path, lease_seconds=-1, max_attempts=1)
+    queue.enqueue(ReviewJob(repo_path="/repo"), job_id="job1")
+
+    assert queue.claim("worker-a") is not None
+    assert queue.claim("worker-b") is None
+
+    stored = queue.get("job1")
+    assert stored is not None
+    assert stored.status == JobStatus.FAILED
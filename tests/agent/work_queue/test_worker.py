@@ -0,0 +1,55 @@
+"""Tests for the review worker loop."""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.agent.schema import PrimaryReviewOutput
+from src.agent.work_queue import JobStatus, ReviewJob, SqliteJobQueue, run_worker
+from tests.test_helper import create_test_repo
+
+
+def test_run_worker_processes_jobs() -> None:
+    """Test that a worker drains the queue and stores review output."""
+    review_result = MagicMock()
+    review_result.output = PrimaryReviewOutput(description="Looks good", issues=[])
+
+    with create_test_repo() as repo_path, tempfile.TemporaryDirectory() as tmpdir:
+        queue = SqliteJobQueue(str(Path(tmpdir) / "queue.sqlite"))
+        queue.enqueue(ReviewJob(repo_path=str(repo_path)), job_id="job1")
+
+        with patch(
+            "src.agent.work_queue.worker.run_review", return_value=review_result
+        ) as mock_run_review:
+            completed = run_worker(queue, worker_id="w1", once=True)
+
+        assert completed == 1
+        assert mock_run_review.call_count == 1
+
+        stored = queue.get("job1")
+        assert stored is not None
+        assert stored.status == JobStatus.DONE
+        assert stored.result is not None
+        assert json.loads(stored.result)["description"] == "Looks good"
+
+
+def test_run_worker_releases_failed_job() -> None:
+    """Test that a failing review puts the job back for another attempt."""
+    with create_test_repo() as repo_path, tempfile.TemporaryDirectory() as tmpdir:
+        queue = SqliteJobQueue(str(Path(tmpdir) / "queue.sqlite"), max_attempts=2)
+        queue.enqueue(ReviewJob(repo_path=str(repo_path)), job_id="job1")
+
+        with patch(
+            "src.agent.work_queue.worker.run_review",
+            side_effect=RuntimeError("provider timeout"),
+        ):
+            completed = run_worker(queue, worker_id="w1", once=True)
+
+        assert completed == 0
+        stored = queue.get("job1")
+        assert stored is not None
+        assert stored.status == JobStatus.FAILED
+        assert stored.attempts == 2
+        assert stored.error is not None
+        assert "provider timeout" in stored.error
@@ -0,0 +1,14 @@
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def disable_fast_path() -> Iterator[None]:
+    """Review the tiny test diffs with the tool loop the tests script.
+
+    Tests of the single-shot fast path patch the threshold back up.
+    """
+    with patch("src.agent.fast_path.FAST_PATH_MAX_DIFF_LINES", 0):
+        yield
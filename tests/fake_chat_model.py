@@ -0,0 +1,80 @@
+import threading
+from typing import Any, Callable, Sequence
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+# A scripted step is either a ready AIMessage, an exception to raise, or a
+# callable that builds the reply from the prompt messages
+ScriptStep = AIMessage | Exception | Callable[[list[BaseMessage]], AIMessage]
+
+
+def tool_call(name: str, args: dict[str, Any], call_id: str) -> AIMessage:
+    """Build an AIMessage that calls a single tool."""
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": name, "args": args, "id": call_id, "type": "tool_call"}],
+    )
+
+
+def structured_response(output: BaseModel, call_id: str = "final") -> AIMessage:
+    """Build an AIMessage returning structured output via the response tool."""
+    return tool_call(type(output).__name__, output.model_dump(mode="json"), call_id)
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Offline chat model that replays a fixed script of replies.
+
+    Tool binding is a no-op; replies carry approximate usage metadata so token
+    accounting code paths are exercised.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    script: list[Any]
+    prompts: list[list[BaseMessage]] = []
+
+    _index: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Any:
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        with self._lock:
+            if self._index >= len(self.script):
+                raise RuntimeError("ScriptedChatModel ran out of scripted replies")
+            step = self.script[self._index]
+            self._index += 1
+            self.prompts.append(list(messages))
+
+        if isinstance(step, Exception):
+            raise step
+        reply = step(messages) if callable(step) else step
+
+        input_tokens = count_tokens_approximately(messages)
+        output_tokens = count_tokens_approximately([reply])
+        message = reply.model_copy(
+            update={
+                "usage_metadata": {
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens,
+                }
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
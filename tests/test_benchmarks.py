@@ -0,0 +1,28 @@
+"""Tests for the offline benchmark harness."""
+
+from pathlib import Path
+
+from benchmarks.run import Scenario, load_results, run_scenario, save_result
+
+
+def test_run_scenario_reports_stages() -> None:
+    result = run_scenario(Scenario("tiny", total_files=20, changed_files=4, issues=2))
+
+    assert result["changed_files"] == 4
+    assert result["issues"] == 2
+    assert result["subprocesses"] > 0
+    assert result["peak_rss_mb"] > 0
+    assert list(result["stages"]) == ["review", "questions", "answers", "score"]
+    assert result["stages"]["review"]["subprocesses"] > 0
+    assert result["prompt_tokens"] == sum(
+        stage["prompt_tokens"] for stage in result["stages"].values()
+    )
+
+
+def test_results_are_appended(tmp_path: Path) -> None:
+    path = tmp_path / "results" / "results.jsonl"
+
+    save_result(path, {"scenario": "small", "wall_seconds": 1.0})
+    save_result(path, {"scenario": "small", "wall_seconds": 2.0})
+
+    assert [r["wall_seconds"] for r in load_results(path)] == [1.0, 2.0]
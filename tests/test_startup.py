@@ -0,0 +1,88 @@
+"""Startup cost guards: the CLI must not load the review stack eagerly."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.test_helper import create_test_repo
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules that take seconds to import and are only needed once a review runs
+HEAVY_MODULES = [
+    "boto3",
+    "langchain",
+    "langchain_anthropic",
+    "langchain_aws",
+    "langchain_ollama",
+    "langchain_openai",
+    "langgraph",
+]
+
+# Generous bound for slow CI machines; a full import is several seconds
+IMPORT_BUDGET_SECONDS = 1.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.main
+elapsed = time.perf_counter() - start
+sys.argv = ["reviewcerberus"] + sys.argv[1:]
+try:
+    src.main.main()
+except SystemExit as e:
+    code = e.code
+else:
+    code = 0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "code": code, "heavy": heavy}}))
+"""
+
+
+def _run_probe(*args: str) -> tuple[dict[str, object], str]:
+    # No provider credentials: the no-change path must not need them
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if not k.startswith(("AWS_", "ANTHROPIC_", "MOONSHOT_"))
+    }
+    env["MODEL_PROVIDER"] = "bedrock"
+
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES), *args],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    stdout_lines = result.stdout.strip().splitlines()
+    return json.loads(stdout_lines[-1]), "\n".join(stdout_lines[:-1])
+
+
+def test_no_changes_exits_without_loading_review_stack() -> None:
+    with create_test_repo() as repo_path:
+        probe, output = _run_probe(
+            "--repo-path",
+            str(repo_path),
+            "--target-branch",
+            "feature",
+            "--output",
+            str(repo_path / "review.md"),
+        )
+
+    assert probe["code"] == 0
+    assert "No changes detected" in output
+    assert probe["heavy"] == []
+
+
+def test_main_import_within_budget() -> None:
+    with create_test_repo() as repo_path:
+        probe, _ = _run_probe(
+            "--repo-path", str(repo_path), "--target-branch", "feature"
+        )
+
+    assert isinstance(probe["elapsed"], float)
+    assert probe["elapsed"] < IMPORT_BUDGET_SECONDS